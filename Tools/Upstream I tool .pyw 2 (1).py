@@ -5,7 +5,7 @@ import matplotlib
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton,
     QTabWidget, QMessageBox, QApplication, QStyle, QProgressBar, QTextEdit, QHBoxLayout,
-    QDialog, QCalendarWidget, QDialogButtonBox,
+    QDialog, QCalendarWidget, QDialogButtonBox, QFileDialog,
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QObject, QDate
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -15,6 +15,8 @@ from matplotlib.figure import Figure
 import pandas as pd
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from tkinter import Tk, Label, Button
 from tkcalendar import Calendar
@@ -22,7 +24,21 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    print("Warning: 'selectolax' library not found. Listing pages will be parsed with the slower BeautifulSoup parser.")
+    print("Install it using: pip install selectolax")
+    LexborHTMLParser = None
+try:
+    import lxml
+except ImportError:
+    print("Warning: 'lxml' library not found. Article pages will be parsed with the slower built-in html.parser.")
+    print("Install it using: pip install lxml")
+    lxml = None
 try:
     from dateutil.parser import parse as dateutil_parse
 except ImportError:
@@ -35,16 +51,38 @@ except ImportError:
     print("Warning: 'requests' library not found. Online year verification is disabled.")
     print("Install it using: pip install requests")
     requests = None
+try:
+    import ntplib
+except ImportError:
+    print("Warning: 'ntplib' library not found. The system clock check will use the slower HTTP time service.")
+    print("Install it using: pip install ntplib")
+    ntplib = None
+try:
+    import xlsxwriter
+except ImportError:
+    print("Warning: 'xlsxwriter' library not found. Excel output will use the slower default writer.")
+    print("Install it using: pip install xlsxwriter")
+    xlsxwriter = None
 import re
+try:
+    import re2 as fast_re
+except ImportError:
+    print("Warning: 'google-re2' library not found. Alternation-heavy unit patterns will use the slower built-in re engine.")
+    print("Install it using: pip install google-re2")
+    fast_re = re
+import gc
+import hashlib
+import pickle
+import importlib
 import spacy
 import numpy as np
 from collections import Counter
+from functools import lru_cache
 from string import punctuation
 import heapq
-from sklearn.metrics.pairwise import cosine_similarity
-from spacy.matcher import Matcher
-import tkinter as tk
-from tkinter import filedialog
+from bisect import bisect_left, bisect_right
+from spacy.matcher import Matcher, PhraseMatcher
+from spacy.tokens import Doc
 from tqdm import tqdm
 import spacy.cli
 
@@ -162,6 +200,267 @@ QCalendarWidget QTableView {
 }
 """
 
+# --- NEWS SCRAPER ARTICLE PAGE PARSING ---
+ARTICLE_HTML_PARSER = "lxml" if lxml else "html.parser"
+# Only the date span, the content containers and the topic holder are read from an article page, so nothing else is built into the tree.
+ARTICLE_PAGE_STRAINER = SoupStrainer(["span", "div", "article", "section"], attrs={"class": re.compile(r"dn-date-time|article-body|content|body|main|post|story|topic-holder", re.IGNORECASE)})
+ARTICLE_URL_REGEX = re.compile(r'/2-1-\d+$')
+RELATIVE_TIME_REGEX = re.compile(r'(\d+)\s+(minute|hour|day|week|month)s?\s+ago', re.IGNORECASE)
+NON_CONTENT_PARAGRAPH_REGEX = re.compile(r"^(advertisement|sponsored|related articles|read more|also read|subscribe now|follow us|share this article|photo:|image:|caption:)", re.IGNORECASE)
+CONTENT_CONTAINER_SELECTORS = tuple(sv.compile(selector) for selector in [ "div.article-body__content", "article[class*='article-body']", "div[class*='article-body']", "div[class*='story-content']", "div[class*='post-content']", "div[class*='main-content']", "div[class*='content-area']", "article[class*='content']", "section[class*='content']", "div[class*='content']" ])
+CONTENT_CONTAINER_UNION_SELECTOR = sv.compile(", ".join(selector.pattern for selector in CONTENT_CONTAINER_SELECTORS))
+CONTENT_CONTAINER_CLASS_REGEX = re.compile(r"article-body|content|body|main|post|story", re.IGNORECASE)
+ARTICLE_LINK_SELECTOR = sv.compile("a.card-link")
+ARTICLE_CATEGORY_SELECTOR = sv.compile("div.topic-holder a.dn-link.pill.tag")
+ARTICLE_READY_SELECTOR = "div.article-body__content"
+SITE_DATE_REGEX = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})(?:,\s*(\d{1,2}):(\d{2}))?')
+MONTH_NUMBERS = {name: number for number, names in enumerate([("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"), ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"), ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december")], 1) for name in names}
+
+def parse_site_date(date_text):
+    match = SITE_DATE_REGEX.fullmatch(date_text)
+    month = match and MONTH_NUMBERS.get(match.group(2).lower())
+    if not month:
+        return None
+    try:
+        return datetime(int(match.group(3)), month, int(match.group(1)), int(match.group(4) or 0), int(match.group(5) or 0))
+    except ValueError:
+        return None
+
+# --- AI ANALYZER KEYWORD LISTS AND REGEX PATTERNS (built once at import, shared by every analysis run) ---
+BUILD_PROCESS_OPTIONS = [ "Concept Engineering", "Concept", "Pre-FEED", "Pre Front End Engineering Design", "FEED", "Front End Engineering Design", "Detailed Engineering", "Detailed Design", "Engineering & Construction", "EPC", "Procurement & Construction", "P+C", "E+C", "Site Preparation", "Trenching", "Project Management", "Transport", "Transportation", "Installation", "Hook up and commissioning", "Commissioning", "Hook-up", "Lease", "Operation & Maintenance", "O&M", "Asset Integrity", "IRM", "Inspection, Repair & Maintenance", "Duty Holder", "Decommissioning", "Decommissioning (Onshore Disposal)", "Onshore Disposal", "Decommissioning (Offshore Removal)", "Offshore Removal", "Decommissioning (Engineering)", "Decommissioning Engineering", "General Information", "General Contract" ]
+BUILD_PARTS = { "Tree", "Christmas Tree", "Wellhead", "Manifold", "Subsea Manifold", "Subsea Unit", "Control Module", "Subsea Control Module", "Subsea Arch", "Boosting", "Subsea Boosting", "Compression", "Subsea Compression", "Injection", "Subsea Injection", "Separation", "Subsea Separation", "Controls", "Subsea Controls", "Pipelines", "Subsea Pipelines", "Flowlines", "Subsea Flowlines", "Templates", "Subsea Templates", "Subsea", "Subsea Systems", "SURF", "Subsea Umbilicals, Risers and Flowlines", "SURF Package", "Umbilical", "Umbilical Lines", "Riser", "Flowline", "Flexibles", "Flexible Risers", "Flexible Flowlines", "SURF", "SURF Package", "Topside", "Topsides", "Topsides Deck", "Topsides Units", "Accommodation", "Topsides Accommodation", "Compression", "Topsides Compression", "Drilling", "Topsides Drilling", "Power", "Topsides Power", "Process", "Topsides Process", "Carbon Capture", "Topsides Carbon Capture", "Rig", "Drilling Rig", "Living Quarters", "Helideck", "FPSO", "FSRU", "FLNG", "MOPU", "FSO", "Floater", "TLP", "Spar", "Jacket", "Hull", "Caisson", "Compliant Tower", "GBS", "Gravity Base Structure", "Mooring", "Mooring System", "Subsea Mooring Connectors", "Connectors", "Piles", "Anchors", "Anchor", "Turret", "SPM", "Single Point Mooring", "Integration", "Project", "Subsea", "SURF Contract", "Topsides Contract", "WHd Contract" }
+ALL_BUILD_KEYWORDS = sorted(list(set(BUILD_PROCESS_OPTIONS + list(BUILD_PARTS))))
+TARGET_BUILD_PARTS = [ "pipeline", "pipelines", "subsea pipeline", "subsea pipelines", "umbilical", "umbilicals", "umbilical line", "umbilical lines", "flowline", "flowlines", "subsea flowline", "subsea flowlines", "riser", "risers", "cable", "cables", "communication cable", "power cable", "export cable" ]
+LENGTH_UNITS = ["km", "kilometer", "kilometers", "m", "meter", "meters", "mile", "miles", "foot", "feet", "ft"]
+LENGTH_UNITS_SHORT_EXACT = ["km", "m", "ft"]
+SORTED_TARGET_BUILD_PARTS = sorted(TARGET_BUILD_PARTS, key=len, reverse=True)
+def number_unit_regex(number_pattern, units, short_units):
+    long_units = "|".join(unit for unit in units if unit not in short_units)
+    return re.compile(number_pattern + r"(?:\s*-\s*(?=(?:" + long_units + r")\b)|\s*)(" + "|".join(units) + r")\b", re.IGNORECASE)
+NUM_UNIT_REGEX = number_unit_regex(r"(\d+(?:\.\d+)?)", LENGTH_UNITS, LENGTH_UNITS_SHORT_EXACT)
+WEIGHT_TARGET_PARTS = [ "topside", "topsides", "jacket", "hull", "module", "modules", "manifold", "tree", "christmas tree", "wellhead", "template", "pile", "piles", "anchor", "anchors", "turret", "gbs", "gravity base structure", "platform", "fpso", "fsru", "flng", "mopu", "fso", "floater", "tlp", "spar" ]
+WEIGHT_UNITS = ['t', 'ton', 'tons', 'tonne', 'tonnes', 'te', 'kg', 'kilogram', 'kilograms', 'lb', 'lbs', 'pound', 'pounds']
+WEIGHT_UNITS_SHORT_EXACT = ['t', 'kg', 'lb', 'lbs']
+SORTED_WEIGHT_TARGET_PARTS = sorted(WEIGHT_TARGET_PARTS, key=len, reverse=True)
+NUM_WEIGHT_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS) + r")\b", re.IGNORECASE)
+DIAMETER_TARGET_PARTS = [ "pipeline", "pipelines", "subsea pipeline", "subsea pipelines", "umbilical", "umbilicals", "umbilical line", "umbilical lines", "flowline", "flowlines", "subsea flowline", "subsea flowlines", "riser", "risers", "pile", "piles", "caisson" ]
+DIAMETER_UNITS = ['inch', 'inches', 'in', '"', 'mm', 'millimeter', 'millimeters', 'cm', 'centimeter', 'centimeters', 'm', 'meter', 'meters', 'foot', 'feet', 'ft']
+DIAMETER_UNITS_SHORT_EXACT = ['in', '"', 'mm', 'cm', 'm', 'ft']
+SORTED_DIAMETER_TARGET_PARTS = sorted(DIAMETER_TARGET_PARTS, key=len, reverse=True)
+NUM_DIAMETER_UNIT_REGEX = number_unit_regex(r"([\d,]+(?:\.\d+)?)", DIAMETER_UNITS, DIAMETER_UNITS_SHORT_EXACT)
+DIMENSION_TARGET_PARTS = [ "topside", "topsides", "hull", "module", "modules", "platform", "fpso", "jacket", "vessel" ]
+DIMENSION_UNITS = ['m', 'meter', 'meters', 'foot', 'feet', 'ft']
+SORTED_DIMENSION_TARGET_PARTS = sorted(DIMENSION_TARGET_PARTS, key=len, reverse=True)
+ACCOMMODATION_TARGET_PARTS = [ "fpso", "platform", "living quarters", "accommodation module", "flotel", "vessel" ]
+ACCOMMODATION_UNITS = ['person', 'people', 'personnel', 'pob', 'berths', 'beds']
+SORTED_ACCOMMODATION_TARGET_PARTS = sorted(ACCOMMODATION_TARGET_PARTS, key=len, reverse=True)
+STORAGE_TARGET_PARTS = [ "fpso", "fso", "flng", "hull", "tank", "tanks", "vessel" ]
+STORAGE_UNITS = ['barrels', 'bbl', 'bbls', 'cubic meters', 'm3', 'tonnes', 't']
+SORTED_STORAGE_TARGET_PARTS = sorted(STORAGE_TARGET_PARTS, key=len, reverse=True)
+POWER_TARGET_PARTS = [ "power module", "generator", "platform", "fpso", "facility" ]
+POWER_UNITS = ['megawatt', 'mw', 'kilowatt', 'kw', 'gigawatt', 'gw']
+SORTED_POWER_TARGET_PARTS = sorted(POWER_TARGET_PARTS, key=len, reverse=True)
+MOORING_TARGET_PARTS = [ "fpso", "flng", "fsru", "fso", "spar", "tlp", "vessel", "buoy", "platform", "floater" ]
+MOORING_TYPES = [ "turret", "spread", "catenary", "taut-leg", "single-point", "disconnectable", "internal", "external" ]
+SORTED_MOORING_TARGET_PARTS = sorted(MOORING_TARGET_PARTS, key=len, reverse=True)
+VESSEL_TYPES = [ "vessel", "ship", "drillship", "semi-submersible", "rig", "jack-up", "platform supply vessel", "psv", "anchor handling tug supply", "ahts", "aht", "construction vessel", "subsea construction vessel", "scv", "pipelay vessel", "heavy-lift vessel", "flotel", "accommodation vessel", "support vessel", "tug", "barge", "tanker", "carrier", "seismic vessel" ]
+SORTED_VESSEL_TYPES = sorted(VESSEL_TYPES, key=len, reverse=True)
+SORTED_VESSEL_TYPE_TITLES = [(v_type, v_type.title()) for v_type in SORTED_VESSEL_TYPES]
+SORTED_VESSEL_TYPE_SUFFIXES = [f" {v_type}" for v_type in SORTED_VESSEL_TYPES]
+VESSEL_SCOPE_KEYWORDS = [ "support", "drilling", "installation", "construction", "pipelay", "decommissioning", "accommodation", "transport", "maintenance", "survey", "seismic", "towing", "anchor handling", "rov", "inspection", "repair", "irm" ]
+VESSEL_CHARTER_VERBS = [ "charter", "contract", "hire", "award", "secure", "fix", "book", "mobilise", "deploy", "take on" ]
+VESSEL_CHARTER_VERB_REGEX = re.compile("|".join(re.escape(verb) for verb in VESSEL_CHARTER_VERBS))
+VESSEL_FIELDS = ("Type", "Owner", "Charterer", "Day Rate", "Duration", "Scope")
+VESSEL_TRIGGER_REGEX = re.compile("|".join(re.escape(v_type) for v_type in VESSEL_TYPES), re.IGNORECASE)
+DEPTH_RATING_TARGET_PARTS = [ "wellhead", "wellheads", "christmas tree", "trees", "manifold", "manifolds", "bop", "blowout preventer", "valve", "valves", "riser", "risers", "pipeline", "pipelines", "pump", "pumps", "compressor", "compressors", "umbilical", "umbilicals", "flowline", "flowlines", "connector", "connectors", "sps", "subsea production system", "subsea system", "subsea equipment" ]
+DEPTH_RATING_UNITS = ['meter', 'meters', 'm', 'feet', 'ft']
+SORTED_DEPTH_RATING_TARGET_PARTS = sorted(DEPTH_RATING_TARGET_PARTS, key=len, reverse=True)
+NUM_DEPTH_RATING_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DEPTH_RATING_UNITS) + r")\b", re.IGNORECASE)
+PRESSURE_TARGET_PARTS = [ "wellhead", "wellheads", "christmas tree", "trees", "manifold", "manifolds", "bop", "blowout preventer", "valve", "valves", "riser", "risers", "pipeline", "pipelines", "choke" ]
+PRESSURE_UNITS = ['psi', 'bar', 'pascal', 'pa', 'kpa', 'mpa']
+SORTED_PRESSURE_TARGET_PARTS = sorted(PRESSURE_TARGET_PARTS, key=len, reverse=True)
+NUM_PRESSURE_UNIT_REGEX = re.compile(r"([\d,]+(?:k|K)?)\s*(" + "|".join(PRESSURE_UNITS) + r")\b", re.IGNORECASE)
+FLOW_CAPACITY_TARGET_PARTS = [ "pipeline", "pipelines", "flowline", "flowlines", "pump", "pumps", "compressor", "compressors", "riser", "risers", "processing plant", "facility", "terminal", "separator", "separators" ]
+FLOW_CAPACITY_UNITS = [ 'bpd', 'bbl/d', 'boepd', 'm3/d', 'scfd', 'mcfd', 'mmscfd', 'bcfd', 'tph', 'kg/s', 'gj/d', 'tcf/d', 'mcm/d', 'barrels per day', 'cubic meters per day', 'tonnes per hour' ]
+SORTED_FLOW_CAPACITY_TARGET_PARTS = sorted(FLOW_CAPACITY_TARGET_PARTS, key=len, reverse=True)
+NUM_FLOW_CAPACITY_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(FLOW_CAPACITY_UNITS) + r")\b", re.IGNORECASE)
+TEMP_TARGET_PARTS = [ "pipeline", "pipelines", "vessel", "vessels", "reactor", "reactors", "storage tank", "tanks", "heater", "heaters", "cooler", "coolers", "exchanger", "exchangers" ]
+TEMP_UNITS = ['celsius', 'fahrenheit', 'kelvin', 'c', 'f', 'k', 'degrees', '°c', '°f']
+SORTED_TEMP_TARGET_PARTS = sorted(TEMP_TARGET_PARTS, key=len, reverse=True)
+NUM_TEMP_UNIT_REGEX = fast_re.compile(r"(?i)(-?\d+(?:\.\d+)?)\s*(?:degrees)?\s*(" + "|".join(TEMP_UNITS) + r")\b")
+QUANTITY_TARGET_PARTS = list(BUILD_PARTS)
+NON_COUNTABLE_KEYWORDS = [ "integration", "project", "subsea", "surf contract", "topsides contract", "whd contract", "boosting", "compression", "injection", "separation", "controls", "engineering", "management", "transport", "installation", "maintenance", "decommissioning", "procurement" ]
+SORTED_QUANTITY_TARGET_PARTS = sorted({p.lower() for p in QUANTITY_TARGET_PARTS if p.lower() not in NON_COUNTABLE_KEYWORDS}, key=lambda p: (-len(p), p))
+MULTI_WORD_TARGET_PARTS = sorted({part for parts in (TARGET_BUILD_PARTS, WEIGHT_TARGET_PARTS, DIAMETER_TARGET_PARTS, DIMENSION_TARGET_PARTS, ACCOMMODATION_TARGET_PARTS, STORAGE_TARGET_PARTS, POWER_TARGET_PARTS, DEPTH_RATING_TARGET_PARTS, PRESSURE_TARGET_PARTS, FLOW_CAPACITY_TARGET_PARTS, TEMP_TARGET_PARTS, SORTED_QUANTITY_TARGET_PARTS) for part in parts if ' ' in part})
+MULTI_WORD_UNIT_PHRASES = sorted({unit for units in (LENGTH_UNITS, WEIGHT_UNITS, DIAMETER_UNITS, DIMENSION_UNITS, ACCOMMODATION_UNITS, STORAGE_UNITS, POWER_UNITS, DEPTH_RATING_UNITS, PRESSURE_UNITS, FLOW_CAPACITY_UNITS, TEMP_UNITS) for unit in units if ' ' in unit} | {"water depth", "a size"})
+
+def with_multi_word_phrases(items):
+    item_words = set(items)
+    return items + [phrase for phrase in MULTI_WORD_TARGET_PARTS if phrase not in item_words and item_words.intersection(re.findall(r"[\w-]+", phrase))]
+
+TARGET_BUILD_PARTS, WEIGHT_TARGET_PARTS, DIAMETER_TARGET_PARTS, DIMENSION_TARGET_PARTS = map(with_multi_word_phrases, (TARGET_BUILD_PARTS, WEIGHT_TARGET_PARTS, DIAMETER_TARGET_PARTS, DIMENSION_TARGET_PARTS))
+ACCOMMODATION_TARGET_PARTS, STORAGE_TARGET_PARTS, POWER_TARGET_PARTS, DEPTH_RATING_TARGET_PARTS = map(with_multi_word_phrases, (ACCOMMODATION_TARGET_PARTS, STORAGE_TARGET_PARTS, POWER_TARGET_PARTS, DEPTH_RATING_TARGET_PARTS))
+PRESSURE_TARGET_PARTS, FLOW_CAPACITY_TARGET_PARTS, TEMP_TARGET_PARTS = map(with_multi_word_phrases, (PRESSURE_TARGET_PARTS, FLOW_CAPACITY_TARGET_PARTS, TEMP_TARGET_PARTS))
+SORTED_QUANTITY_TARGET_PARTS = sorted(with_multi_word_phrases(SORTED_QUANTITY_TARGET_PARTS), key=lambda p: (-len(p), p))
+SPEC_PRESCREEN_REGEX = re.compile("|".join(re.escape(keyword) for keyword in sorted({part.lower() for parts in (TARGET_BUILD_PARTS, WEIGHT_TARGET_PARTS, DIAMETER_TARGET_PARTS, DIMENSION_TARGET_PARTS, ACCOMMODATION_TARGET_PARTS, STORAGE_TARGET_PARTS, POWER_TARGET_PARTS, DEPTH_RATING_TARGET_PARTS, PRESSURE_TARGET_PARTS, FLOW_CAPACITY_TARGET_PARTS, TEMP_TARGET_PARTS, SORTED_QUANTITY_TARGET_PARTS) for part in parts} | {"accommodat", "capacity", "stor"}, key=len, reverse=True)))
+
+def canonical_part_names(parts):
+    ranked_parts = {}
+    for rank, part in enumerate(parts):
+        ranked_parts.setdefault(part.lower(), (rank, part.title() if ' ' in part else part.capitalize()))
+    return re.compile("(?=(" + "|".join(re.escape(part) for part in ranked_parts) + "))"), ranked_parts
+
+def find_canonical_part(part_names, text_lower):
+    part_regex, ranked_parts = part_names
+    found = [ranked_parts[match.group(1)] for match in part_regex.finditer(text_lower)]
+    return min(found)[1] if found else None
+
+SORTED_TARGET_BUILD_PART_NAMES, SORTED_WEIGHT_TARGET_PART_NAMES, SORTED_DIAMETER_TARGET_PART_NAMES, SORTED_DEPTH_RATING_TARGET_PART_NAMES = map(canonical_part_names, (SORTED_TARGET_BUILD_PARTS, SORTED_WEIGHT_TARGET_PARTS, SORTED_DIAMETER_TARGET_PARTS, SORTED_DEPTH_RATING_TARGET_PARTS))
+SORTED_PRESSURE_TARGET_PART_NAMES, SORTED_QUANTITY_TARGET_PART_NAMES, SORTED_FLOW_CAPACITY_TARGET_PART_NAMES, SORTED_TEMP_TARGET_PART_NAMES = map(canonical_part_names, (SORTED_PRESSURE_TARGET_PARTS, SORTED_QUANTITY_TARGET_PARTS, SORTED_FLOW_CAPACITY_TARGET_PARTS, SORTED_TEMP_TARGET_PARTS))
+LENGTH_UNIT_SET, WEIGHT_UNIT_SET, DIAMETER_UNIT_SET, DEPTH_RATING_UNIT_SET = map(frozenset, (LENGTH_UNITS, WEIGHT_UNITS, DIAMETER_UNITS, DEPTH_RATING_UNITS))
+
+def last_num_unit(span, unit_set):
+    num_text, unit_text = None, None
+    for token in reversed(span):
+        if num_text is None and token.like_num: num_text = token.text
+        if unit_text is None and token.lower_ in unit_set: unit_text = token.lower_
+        if num_text and unit_text: break
+    return num_text, unit_text
+
+LENGTH_UNIT_NORMALIZATION = {"kilometer": "km", "kilometers": "km", "meter": "m", "meters": "m", "metres": "m", "mile": "miles", "miles": "miles", "foot": "ft", "feet": "ft"}
+WEIGHT_UNIT_NORMALIZATION = {"tonne": "t", "tonnes": "t", "ton": "t", "te": "t", "kilogram": "kg", "kilograms": "kg", "pound": "lbs", "pounds": "lbs"}
+DIAMETER_UNIT_NORMALIZATION = {"inch": "in", "inches": "in", '"': "in", "millimeter": "mm", "millimeters": "mm", "centimeter": "cm", "centimeters": "cm", "foot": "ft", "feet": "ft"}
+DIAMETER_RANGE_UNIT_NORMALIZATION = {**DIAMETER_UNIT_NORMALIZATION, "meter": "m", "meters": "m"}
+DEPTH_RATING_UNIT_NORMALIZATION = {"meter": "m", "meters": "m", "feet": "ft"}
+TEMP_UNIT_NORMALIZATION = {"c": "Celsius", "f": "Fahrenheit"}
+DIAMETER_RANGE_REGEX = fast_re.compile(r"(?i)(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")")
+COMPANY_DESIGNATORS = ['co\\.', 'inc\\.', 'ltd\\.', 'gmbh', 'llc', 'corp\\.', 'plc', 'group', 'solutions', 'energy', 'oil & gas', 'international', 'holdings', 'corporation', 'industries', 'ventures', 'resources', 'services', 'systems']
+COMPANY_DESIGNATOR_REGEX = re.compile(r'\b(?:' + '|'.join(COMPANY_DESIGNATORS) + r')\b')
+
+@lru_cache(maxsize=None)
+def designator_context_regex(company_name):
+    name = re.escape(company_name)
+    designators = '|'.join(COMPANY_DESIGNATORS)
+    return re.compile(r'\b' + name + r'\s+(?:' + designators + r')\b|\b(?:' + designators + r')\s+' + name + r'\b', re.IGNORECASE)
+
+KNOWN_COMPANIES = ["Saudi Aramco", "Petronas", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor", "Chevron", "ConocoPhillips", "ENI", "Sinopec", "CNPC", "Gazprom", "Baker Hughes", "Schlumberger", "Halliburton", "TechnipFMC", "Subsea 7", "Saipem", "McDermott", "Wood", "Worley"]
+KNOWN_COMPANY_SET = frozenset(KNOWN_COMPANIES)
+KNOWN_COMPANIES_LOWER = [(kc.lower(), kc) for kc in KNOWN_COMPANIES]
+BUDGET_MONEY_REGEX = re.compile(r'\b(?:USD|EUR|GBP|A?\$|€|£)\s?\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)?\b|\b\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)\s*(?:USD|EUR|GBP|A?\$|€|£)?\b', re.IGNORECASE)
+QUOTE_REGEX = re.compile(r'"(.*?)"', re.DOTALL)
+WHITESPACE_REGEX = re.compile(r'\s+')
+VESSEL_DAY_RATE_REGEX = re.compile(r"((?:[\$€£]|usd)\s?[\d,]+(?:\.\d+)?(?:k| thousand)?)\s*(?:per day|a day|dayrate)")
+VESSEL_DURATION_REGEX = re.compile(r"(?:for|of)\s+((?:a firm period of\s+)?(?:up to\s+)?(?:\d+|[\w\s]+)\s(?:year|month|week|day)s?)")
+VESSEL_SCOPE_REGEX = re.compile(r"(?:to|for|perform|carry out)\s+((?:[\w\s-]+\s)?(?:{})(?:[\w\s-]+)?)".format("|".join(VESSEL_SCOPE_KEYWORDS)))
+DELAY_KEYWORD_REGEX = re.compile(r'delay|postpone|push back|reschedule|deadline|extension|setback|deferment')
+PROFILE_SENTENCE_REGEX = re.compile(r"(?P<money>[\$€£])|(?P<depth>in (?P<depth_value>[\d,]+(?:\.\d+)?)\s*(?P<depth_unit>meters?|m|feet|ft)\s+of water)|(?P<distance>(?P<distance_value>[\d,]+(?:\.\d+)?)\s*(?P<distance_unit>km|kilometers?|miles?)\s*(?:offshore|from the coast))|(?P<capacity>[\d,.]+(?:\.\d+)?\s*(?:million|billion|thousand|mn|bn|k)?\s*(?:bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|tonnes/year|t/y|t/d|barrels|tonnes|cubic\s+feet|cubic\s+meters))", re.IGNORECASE)
+PROFILE_FIELDS = ("Capacity", "Timeline", "Depth", "Distance")
+PROFILE_TRIGGER_REGEX = re.compile("field|project|development|block|area|licence|basin|phase|package|discovery|epci", re.IGNORECASE)
+PROFILE_TIMELINE_KEYWORDS = { "Startup": ["first oil", "first gas", "start-up", "online", "operational by", "come onstream", "begin production"], "Shutdown": ["shut down", "cease production", "decommissioning in", "abandonment in", "plug and abandon"] }
+ENTITY_KEYWORDS_FOR_CAPACITY = { "Well": ["well", "wells", "wellbore"], "Field": ["field", "oilfield", "gas field", "fields", "development", "reservoir"], "Cluster": ["cluster", "hub", "tie-back"], "Block": ["block", "blocks", "licence block", "license"], "Basin": ["basin", "basins"], "Floater": ["fpso", "flng", "fsru", "mopu", "fso", "floater", "floating production storage and offloading", "vessel"], "Plant": ["plant", "facility", "terminal", "refinery", "processing plant", "gas plant", "petrochemical plant", "onshore facility", "station"], "Platform": ["platform", "topsides", "jacket", "rig", "drilling rig", "spar", "tlp", "semisubmersible", "fixed platform"], "Pipeline": ["pipeline", "pipelines", "flowline", "flowlines", "umbilical", "riser", "export line"], "Subsea": ["subsea production system", "sps", "manifold", "subsea pump", "template", "subsea facility"], "Project": ["project", "package", "phase", "development project", "expansion"] }
+CAPACITY_ENTITY_KEYWORD_REGEX = re.compile("|".join(re.escape(kw) for keywords in ENTITY_KEYWORDS_FOR_CAPACITY.values() for kw in keywords))
+CAPACITY_ENTITY_TYPE_REGEXES = [(entity_type, re.compile("|".join(re.escape(kw) for kw in keywords))) for entity_type, keywords in ENTITY_KEYWORDS_FOR_CAPACITY.items()]
+
+def keyword_scanner(keywords):
+    return tuple(dict.fromkeys(keywords))
+
+def find_keywords(scanner, text_lower):
+    return {kw for kw in scanner if kw in text_lower}
+
+def scan_profile_sentence(sent_text):
+    first_matches = {}
+    for match in PROFILE_SENTENCE_REGEX.finditer(sent_text):
+        first_matches.setdefault(match.lastgroup, match)
+    depth = distance = capacity = None
+    if (depth_match := first_matches.get("depth")):
+        unit = 'm' if 'm' in depth_match["depth_unit"].lower() else 'ft'
+        depth = f"{depth_match['depth_value'].replace(',', '')}{unit}"
+    if (dist_match := first_matches.get("distance")):
+        unit = 'km' if 'k' in dist_match["distance_unit"].lower() else 'miles'
+        distance = f"{dist_match['distance_value'].replace(',', '')}{unit} offshore"
+    if "money" not in first_matches and (cap_match := first_matches.get("capacity")):
+        capacity = ' '.join(cap_match["capacity"].split())
+    return depth, distance, capacity
+
+OFFSHORE_KEYWORD_SCORES = { 'offshore': 3, 'subsea': 3, 'fpso': 4, 'flng': 4, 'fsru': 4, 'floating': 2, 'deepwater': 2, 'mooring': 2, 'riser': 2, 'jack-up': 3, 'drillship': 3, 'spar': 3, 'tlp': 3, 'platform': 2, 'jacket': 2, 'hull': 1, 'caisson': 1, 'umbilical': 2, 'flowline': 2, 'topside': 2, 'topsides': 2, 'wellhead': 1, 'manifold': 1, 'christmas tree': 1, 'surf': 3, 'gbs': 2, 'sea bed': 2, 'marine': 2, 'vessel': 1, 'installation vessel': 3, 'anchor handling tug': 2, 'hook-up': 2, 'commissioning (offshore)': 3, 'offshore removal': 3, 'semisubmersible': 3, 'drilling rig': 2 }
+ONSHORE_KEYWORD_SCORES = { 'onshore': 3, 'land-based': 3, 'refinery': 4, 'petrochemical': 4, 'gas plant': 3, 'pipeline terminal': 2, 'compressor station': 2, 'gas treatment': 2, 'processing plant': 3, 'storage tank': 1, 'industrial complex': 2, 'onshore disposal': 3, 'midstream': 1, 'downstream': 1, 'lng terminal': 3, 'storage facility': 2, 'gas processing plant': 3 }
+BUILD_KEYWORDS_LOWER = [keyword.lower() for keyword in BUILD_PARTS.union(BUILD_PROCESS_OPTIONS)]
+
+def build_keyword_kind(kw_lower):
+    if "subsea" in kw_lower or "offshore" in kw_lower or kw_lower in ['fpso', 'flng', 'fsru', 'tlp', 'spar', 'jacket', 'hull']:
+        return "offshore"
+    for kind in ("topsides", "pipeline", "offshore removal", "onshore disposal", "installation", "decommissioning"):
+        if kind in kw_lower:
+            return kind
+    return None
+
+BUILD_KEYWORD_KINDS = [(kw_lower, kind) for kw_lower in BUILD_KEYWORDS_LOWER if (kind := build_keyword_kind(kw_lower))]
+BUILD_KIND_WEIGHTS = {"offshore": (1.5, 0), "topsides": (0.5, 0), "offshore removal": (2, 0), "onshore disposal": (0, 2)}
+BUILD_CONTEXT_RULES = [("pipeline", ["subsea pipeline"], "onshore pipeline"), ("installation", ["subsea installation", "offshore installation"], "onshore installation"), ("decommissioning", ["offshore decommissioning"], "onshore decommissioning")]
+OFFSHORE_ONSHORE_SCANNER = keyword_scanner([*OFFSHORE_KEYWORD_SCORES, *ONSHORE_KEYWORD_SCORES, *BUILD_KEYWORDS_LOWER, *(phrase for _, offshore_phrases, onshore_phrase in BUILD_CONTEXT_RULES for phrase in [*offshore_phrases, onshore_phrase])])
+STRONG_OFFSHORE_KEYWORDS = tuple(kw for kw, score in OFFSHORE_KEYWORD_SCORES.items() if score >= 4)
+ONSHORE_SIGNAL_KEYWORDS = tuple(sorted({*ONSHORE_KEYWORD_SCORES, *(kw_lower for kw_lower, kind in BUILD_KEYWORD_KINDS if BUILD_KIND_WEIGHTS.get(kind, (0, 0))[1]), *(onshore_phrase for _, _, onshore_phrase in BUILD_CONTEXT_RULES)}))
+TEXTRANK_STATUS_REGEX = re.compile("|".join(['award', 'complete', 'delay', 'cancel', 'fid', 'tender', 'plan', 'construct', 'decommission', 'sign', 'secure']))
+SCOPE_GROUPS = { 'full-field development (EPCI)': frozenset(['epc', 'epci', 'epcc']), 'SURF package': frozenset(['surf', 'pipelines', 'flowlines', 'riser', 'umbilical']), 'subsea production systems': frozenset(['subsea systems', 'tree', 'manifold', 'wellhead']), 'floating facilities': frozenset(['fpso', 'flng', 'fsru', 'tlp', 'spar']), 'fixed structures': frozenset(['jacket', 'hull', 'topside', 'topsides']), 'decommissioning activities': frozenset(['decommissioning']) }
+CONTRACT_KEYWORDS = [ 'EPC', 'EPCI', 'EPCC', 'FEED', 'LSTK', 'MOU', 'joint venture', 'framework agreement', 'EPMC', 'EPC-E', 'EPC-E/E', 'service agreement', 'subcontract', 'supply agreement', 'alliance agreement', 'lease agreement', 'charter agreement', 'drilling contract', 'construction contract', 'maintenance contract', 'operation and maintenance', 'O&M', 'engineering contract', 'procurement contract', 'turnkey contract', 'build-own-operate-transfer', 'BOOT', 'production sharing agreement', 'PSA', 'rig contract', 'vessel contract', 'consultancy contract' ]
+CONTRACT_KEYWORD_SCANNER = keyword_scanner([kw.lower() for kw in CONTRACT_KEYWORDS])
+SCOPE_KEYWORDS_BY_LOWER = {}
+for kw in ALL_BUILD_KEYWORDS:
+    SCOPE_KEYWORDS_BY_LOWER.setdefault(kw.lower(), []).append((kw, len(kw.split()) > 1))
+SCOPE_KEYWORD_REGEXES = {kw_lower: re.compile(r'\b' + re.escape(kw_lower) + r'\b') for kw_lower in SCOPE_KEYWORDS_BY_LOWER}
+SCOPE_KEYWORD_SCANNER = keyword_scanner(SCOPE_KEYWORDS_BY_LOWER)
+CONTRACT_KEYWORD_REGEXES = {kw.lower(): (kw, re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)) for kw in CONTRACT_KEYWORDS}
+
+# --- AI ANALYZER MODEL (loaded once per process, then reused by every analysis run) ---
+def quantize_transformer(model, model_name):
+    try:
+        import torch
+    except ImportError:
+        print("Info: 'torch' not found, skipping transformer quantization.")
+        return 0
+    if "transformer" not in model.pipe_names:
+        return 0
+    quantized_modules = 0
+    for node in model.get_pipe("transformer").model.walk():
+        for shim in node.shims:
+            torch_module = getattr(shim, "_model", None)
+            if isinstance(torch_module, torch.nn.Module):
+                shim._model = torch.quantization.quantize_dynamic(torch_module, {torch.nn.Linear}, dtype=torch.qint8)
+                quantized_modules += 1
+    if quantized_modules:
+        print(f"Quantized the '{model_name}' transformer to int8 for CPU inference.")
+    return quantized_modules
+
+@lru_cache(maxsize=1)
+def load_analysis_model(model_name, use_gpu, quantize_on_cpu):
+    if not spacy.util.is_package(model_name):
+        print(f"SpaCy model '{model_name}' is not installed. Downloading it once...")
+        spacy.cli.download(model_name)
+        importlib.invalidate_caches()
+        if not spacy.util.is_package(model_name):
+            raise OSError(f"SpaCy model '{model_name}' is still not installed after downloading it.")
+    # Returns the pipeline and the precision it runs at, which parses cached on disk are keyed by
+    nlp = None
+    precision = "fp32"
+    if use_gpu:
+        try:
+            nlp = spacy.load(model_name, config={"components.transformer.model.mixed_precision": True})
+            precision = "mixed"
+        except ValueError as e:
+            print(f"Warning: Mixed precision is not available for '{model_name}', loading in full precision. Error: {e}")
+    if nlp is None:
+        nlp = spacy.load(model_name)
+    print(f"Successfully loaded SpaCy model: {model_name}")
+    if use_gpu:
+        print(f"Running '{model_name}' on the GPU.")
+    elif quantize_on_cpu:
+        try:
+            if quantize_transformer(nlp, model_name):
+                precision = "int8"
+        except Exception as e:
+            print(f"Warning: Could not quantize the transformer, continuing in full precision. Error: {e}")
+    return nlp, precision
+
 class DateRangeDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -237,6 +536,9 @@ class AppWindow(QMainWindow):
         self.ai_btn = ai_tab.findChild(QPushButton)
         self.ai_progress = ai_tab.findChild(QProgressBar)
         self.ai_log = ai_tab.findChild(QTextEdit)
+        self.scrape_driver = None # Chrome session kept open between news-gathering runs
+        self.scrape_driver_lock = threading.Lock() # Held by the news-gathering worker while it uses scrape_driver
+        self.stop_scraping_requested = False
         self.dashboard_tab = self.create_dashboard_tab()
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
         self.tabs.setTabEnabled(2, False)
@@ -384,14 +686,21 @@ class AppWindow(QMainWindow):
 
 
     def start_ai_analyzer_process(self):
-        self._run_task_in_thread(
-            self.perform_ai_analysis,
-            self.ai_btn,
-            self.ai_progress,
-            self.ai_log,
-            self.on_ai_analysis_complete,
-            "Analyzing..."
-        )
+        # Dialogs must run on the GUI thread, so the input file is picked here and handed to the worker.
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Input Excel File", "", "Excel files (*.xlsx *.xls);;All files (*.*)")
+        if file_path:
+            self._run_task_in_thread(
+                self.perform_ai_analysis,
+                self.ai_btn,
+                self.ai_progress,
+                self.ai_log,
+                self.on_ai_analysis_complete,
+                "Analyzing...",
+                file_path=file_path
+            )
+        else:
+            self.ai_log.show()
+            self.ai_log.setText("AI analysis cancelled by user.")
 
     def on_ai_analysis_complete(self):
         self.ai_btn.setEnabled(True)
@@ -401,6 +710,24 @@ class AppWindow(QMainWindow):
         self.tabs.setTabEnabled(2, True)
         self.tabs.setCurrentIndex(2)
 
+    def quit_scrape_driver(self):
+        if self.scrape_driver is not None:
+            try:
+                self.scrape_driver.quit()
+            except Exception:
+                pass
+            self.scrape_driver = None
+
+    def closeEvent(self, event):
+        # Never wait on the GUI thread: if a news-gathering worker holds the driver, it quits it itself once it sees the flag
+        self.stop_scraping_requested = True
+        if self.scrape_driver_lock.acquire(blocking=False):
+            try:
+                self.quit_scrape_driver()
+            finally:
+                self.scrape_driver_lock.release()
+        super().closeEvent(event)
+
     # 🔹 YOUR FULL, UNTOUCHED NEWS GATHERING SCRIPT, INDENTED AS A METHOD 🔹
     def perform_news_gathering(self, worker, start_date, end_date):
         # The 'worker' object is passed to allow emitting signals (progress, output)
@@ -410,8 +737,14 @@ class AppWindow(QMainWindow):
         PROFILE_PATH = r"C:\Users\i60475\AppData\Local\Google\Chrome\User Data\Selenium"
         WAIT_TIMEOUT = 20
         IMPLICIT_WAIT = 5
+        ARTICLE_TABS = 4
+        VERBOSE = False
+        CLOCK_CHECK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".upstream_clock_check")
+        CLOCK_CHECK_MAX_AGE = 24 * 60 * 60
         BASE_URL = "https://www.upstreamonline.com/latest"
         OUTPUT_DIR = "C:/Office work/Upstream SCRAP news"
+        ARTICLE_CACHE_DIR = os.path.join(OUTPUT_DIR, "_article_cache")
+        ARTICLE_CACHE_MAX_AGE = 24 * 60 * 60
         USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.7339.81 Safari/537.36"
         # --- End Configuration ---
 
@@ -446,30 +779,139 @@ class AppWindow(QMainWindow):
             return start_date_tk, end_date_tk
 
         # --- Extract Article Links and Titles ---
-        def get_article_links_and_titles(soup):
+        def get_article_links_and_titles(html):
             articles = []
             seen_hrefs = set()
-            for link in soup.select("a.card-link"):
-                href = link.get("href")
-                title = link.get_text(strip=True)
-                if href and title and href not in seen_hrefs and re.search(r'/2-1-\d+$', href):
+            if LexborHTMLParser:
+                card_links = ((node.attributes.get("href"), node) for node in LexborHTMLParser(html).css("a.card-link"))
+                link_text = lambda node: node.text(strip=True)
+            else:
+                card_links = ((link.get("href"), link) for link in ARTICLE_LINK_SELECTOR.select(BeautifulSoup(html, "html.parser")))
+                link_text = lambda link: link.get_text(strip=True)
+            for href, link in card_links:
+                if not href or href in seen_hrefs:
+                    continue
+                if not ARTICLE_URL_REGEX.search(href):
+                    seen_hrefs.add(href)
+                    if VERBOSE:
+                        print(f"ℹ️ Skipping non-article link: {link_text(link)} ({href})")
+                    continue
+                title = link_text(link)
+                if title:
                     full_link = href if href.startswith("https://") else f"https://www.upstreamonline.com{href}"
                     articles.append((full_link, title))
                     seen_hrefs.add(href)
                     print(f"Found article link: {title}")
-                elif href and title and href not in seen_hrefs:
-                    print(f"ℹ️ Skipping non-article link: {title} ({href})")
-                    seen_hrefs.add(href)
             return articles
 
-        # --- Extract Article Details ---
-        def extract_article_details(driver, link):
-            driver.get(link)
+        # --- Fetch Listing Pages ---
+        def make_listing_session():
+            session = requests.Session()
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+            session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+            return session
 
-            WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(2)
+        def fetch_listing_html(session, page_url):
+            try:
+                response = session.get(page_url, timeout=WAIT_TIMEOUT)
+                response.raise_for_status()
+            except Exception as e:
+                print(f"ℹ️ Plain HTTP fetch of the listing failed, using the browser instead: {e}")
+                return None
+            if "card-link" not in response.text:
+                print("ℹ️ The listing is not served as plain HTML, using the browser instead.")
+                return None
+            return response.text
+
+        # --- Load Article Pages ---
+        def fetch_article_pages(driver, links):
+            main_window = driver.current_window_handle
+            tabs = []
+            for link in links:
+                known_handles = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", link)
+                new_handles = set(driver.window_handles) - known_handles
+                tabs.append((link, new_handles.pop() if new_handles else None))
+            page_sources = []
+            for link, handle in tabs:
+                page_source = None
+                try:
+                    if handle is None:
+                        raise RuntimeError("the article tab did not open")
+                    driver.switch_to.window(handle)
+                    try:
+                        WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR)))
+                    except TimeoutException:
+                        pass
+                    page_source = driver.page_source
+                except Exception as e:
+                    print(f"❌ Error loading article: {link} - {e}")
+                page_sources.append(page_source)
+            for _, handle in tabs:
+                if handle is not None:
+                    try:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                    except Exception:
+                        pass
+            driver.switch_to.window(main_window)
+            return page_sources
+
+        def article_cache_path(link):
+            return os.path.join(ARTICLE_CACHE_DIR, hashlib.sha1(link.encode("utf-8")).hexdigest() + ".pickle")
+
+        def load_cached_article(link):
+            cache_file = article_cache_path(link)
+            try:
+                if time.time() - os.path.getmtime(cache_file) < ARTICLE_CACHE_MAX_AGE:
+                    with open(cache_file, "rb") as f:
+                        return pickle.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Warning: Could not read cached article '{cache_file}': {e}")
+            return None
 
-            article_soup = BeautifulSoup(driver.page_source, "html.parser")
+        def prune_article_cache():
+            expired_before = time.time() - ARTICLE_CACHE_MAX_AGE
+            try:
+                entries = list(os.scandir(ARTICLE_CACHE_DIR))
+            except OSError:
+                return
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < expired_before:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+
+        def store_article_details(link, details):
+            parsed_date, article_content, container_classes, _ = details
+            if not (isinstance(parsed_date, date) and article_content != "No Content Found" and container_classes):
+                return
+            cache_file = article_cache_path(link)
+            try:
+                os.makedirs(ARTICLE_CACHE_DIR, exist_ok=True)
+                with open(cache_file, "wb") as f:
+                    pickle.dump(details, f)
+            except OSError as e:
+                print(f"Warning: Could not write cached article '{cache_file}': {e}")
+
+        def load_articles(driver, articles):
+            for batch_start in range(0, len(articles), ARTICLE_TABS):
+                batch = articles[batch_start:batch_start + ARTICLE_TABS]
+                cached = {link: details for link, _ in batch if (details := load_cached_article(link)) is not None}
+                uncached_links = [link for link, _ in batch if link not in cached]
+                page_sources = iter(fetch_article_pages(driver, uncached_links) if uncached_links else ())
+                for link, title in batch:
+                    if link in cached:
+                        yield link, title, None, cached[link]
+                    else:
+                        yield link, title, next(page_sources), None
+
+        # --- Extract Article Details ---
+        def extract_article_details(page_source, link):
+            article_soup = BeautifulSoup(page_source, ARTICLE_HTML_PARSER, parse_only=ARTICLE_PAGE_STRAINER)
 
             date_element = article_soup.find("span", class_="dn-date-time")
             date_published = "No Date Found"
@@ -483,7 +925,7 @@ class AppWindow(QMainWindow):
                 current_datetime = datetime.now()
                 parsed_dt_obj = None
 
-                relative_time_match = re.search(r'(\d+)\s+(minute|hour|day|week|month)s?\s+ago', date_text, re.IGNORECASE)
+                relative_time_match = RELATIVE_TIME_REGEX.search(date_text)
                 if relative_time_match:
                     value = int(relative_time_match.group(1))
                     unit = relative_time_match.group(2).lower()
@@ -495,6 +937,7 @@ class AppWindow(QMainWindow):
                     elif unit == 'month': parsed_dt_obj = current_datetime - timedelta(days=value * 30)
                 elif "yesterday" in date_text.lower(): parsed_dt_obj = current_datetime - timedelta(days=1)
                 elif "today" in date_text.lower(): parsed_dt_obj = current_datetime
+                elif (site_datetime := parse_site_date(date_text)): parsed_dt_obj = site_datetime
                 elif dateutil_parse:
                     try:
                         datetime_object = dateutil_parse(date_text, fuzzy=False) 
@@ -528,37 +971,35 @@ class AppWindow(QMainWindow):
 
             article_content = "No Content Found"
             main_content_container = None
-            preferred_selectors = [ "div.article-body__content", "article[class*='article-body']", "div[class*='article-body']", "div[class*='story-content']", "div[class*='post-content']", "div[class*='main-content']", "div[class*='content-area']", "article[class*='content']", "section[class*='content']", "div[class*='content']" ]
-            for selector in preferred_selectors:
-                candidate_container = article_soup.select_one(selector)
+            container_candidates = CONTENT_CONTAINER_UNION_SELECTOR.select(article_soup)
+            for selector in CONTENT_CONTAINER_SELECTORS:
+                candidate_container = next((candidate for candidate in container_candidates if selector.match(candidate)), None)
                 if candidate_container:
-                    if len(candidate_container.find_all("p", recursive=False)) > 1:
-                        main_content_container = candidate_container
-                        break
-                    elif len(candidate_container.find_all("p")) > 2:
+                    paragraphs = candidate_container.find_all("p")
+                    direct_paragraphs = sum(1 for p in paragraphs if p.parent is candidate_container)
+                    if direct_paragraphs > 1 or len(paragraphs) > 2:
                         main_content_container = candidate_container
                         break
             if not main_content_container:
-                potential_containers = article_soup.find_all( ["div", "article", "section"], class_=re.compile(r"article-body|content|body|main|post|story", re.IGNORECASE) )
+                potential_containers = article_soup.find_all( ["div", "article", "section"], class_=CONTENT_CONTAINER_CLASS_REGEX )
                 if potential_containers:
-                    main_content_container = max(potential_containers, key=lambda c: len(c.find_all("p")), default=None)
+                    paragraph_counts = dict.fromkeys(map(id, potential_containers), 0)
+                    for p in article_soup.find_all("p"):
+                        for ancestor in p.parents:
+                            if id(ancestor) in paragraph_counts:
+                                paragraph_counts[id(ancestor)] += 1
+                    main_content_container = max(potential_containers, key=lambda c: paragraph_counts[id(c)], default=None)
             
             collected_paragraphs_text = []
             if main_content_container:
-                paragraphs = main_content_container.find_all("p")
-                seen_texts = set()
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text and len(text) > 30 and not re.search(r"^(advertisement|sponsored|related articles|read more|also read|subscribe now|follow us|share this article|photo:|image:|caption:)", text, re.IGNORECASE):
-                        if text not in seen_texts:
-                            collected_paragraphs_text.append(text)
-                            seen_texts.add(text)
+                paragraph_texts = (p.get_text(strip=True) for p in main_content_container.find_all("p"))
+                collected_paragraphs_text = list(dict.fromkeys(text for text in paragraph_texts if len(text) > 30 and not NON_CONTENT_PARAGRAPH_REGEX.search(text)))
                 if collected_paragraphs_text:
                     article_content = "\n\n".join(collected_paragraphs_text).strip()
 
             category = "No Category Found"
             try:
-                category_element = article_soup.select_one("div.topic-holder a.dn-link.pill.tag")
+                category_element = ARTICLE_CATEGORY_SELECTOR.select_one(article_soup)
                 if category_element:
                     category = category_element.text.strip()
             except Exception:
@@ -567,15 +1008,27 @@ class AppWindow(QMainWindow):
             container_classes_list = main_content_container.get("class", []) if main_content_container and main_content_container.has_attr("class") else []
             return date_published, article_content, container_classes_list, category
 
+        # --- Stream Articles to the Workbook ---
+        ARTICLE_COLUMNS = ["Topic", "Link", "Date", "Content", "Content Classes", "Serial Number", "URL Content Class"]
+
+        def open_article_workbook(file_path):
+            workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True, "default_date_format": "yyyy-mm-dd"})
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, ARTICLE_COLUMNS, workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"}))
+            return workbook, worksheet
+
+        def write_article_row(worksheet, row_number, article):
+            worksheet.write_row(row_number, 0, [article["Topic"], article["Link"], article["Date"], article["Content"], str(article["Content Classes"]), row_number, article["URL Content Class"]])
+
         # --- Verification Mechanism ---
-        def verify_scraped_dates(scraped_data, start_date, end_date):
+        def verify_scraped_dates(article_dates, start_date, end_date):
             print("\n--- Verification Step ---")
-            if not scraped_data:
+            if not article_dates:
                 print("⚠️ No data was scraped, so verification cannot be performed.")
                 return
-            scraped_dates = {item['Date'] for item in scraped_data if isinstance(item.get('Date'), date)}
-            expected_dates = {start_date + timedelta(days=d) for d in range((end_date - start_date).days + 1)}
-            missing_dates = sorted(list(expected_dates - scraped_dates))
+            scraped_dates = {article_date for article_date in article_dates if isinstance(article_date, date)}
+            calendar_days = (start_date + timedelta(days=d) for d in range((end_date - start_date).days + 1))
+            missing_dates = [day for day in calendar_days if day not in scraped_dates]
             if not missing_dates:
                 print("✅ Verification successful: At least one article was found for every calendar day in the selected range.")
             else:
@@ -585,7 +1038,13 @@ class AppWindow(QMainWindow):
                 print("This could be because no articles were published on these days, or they were potentially missed by the scraper.")
 
         # --- Helper for System Clock Check ---
-        def get_real_current_year_from_api():
+        def fetch_real_timestamp():
+            if ntplib:
+                try:
+                    print("Verifying system clock against NTP time source...")
+                    return ntplib.NTPClient().request("pool.ntp.org", version=3, timeout=2).tx_time
+                except Exception as e:
+                    print(f"⚠️  Warning: NTP time check failed, trying the online API. Error: {e}")
             if not requests:
                 print("ℹ️  Skipping online year verification because 'requests' library is not installed.")
                 return None
@@ -594,16 +1053,60 @@ class AppWindow(QMainWindow):
                 response = requests.get("http://worldtimeapi.org/api/ip", timeout=5)
                 response.raise_for_status()
                 data = response.json()
-                iso_datetime_str = data.get('datetime')
-                if iso_datetime_str and len(iso_datetime_str) >= 4:
-                    real_year = int(iso_datetime_str[:4])
-                    print(f"✅ Online time source reports the year is {real_year}.")
-                    return real_year
-                return None
+                return data.get('unixtime') or datetime.fromisoformat(data['datetime']).timestamp()
             except Exception as e:
                 print(f"⚠️  Warning: Could not verify current year via online API. Error: {e}")
                 return None
 
+        def get_real_current_year_from_api():
+            clock_offset = None
+            try:
+                if 0 <= time.time() - os.path.getmtime(CLOCK_CHECK_CACHE_PATH) < CLOCK_CHECK_MAX_AGE:
+                    with open(CLOCK_CHECK_CACHE_PATH, encoding="utf-8") as f:
+                        clock_offset = float(f.read())
+            except (OSError, ValueError):
+                pass
+            from_cache = clock_offset is not None
+            if not from_cache:
+                real_timestamp = fetch_real_timestamp()
+                if real_timestamp is None:
+                    return None
+                clock_offset = real_timestamp - time.time()
+                try:
+                    with open(CLOCK_CHECK_CACHE_PATH, "w", encoding="utf-8") as f:
+                        f.write(repr(clock_offset))
+                except OSError:
+                    pass
+            real_year = datetime.fromtimestamp(time.time() + clock_offset).year
+            if from_cache:
+                print(f"✅ Clock offset from the last online check (under {CLOCK_CHECK_MAX_AGE // 3600} h old) puts the year at {real_year}.")
+            else:
+                print(f"✅ Online time source reports the year is {real_year}.")
+            return real_year
+
+        # --- Browser Session (reused across runs while the app is open) ---
+        def build_driver():
+            if self.scrape_driver is not None:
+                try:
+                    self.scrape_driver.current_window_handle
+                    return self.scrape_driver
+                except Exception:
+                    self.scrape_driver = None
+            chrome_options = webdriver.ChromeOptions()
+            chrome_options.add_argument(f"user-data-dir={PROFILE_PATH}")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2, "profile.managed_default_content_settings.stylesheet": 2, "profile.managed_default_content_settings.fonts": 2})
+            chrome_options.add_argument(f"user-agent={USER_AGENT}")
+            chrome_options.page_load_strategy = "eager"
+            driver = webdriver.Chrome(options=chrome_options)
+            driver.implicitly_wait(IMPLICIT_WAIT)
+            self.scrape_driver = driver
+            return driver
+
         # --- Main Scraping Logic (wrapped in a function to use the nested helpers) ---
         def main():
             system_year = date.today().year
@@ -629,43 +1132,59 @@ class AppWindow(QMainWindow):
                 print("Date selection cancelled or invalid. Exiting.")
                 return
             print(f"\n📅 Scraping from {local_start_date} to {local_end_date}\n")
+            prune_article_cache()
             worker.progress.emit(1)
 
+            today_str = date.today().strftime('%Y-%m-%d')
+            filename = f"news_filtered_by_date_{today_str}.xlsx"
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            file_path = os.path.join(OUTPUT_DIR, filename)
+            # Articles are streamed to the workbook as they are scraped; pandas only writes it at the end without xlsxwriter.
+            article_workbook = None
+            article_dates = []
             scraped_data = []
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument(f"user-data-dir={PROFILE_PATH}")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument(f"user-agent={USER_AGENT}")
 
             try:
-                driver = webdriver.Chrome(options=chrome_options)
+                driver = build_driver()
             except Exception as e:
                 print(f"❌ Could not start WebDriver: {e}")
                 worker.output.emit(f"❌ Could not start WebDriver: {e}. Ensure chromedriver is installed and accessible in your PATH.")
                 return
 
-            driver.implicitly_wait(IMPLICIT_WAIT)
+            listing_session = make_listing_session() if requests else None
             page_number = 1
             stop_scraping = False
 
-            while not stop_scraping:
+            while not stop_scraping and not self.stop_scraping_requested:
                 page_url = f"https://www.upstreamonline.com/latest?page={page_number}"
                 print(f"\n🌐 Visiting: {page_url}")
                 try:
-                    driver.get(page_url)
-                    WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    soup = BeautifulSoup(driver.page_source, "html.parser")
-                    articles = get_article_links_and_titles(soup)
+                    page_html = fetch_listing_html(listing_session, page_url) if listing_session else None
+                    if page_html is None:
+                        listing_session = None
+                        driver.get(page_url)
+                        try:
+                            WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.card-link")))
+                        except TimeoutException:
+                            pass
+                        page_html = driver.page_source
+                    articles = get_article_links_and_titles(page_html)
                     if not articles:
                         print("⚠️ No more articles found on the site. Ending pagination.")
                         break
-                    for i, (link, title) in enumerate(articles):
+                    for i, (link, title, page_source, details) in enumerate(load_articles(driver, articles)):
+                        if self.stop_scraping_requested:
+                            break
                         # Simple progress update for the UI
                         worker.progress.emit(int(((i + 1) / len(articles)) * 100))
+                        if page_source is None and details is None:
+                            continue
                         try:
                             print(f"Processing article: {title} ({link})")
-                            parsed_date, article_content, container_classes, category = extract_article_details(driver, link)
+                            if details is None:
+                                details = extract_article_details(page_source, link)
+                                store_article_details(link, details)
+                            parsed_date, article_content, container_classes, category = details
                             print(f"Parsed date for {title}: {parsed_date} (type: {type(parsed_date)})")
                             if isinstance(parsed_date, date):
                                 if parsed_date < local_start_date:
@@ -673,10 +1192,17 @@ class AppWindow(QMainWindow):
                                     stop_scraping = True
                                     break
                                 if local_start_date <= parsed_date <= local_end_date:
-                                    scraped_data.append({
+                                    article = {
                                         "Topic": title, "Link": link, "Date": parsed_date, "Content": article_content,
                                         "Content Classes": container_classes, "URL Content Class": category
-                                    })
+                                    }
+                                    article_dates.append(parsed_date)
+                                    if xlsxwriter:
+                                        if article_workbook is None:
+                                            article_workbook = open_article_workbook(file_path)
+                                        write_article_row(article_workbook[1], len(article_dates), article)
+                                    else:
+                                        scraped_data.append(article)
                                     print(f"✅ Added '{title}' to the dataset.")
                                 else:
                                     print(f"ℹ️ Article '{title}' date ({parsed_date}) is not in the selected range. Skipping.")
@@ -691,143 +1217,236 @@ class AppWindow(QMainWindow):
                 except Exception as e:
                     print(f"❌ Page error: {e}")
                     break
-            driver.quit()
-            verify_scraped_dates(scraped_data, local_start_date, local_end_date)
-            today_str = date.today().strftime('%Y-%m-%d')
-            filename = f"news_filtered_by_date_{today_str}.xlsx"
-            os.makedirs(OUTPUT_DIR, exist_ok=True)
-            file_path = os.path.join(OUTPUT_DIR, filename)
-            if scraped_data:
-                df = pd.DataFrame(scraped_data)
-                df["Serial Number"] = range(1, len(df) + 1)
-                df = df[["Topic", "Link", "Date", "Content", "Content Classes", "Serial Number", "URL Content Class"]]
-                df.to_excel(file_path, index=False)
-                print(f"\n✅ Data saved to: {file_path}")
-            else:
-                print("\n⚠️ No data collected.")
+            excel_write = None
+            # Finish the workbook on an I/O thread while the dates are verified. The browser stays open for the next run.
+            with ThreadPoolExecutor(max_workers=1) as io_pool:
+                if article_workbook:
+                    excel_write = io_pool.submit(article_workbook[0].close)
+                elif scraped_data:
+                    df = pd.DataFrame(scraped_data)
+                    df["Serial Number"] = range(1, len(df) + 1)
+                    df = df[ARTICLE_COLUMNS]
+                    excel_write = io_pool.submit(df.to_excel, file_path, index=False)
+                verify_scraped_dates(article_dates, local_start_date, local_end_date)
+                worker.progress.emit(95)
+                if excel_write:
+                    excel_write.result()
+                    print(f"\n✅ Data saved to: {file_path}")
+                else:
+                    print("\n⚠️ No data collected.")
             worker.progress.emit(100)
 
         # --- Entry Point of the original script ---
-        main()
+        with self.scrape_driver_lock:
+            try:
+                main()
+            finally:
+                if self.stop_scraping_requested:
+                    self.quit_scrape_driver()
 
     # 🔹 YOUR FULL, UNTOUCHED AI ANALYSIS SCRIPT, INDENTED AS A METHOD 🔹
-    def perform_ai_analysis(self, worker):
+    def perform_ai_analysis(self, worker, file_path):
         # The 'worker' object is passed to allow emitting signals (progress, output)
         
         # --- Configuration ---
         SPACY_MODEL = 'en_core_web_trf'
-        nlp = None
-        try:
-            retry_attempts = 3
-            for attempt in range(retry_attempts):
-                try:
-                    nlp = spacy.load(SPACY_MODEL)
-                    print(f"Successfully loaded SpaCy model: {SPACY_MODEL}")
-                    break
-                except OSError as e: 
-                    if attempt < retry_attempts - 1:
-                        print(f"Attempt {attempt + 1} failed to load SpaCy model '{SPACY_MODEL}'. Retrying...")
-                        spacy.cli.download(SPACY_MODEL)
-                    else:
-                        print(f"Failed to load SpaCy model '{SPACY_MODEL}' after {retry_attempts} attempts. Error: {e}")
-                        raise
-        except OSError:
-            print(f"Downloading SpaCy model '{SPACY_MODEL}'...")
-            spacy.cli.download(SPACY_MODEL)
-            nlp = spacy.load(SPACY_MODEL)
-            print(f"Successfully downloaded and loaded SpaCy model: {SPACY_MODEL}")
+        QUANTIZE_TRANSFORMER_ON_CPU = False # Opt-in: int8 transformer on CPU is faster but can change the extracted entities
+        PIPE_BATCH_SIZE = 64
+        LARGE_TEXT_CHARS = 200_000
+        LARGE_TEXT_BATCH_SIZE = 16
+        EXTRACTOR_CACHE_SIZE = 8192
+        SKIP_SPACY_ON_NO_TRIGGER = False # Opt-in: skips profile/vessel extraction without a trigger word, losing NER-only names
+        PIPE_CPU_PROCESSES = 1 # Opt-in: raise for more nlp.pipe worker processes on CPU (each loads its own copy of the model)
+        use_gpu = spacy.prefer_gpu()
+        # Worker processes for nlp.pipe; the GPU pipeline has to stay in this process.
+        PIPE_N_PROCESS = 1 if use_gpu else PIPE_CPU_PROCESSES
+
+        nlp, model_precision = load_analysis_model(SPACY_MODEL, use_gpu, QUANTIZE_TRANSFORMER_ON_CPU)
+        # Rule-based sentence splitting for trimming generated opinions, which doesn't need the full model.
+        sentence_splitter = spacy.blank("en")
+        sentence_splitter.add_pipe("sentencizer")
 
         OUTPUT_PATH = r"C:\Office work\Upstream SCRAP news\Filter output.xlsx"
-
-        # --- ALL YOUR ORIGINAL KEYWORD LISTS AND REGEX PATTERNS ARE PRESERVED HERE ---
-        BUILD_PROCESS_OPTIONS = [ "Concept Engineering", "Concept", "Pre-FEED", "Pre Front End Engineering Design", "FEED", "Front End Engineering Design", "Detailed Engineering", "Detailed Design", "Engineering & Construction", "EPC", "Procurement & Construction", "P+C", "E+C", "Site Preparation", "Trenching", "Project Management", "Transport", "Transportation", "Installation", "Hook up and commissioning", "Commissioning", "Hook-up", "Lease", "Operation & Maintenance", "O&M", "Asset Integrity", "IRM", "Inspection, Repair & Maintenance", "Duty Holder", "Decommissioning", "Decommissioning (Onshore Disposal)", "Onshore Disposal", "Decommissioning (Offshore Removal)", "Offshore Removal", "Decommissioning (Engineering)", "Decommissioning Engineering", "General Information", "General Contract" ]
-        BUILD_PARTS = { "Tree", "Christmas Tree", "Wellhead", "Manifold", "Subsea Manifold", "Subsea Unit", "Control Module", "Subsea Control Module", "Subsea Arch", "Boosting", "Subsea Boosting", "Compression", "Subsea Compression", "Injection", "Subsea Injection", "Separation", "Subsea Separation", "Controls", "Subsea Controls", "Pipelines", "Subsea Pipelines", "Flowlines", "Subsea Flowlines", "Templates", "Subsea Templates", "Subsea", "Subsea Systems", "SURF", "Subsea Umbilicals, Risers and Flowlines", "SURF Package", "Umbilical", "Umbilical Lines", "Riser", "Flowline", "Flexibles", "Flexible Risers", "Flexible Flowlines", "SURF", "SURF Package", "Topside", "Topsides", "Topsides Deck", "Topsides Units", "Accommodation", "Topsides Accommodation", "Compression", "Topsides Compression", "Drilling", "Topsides Drilling", "Power", "Topsides Power", "Process", "Topsides Process", "Carbon Capture", "Topsides Carbon Capture", "Rig", "Drilling Rig", "Living Quarters", "Helideck", "FPSO", "FSRU", "FLNG", "MOPU", "FSO", "Floater", "TLP", "Spar", "Jacket", "Hull", "Caisson", "Compliant Tower", "GBS", "Gravity Base Structure", "Mooring", "Mooring System", "Subsea Mooring Connectors", "Connectors", "Piles", "Anchors", "Anchor", "Turret", "SPM", "Single Point Mooring", "Integration", "Project", "Subsea", "SURF Contract", "Topsides Contract", "WHd Contract" }
-        ALL_BUILD_KEYWORDS = sorted(list(set(BUILD_PROCESS_OPTIONS + list(BUILD_PARTS))))
-        TARGET_BUILD_PARTS = [ "pipeline", "pipelines", "subsea pipeline", "subsea pipelines", "umbilical", "umbilicals", "umbilical line", "umbilical lines", "flowline", "flowlines", "subsea flowline", "subsea flowlines", "riser", "risers", "cable", "cables", "communication cable", "power cable", "export cable" ]
-        LENGTH_UNITS = ["km", "kilometer", "kilometers", "m", "meter", "meters", "mile", "miles", "foot", "feet", "ft"]
-        LENGTH_UNITS_SHORT_EXACT = ["km", "m", "ft"]
-        SORTED_TARGET_BUILD_PARTS = sorted(TARGET_BUILD_PARTS, key=len, reverse=True)
-        NUM_UNIT_REGEX_SPACED = re.compile(r"(\d+(?:\.\d+)?)\s*(" + "|".join(LENGTH_UNITS) + r")\b", re.IGNORECASE)
-        NUM_UNIT_REGEX_NOSPACE = re.compile(r"(\d+(?:\.\d+)?)(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-        NUM_DASH_UNIT_REGEX = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(" + "|".join(unit for unit in LENGTH_UNITS if unit not in LENGTH_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-        WEIGHT_TARGET_PARTS = [ "topside", "topsides", "jacket", "hull", "module", "modules", "manifold", "tree", "christmas tree", "wellhead", "template", "pile", "piles", "anchor", "anchors", "turret", "gbs", "gravity base structure", "platform", "fpso", "fsru", "flng", "mopu", "fso", "floater", "tlp", "spar" ]
-        WEIGHT_UNITS = ['t', 'ton', 'tons', 'tonne', 'tonnes', 'te', 'kg', 'kilogram', 'kilograms', 'lb', 'lbs', 'pound', 'pounds']
-        WEIGHT_UNITS_SHORT_EXACT = ['t', 'kg', 'lb', 'lbs']
-        SORTED_WEIGHT_TARGET_PARTS = sorted(WEIGHT_TARGET_PARTS, key=len, reverse=True)
-        NUM_WEIGHT_UNIT_REGEX_SPACED = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS) + r")\b", re.IGNORECASE)
-        NUM_WEIGHT_UNIT_REGEX_NOSPACE = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-        DIAMETER_TARGET_PARTS = [ "pipeline", "pipelines", "subsea pipeline", "subsea pipelines", "umbilical", "umbilicals", "umbilical line", "umbilical lines", "flowline", "flowlines", "subsea flowline", "subsea flowlines", "riser", "risers", "pile", "piles", "caisson" ]
-        DIAMETER_UNITS = ['inch', 'inches', 'in', '"', 'mm', 'millimeter', 'millimeters', 'cm', 'centimeter', 'centimeters', 'm', 'meter', 'meters', 'foot', 'feet', 'ft']
-        DIAMETER_UNITS_SHORT_EXACT = ['in', '"', 'mm', 'cm', 'm', 'ft']
-        SORTED_DIAMETER_TARGET_PARTS = sorted(DIAMETER_TARGET_PARTS, key=len, reverse=True)
-        NUM_DIAMETER_UNIT_REGEX_SPACED = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")\b", re.IGNORECASE)
-        NUM_DIAMETER_UNIT_REGEX_NOSPACE = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-        NUM_DASH_DIAMETER_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*-\s*(" + "|".join(unit for unit in DIAMETER_UNITS if unit not in DIAMETER_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-        DIMENSION_TARGET_PARTS = [ "topside", "topsides", "hull", "module", "modules", "platform", "fpso", "jacket", "vessel" ]
-        DIMENSION_UNITS = ['m', 'meter', 'meters', 'foot', 'feet', 'ft']
-        SORTED_DIMENSION_TARGET_PARTS = sorted(DIMENSION_TARGET_PARTS, key=len, reverse=True)
-        ACCOMMODATION_TARGET_PARTS = [ "fpso", "platform", "living quarters", "accommodation module", "flotel", "vessel" ]
-        ACCOMMODATION_UNITS = ['person', 'people', 'personnel', 'pob', 'berths', 'beds']
-        SORTED_ACCOMMODATION_TARGET_PARTS = sorted(ACCOMMODATION_TARGET_PARTS, key=len, reverse=True)
-        STORAGE_TARGET_PARTS = [ "fpso", "fso", "flng", "hull", "tank", "tanks", "vessel" ]
-        STORAGE_UNITS = ['barrels', 'bbl', 'bbls', 'cubic meters', 'm3', 'tonnes', 't']
-        SORTED_STORAGE_TARGET_PARTS = sorted(STORAGE_TARGET_PARTS, key=len, reverse=True)
-        POWER_TARGET_PARTS = [ "power module", "generator", "platform", "fpso", "facility" ]
-        POWER_UNITS = ['megawatt', 'mw', 'kilowatt', 'kw', 'gigawatt', 'gw']
-        SORTED_POWER_TARGET_PARTS = sorted(POWER_TARGET_PARTS, key=len, reverse=True)
-        MOORING_TARGET_PARTS = [ "fpso", "flng", "fsru", "fso", "spar", "tlp", "vessel", "buoy", "platform", "floater" ]
-        MOORING_TYPES = [ "turret", "spread", "catenary", "taut-leg", "single-point", "disconnectable", "internal", "external" ]
-        SORTED_MOORING_TARGET_PARTS = sorted(MOORING_TARGET_PARTS, key=len, reverse=True)
-        VESSEL_TYPES = [ "vessel", "ship", "drillship", "semi-submersible", "rig", "jack-up", "platform supply vessel", "psv", "anchor handling tug supply", "ahts", "aht", "construction vessel", "subsea construction vessel", "scv", "pipelay vessel", "heavy-lift vessel", "flotel", "accommodation vessel", "support vessel", "tug", "barge", "tanker", "carrier", "seismic vessel" ]
-        SORTED_VESSEL_TYPES = sorted(VESSEL_TYPES, key=len, reverse=True)
-        VESSEL_SCOPE_KEYWORDS = [ "support", "drilling", "installation", "construction", "pipelay", "decommissioning", "accommodation", "transport", "maintenance", "survey", "seismic", "towing", "anchor handling", "rov", "inspection", "repair", "irm" ]
-        VESSEL_CHARTER_VERBS = [ "charter", "contract", "hire", "award", "secure", "fix", "book", "mobilise", "deploy", "take on" ]
-        DEPTH_RATING_TARGET_PARTS = [ "wellhead", "wellheads", "christmas tree", "trees", "manifold", "manifolds", "bop", "blowout preventer", "valve", "valves", "riser", "risers", "pipeline", "pipelines", "pump", "pumps", "compressor", "compressors", "umbilical", "umbilicals", "flowline", "flowlines", "connector", "connectors", "sps", "subsea production system", "subsea system", "subsea equipment" ]
-        DEPTH_RATING_UNITS = ['meter', 'meters', 'm', 'feet', 'ft']
-        SORTED_DEPTH_RATING_TARGET_PARTS = sorted(DEPTH_RATING_TARGET_PARTS, key=len, reverse=True)
-        NUM_DEPTH_RATING_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DEPTH_RATING_UNITS) + r")\b", re.IGNORECASE)
-        PRESSURE_TARGET_PARTS = [ "wellhead", "wellheads", "christmas tree", "trees", "manifold", "manifolds", "bop", "blowout preventer", "valve", "valves", "riser", "risers", "pipeline", "pipelines", "choke" ]
-        PRESSURE_UNITS = ['psi', 'bar', 'pascal', 'pa', 'kpa', 'mpa']
-        SORTED_PRESSURE_TARGET_PARTS = sorted(PRESSURE_TARGET_PARTS, key=len, reverse=True)
-        NUM_PRESSURE_UNIT_REGEX = re.compile(r"([\d,]+(?:k|K)?)\s*(" + "|".join(PRESSURE_UNITS) + r")\b", re.IGNORECASE)
-        FLOW_CAPACITY_TARGET_PARTS = [ "pipeline", "pipelines", "flowline", "flowlines", "pump", "pumps", "compressor", "compressors", "riser", "risers", "processing plant", "facility", "terminal", "separator", "separators" ]
-        FLOW_CAPACITY_UNITS = [ 'bpd', 'bbl/d', 'boepd', 'm3/d', 'scfd', 'mcfd', 'mmscfd', 'bcfd', 'tph', 'kg/s', 'gj/d', 'tcf/d', 'mcm/d', 'barrels per day', 'cubic meters per day', 'tonnes per hour' ]
-        SORTED_FLOW_CAPACITY_TARGET_PARTS = sorted(FLOW_CAPACITY_TARGET_PARTS, key=len, reverse=True)
-        NUM_FLOW_CAPACITY_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(FLOW_CAPACITY_UNITS) + r")\b", re.IGNORECASE)
-        TEMP_TARGET_PARTS = [ "pipeline", "pipelines", "vessel", "vessels", "reactor", "reactors", "storage tank", "tanks", "heater", "heaters", "cooler", "coolers", "exchanger", "exchangers" ]
-        TEMP_UNITS = ['celsius', 'fahrenheit', 'kelvin', 'c', 'f', 'k', 'degrees', '°c', '°f']
-        SORTED_TEMP_TARGET_PARTS = sorted(TEMP_TARGET_PARTS, key=len, reverse=True)
-        NUM_TEMP_UNIT_REGEX = re.compile(r"(-?\d+(?:\.\d+)?)\s*(?:degrees)?\s*(" + "|".join(TEMP_UNITS) + r")\b", re.IGNORECASE)
-        QUANTITY_TARGET_PARTS = list(BUILD_PARTS)
-        NON_COUNTABLE_KEYWORDS = [ "integration", "project", "subsea", "surf contract", "topsides contract", "whd contract", "boosting", "compression", "injection", "separation", "controls", "engineering", "management", "transport", "installation", "maintenance", "decommissioning", "procurement" ]
-        SORTED_QUANTITY_TARGET_PARTS = sorted([p for p in QUANTITY_TARGET_PARTS if p.lower() not in NON_COUNTABLE_KEYWORDS], key=len, reverse=True)
-        ENTITY_KEYWORDS_FOR_CAPACITY = { "Well": ["well", "wells", "wellbore"], "Field": ["field", "oilfield", "gas field", "fields", "development", "reservoir"], "Cluster": ["cluster", "hub", "tie-back"], "Block": ["block", "blocks", "licence block", "license"], "Basin": ["basin", "basins"], "Floater": ["fpso", "flng", "fsru", "mopu", "fso", "floater", "floating production storage and offloading", "vessel"], "Plant": ["plant", "facility", "terminal", "refinery", "processing plant", "gas plant", "petrochemical plant", "onshore facility", "station"], "Platform": ["platform", "topsides", "jacket", "rig", "drilling rig", "spar", "tlp", "semisubmersible", "fixed platform"], "Pipeline": ["pipeline", "pipelines", "flowline", "flowlines", "umbilical", "riser", "export line"], "Subsea": ["subsea production system", "sps", "manifold", "subsea pump", "template", "subsea facility"], "Project": ["project", "package", "phase", "development project", "expansion"] }
+        DOC_CACHE_ROOT = os.path.join(os.path.dirname(OUTPUT_PATH), "_doc_cache")
+        # Parses from a quantized or mixed-precision model can differ, so each precision gets its own cache
+        DOC_CACHE_DIR = os.path.join(DOC_CACHE_ROOT, SPACY_MODEL, model_precision)
+        DOC_CACHE_MAX_AGE = 30 * 24 * 60 * 60 # Parses unused for this long are deleted
+        DOC_CACHE_MAX_BYTES = 2 * 1024 ** 3 # Beyond this, the least recently used parses are deleted
 
         # --- ALL YOUR ORIGINAL HELPER FUNCTIONS ARE PRESERVED HERE ---
         def clean_text(text):
+            if isinstance(text, str):
+                return text.strip()
             if pd.isna(text):
                 return ""
             return str(text).strip()
 
+        doc_cache = {}
+
+        def doc_cache_key(text, disable=()):
+            if disable:
+                text = "\x00".join([text, *disable])
+            return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+        def load_cached_doc(key):
+            cache_file = os.path.join(DOC_CACHE_DIR, f"{key}.spacy")
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, "rb") as f:
+                        doc = Doc(nlp.vocab).from_bytes(f.read())
+                    os.utime(cache_file) # The modification time doubles as last use for prune_doc_cache
+                    return doc
+                except Exception as e:
+                    print(f"Warning: Could not read cached parse '{cache_file}': {e}")
+            return None
+
+        def prune_doc_cache():
+            # Sweeps every model's and precision's parses: expired files first, then the oldest until under the size cap
+            entries = []
+            for dir_path, _, file_names in os.walk(DOC_CACHE_ROOT):
+                for file_name in file_names:
+                    path = os.path.join(dir_path, file_name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+            expired_before = time.time() - DOC_CACHE_MAX_AGE
+            total_bytes = sum(size for _, size, _ in entries)
+            removed = 0
+            for mtime, size, path in entries:
+                if mtime >= expired_before and total_bytes <= DOC_CACHE_MAX_BYTES:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total_bytes -= size
+                removed += 1
+            if removed:
+                print(f"Removed {removed} stale cached parses from '{DOC_CACHE_ROOT}'.")
+
+        prune_doc_cache()
+
+        def store_parsed_doc(key, doc):
+            if Doc.has_extension("trf_data"):
+                doc._.trf_data = None
+            cache_file = os.path.join(DOC_CACHE_DIR, f"{key}.spacy")
+            try:
+                os.makedirs(DOC_CACHE_DIR, exist_ok=True)
+                with open(cache_file, "wb") as f:
+                    f.write(doc.to_bytes(exclude=["user_data"]))
+            except OSError as e:
+                print(f"Warning: Could not write cached parse '{cache_file}': {e}")
+
+        def remember_doc(key, doc):
+            doc_cache[key] = doc
+            if len(doc_cache) % 64 == 0:
+                gc.collect()
+
+        def split_large_text(text):
+            # Cut at paragraph (or failing that, sentence) boundaries so no chunk exceeds LARGE_TEXT_CHARS.
+            chunks = []
+            start = 0
+            while len(text) - start > LARGE_TEXT_CHARS:
+                limit = start + LARGE_TEXT_CHARS
+                end = text.rfind("\n\n", start, limit)
+                if end <= start:
+                    end = text.rfind(". ", start, limit)
+                end = end + 2 if end > start else limit
+                chunks.append(text[start:end])
+                start = end
+            chunks.append(text[start:])
+            return chunks
+
+        def run_pipeline(text, disable=()):
+            # The Matcher slows down badly on very large Docs, so huge inputs are parsed piecewise and stitched back together.
+            if len(text) <= LARGE_TEXT_CHARS:
+                return nlp(text, disable=disable)
+            chunk_docs = list(nlp.pipe(split_large_text(text), batch_size=LARGE_TEXT_BATCH_SIZE, disable=disable))
+            return Doc.from_docs(chunk_docs)
+
+        def parse(text, disable=()):
+            key = doc_cache_key(text, disable)
+            if key in doc_cache:
+                return doc_cache[key]
+            doc = load_cached_doc(key)
+            if doc is None:
+                doc = run_pipeline(text, disable=disable)
+                store_parsed_doc(key, doc)
+            remember_doc(key, doc)
+            return doc
+
+        def parse_batch(texts, disable=(), batch_size=PIPE_BATCH_SIZE, n_process=PIPE_N_PROCESS):
+            pending = {}
+            large_pending = {}
+            for text in texts:
+                if not text:
+                    continue
+                key = doc_cache_key(text, disable)
+                if key in doc_cache or key in pending or key in large_pending:
+                    continue
+                doc = load_cached_doc(key)
+                if doc is None:
+                    if len(text) > LARGE_TEXT_CHARS:
+                        large_pending[key] = text
+                    else:
+                        pending[key] = text
+                else:
+                    remember_doc(key, doc)
+            if len(pending) <= batch_size:
+                n_process = 1
+            for key, doc in zip(pending, nlp.pipe(pending.values(), batch_size=batch_size, disable=disable, n_process=n_process)):
+                store_parsed_doc(key, doc)
+                remember_doc(key, doc)
+            for key, text in large_pending.items():
+                doc = run_pipeline(text, disable=disable)
+                store_parsed_doc(key, doc)
+                remember_doc(key, doc)
+
+        def ensure_precomputed(doc):
+            # Sentence views shared by every extractor that gets the same cached Doc.
+            views = doc.user_data.get("precomputed")
+            if views is None:
+                sents = list(doc.sents)
+                text_lower = doc.text.lower()
+                if len(text_lower) != len(doc.text):
+                    text_lower = None
+                views = doc.user_data["precomputed"] = {
+                    "sents": sents,
+                    "text_lower": text_lower,
+                    "sents_lower": [lower_span(text_lower, sent) for sent in sents],
+                    "sent_index": [sent_i for sent_i, sent in enumerate(sents) for _ in range(len(sent))],
+                    "sents_v": [sent for sent in sents if len(sent.text.strip()) > 5 and sent.vector_norm],
+                }
+            return views
+
+        def lower_span(text_lower, span):
+            return text_lower[span.start_char:span.end_char] if text_lower is not None else span.text.lower()
+
+        project_name_matcher = Matcher(nlp.vocab)
+        project_name_matcher.add("FIELD_PROJECT_NAME", [[ {"POS": {"IN": ["PROPN", "NOUN", "ADJ"]}, "OP": "+"}, {"LOWER": {"IN": ["field", "project", "development", "oilfield", "block", "area", "licence", "basin", "phase", "package", "discovery"]}} ]])
+
         def extract_project_profiles(text):
             text = clean_text(text)
             if not text: return ''
-            doc = nlp(text)
+            if SKIP_SPACY_ON_NO_TRIGGER and not PROFILE_TRIGGER_REGEX.search(text): return ''
+            doc = parse(text)
+            views = ensure_precomputed(doc)
+            text_lower = views["text_lower"]
             found_names = set()
             regex_patterns = re.findall( r'\b(?:[A-Z][a-z0-9\'-]*\s*){1,5}(?:Field|Project|Development|Oilfield|Area|Licence|Basin|Discovery)\b|' r'\bBlock\s+(?:[A-Z0-9-]+)\b|' r'\b(?:Phase \d+|Package \d+|EPCI \d+)\b', text, re.IGNORECASE )
             for match in regex_patterns:
                 found_names.add(match.strip())
-            matcher = Matcher(nlp.vocab)
-            pattern_name_designator = [ {"POS": {"IN": ["PROPN", "NOUN", "ADJ"]}, "OP": "+"}, {"LOWER": {"IN": ["field", "project", "development", "oilfield", "block", "area", "licence", "basin", "phase", "package", "discovery"]}} ]
-            matcher.add("FIELD_PROJECT_NAME", [pattern_name_designator])
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                span = doc[start:end]
-                if not (span.text.lower().startswith("the ") and len(span.text.split()) <= 2):
+            matches = project_name_matcher(doc, as_spans=True)
+            for span in matches:
+                if not (lower_span(text_lower, span).startswith("the ") and len(span.text.split()) <= 2):
                     found_names.add(span.text.strip())
             for ent in doc.ents:
                 if ent.label_ in ['PRODUCT', 'FAC', 'WORK_OF_ART']:
-                    if any(term in ent.text.lower() for term in ['project', 'field', 'development', 'phase', 'package']):
+                    ent_text_lower = lower_span(text_lower, ent)
+                    if any(term in ent_text_lower for term in ['project', 'field', 'development', 'phase', 'package']):
                         found_names.add(ent.text.strip())
                     elif len(ent.text.split()) > 1 and all(t.istitle() or t.isupper() for t in ent.text.split()):
                         found_names.add(ent.text.strip())
@@ -840,384 +1459,330 @@ class AppWindow(QMainWindow):
                 if len(name) < 4 and not re.search(r'\d', name) and name.lower() not in ['block', 'field', 'project', 'phase']:
                     continue
             candidate_names = set()
-            names_list = sorted(list(found_names), key=len, reverse=True)
-            for i, name1 in enumerate(names_list):
-                is_substring = False
-                for j, name2 in enumerate(names_list):
-                    if i != j and name1.lower() in name2.lower():
-                        is_substring = True
-                        break
-                if not is_substring:
-                    candidate_names.add(name1)
+            accepted_names_lower = "\x00"
+            for name in sorted(found_names, key=lambda n: (-len(n), n)):
+                name_lower = name.lower()
+                if name_lower not in accepted_names_lower:
+                    candidate_names.add(name)
+                    accepted_names_lower += name_lower + "\x00"
             if not candidate_names:
                 return ''
-            profiles = {name: {} for name in candidate_names}
-            for sent in doc.sents:
-                sent_text_lower = sent.text.lower()
-                for name in candidate_names:
-                    if any(part.lower() in sent_text_lower for part in name.split() if len(part) > 3):
-                        depth_match = re.search(r"in ([\d,]+(?:\.\d+)?)\s*(meters?|m|feet|ft)\s+of water", sent_text_lower)
-                        if depth_match and 'Depth' not in profiles[name]:
-                            unit = 'm' if 'm' in depth_match.group(2) else 'ft'
-                            profiles[name]['Depth'] = f"{depth_match.group(1).replace(',', '')}{unit}"
-                        dist_match = re.search(r"([\d,]+(?:\.\d+)?)\s*(km|kilometers?|miles?)\s*(offshore|from the coast)", sent_text_lower)
-                        if dist_match and 'Distance' not in profiles[name]:
-                            unit = 'km' if 'k' in dist_match.group(2) else 'miles'
-                            profiles[name]['Distance'] = f"{dist_match.group(1).replace(',', '')}{unit} offshore"
-                        if 'Timeline' not in profiles[name]:
-                            timeline_keywords = { "Startup": ["first oil", "first gas", "start-up", "online", "operational by", "come onstream", "begin production"], "Shutdown": ["shut down", "cease production", "decommissioning in", "abandonment in", "plug and abandon"] }
-                            timeline_found = None
-                            for status, keywords in timeline_keywords.items():
-                                for kw in keywords:
-                                    if kw in sent_text_lower:
-                                        for ent in sent.ents:
-                                            if ent.label_ == 'DATE':
-                                                timeline_found = f"{status} {ent.text}"
-                                                break
-                                        if timeline_found: break
-                                if timeline_found: break
-                            if timeline_found:
-                                profiles[name]['Timeline'] = timeline_found
-                        if 'Capacity' not in profiles[name]:
-                            if not re.search(r'[\$€£]', sent.text):
-                                CAPACITY_REGEX = r"([\d,.]+(?:\.\d+)?\s*(?:million|billion|thousand|mn|bn|k)?\s*(?:bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|tonnes/year|t/y|t/d|barrels|tonnes|cubic\s+feet|cubic\s+meters))"
-                                cap_match = re.search(CAPACITY_REGEX, sent.text, re.IGNORECASE)
-                                if cap_match:
-                                    profiles[name]['Capacity'] = ' '.join(cap_match.group(1).split())
+            profiles = {field: {} for field in PROFILE_FIELDS}
+            part_names = {}
+            for name in candidate_names:
+                for part in name.split():
+                    if len(part) > 3:
+                        part_names.setdefault(part.lower(), set()).add(name)
+            for sent, sent_text_lower in zip(views["sents"], views["sents_lower"]):
+                sent_names = {name for part, names in part_names.items() if part in sent_text_lower for name in names}
+                if not sent_names:
+                    continue
+                depth, distance, capacity = scan_profile_sentence(sent.text)
+                timeline_found = None
+                first_date = next((ent.text for ent in sent.ents if ent.label_ == 'DATE'), None)
+                if first_date:
+                    for status, keywords in PROFILE_TIMELINE_KEYWORDS.items():
+                        if any(kw in sent_text_lower for kw in keywords):
+                            timeline_found = f"{status} {first_date}"
+                            break
+                for field, value in (("Depth", depth), ("Distance", distance), ("Timeline", timeline_found), ("Capacity", capacity)):
+                    if value:
+                        field_values = profiles[field]
+                        for name in sent_names:
+                            field_values.setdefault(name, value)
             output_parts = []
-            for name in sorted(list(candidate_names)):
-                details = profiles[name]
-                if not details:
-                    output_parts.append(name)
-                else:
-                    ordered_details = []
-                    if 'Capacity' in details: ordered_details.append(f"Capacity: {details['Capacity']}")
-                    if 'Timeline' in details: ordered_details.append(f"Timeline: {details['Timeline']}")
-                    if 'Depth' in details: ordered_details.append(f"Depth: {details['Depth']}")
-                    if 'Distance' in details: ordered_details.append(f"Distance: {details['Distance']}")
-                    detail_str = ", ".join(ordered_details)
-                    output_parts.append(f"{name} ({detail_str})")
+            for name in sorted(candidate_names):
+                ordered_details = [f"{field}: {profiles[field][name]}" for field in PROFILE_FIELDS if name in profiles[field]]
+                output_parts.append(f"{name} ({', '.join(ordered_details)})" if ordered_details else name)
             return "; ".join(output_parts)
 
+        vessel_name_matcher = Matcher(nlp.vocab)
+        vessel_name_matcher.add("VESSEL_NAMED", [[{"LOWER": {"IN": ["vessel", "ship", "rig", "drillship", "flotel"]}}, {"POS": "PROPN", "OP": "+"}]])
+
         def extract_vessel_details(text):
             text = clean_text(text)
-            if not text:
+            if not text or (SKIP_SPACY_ON_NO_TRIGGER and not VESSEL_TRIGGER_REGEX.search(text)):
                 return ''
-            doc = nlp(text)
-            vessel_profiles = {}
+            doc = parse(text)
+            views = ensure_precomputed(doc)
+            text_lower = views["text_lower"]
+            vessel_fields = {field: {} for field in VESSEL_FIELDS}
+            vessel_types, vessel_owners, vessel_charterers, vessel_day_rates, vessel_durations, vessel_scopes = vessel_fields.values()
+            sent_views = {}
             potential_vessel_spans = []
             for ent in doc.ents:
                 if ent.label_ in ["PRODUCT", "FAC", "ORG"]:
-                    ent_text_lower = ent.text.lower()
+                    ent_text_lower = lower_span(text_lower, ent)
                     if any(char.isdigit() for char in ent.text) or '-' in ent.text or any(v_type in ent_text_lower for v_type in VESSEL_TYPES):
                         potential_vessel_spans.append(ent)
-            matcher = Matcher(nlp.vocab)
-            pattern = [{"LOWER": {"IN": ["vessel", "ship", "rig", "drillship", "flotel"]}}, {"POS": "PROPN", "OP": "+"}]
-            matcher.add("VESSEL_NAMED", [pattern])
-            matches = matcher(doc)
-            for _, start, end in matches:
-                potential_vessel_spans.append(doc[start:end])
+            potential_vessel_spans.extend(vessel_name_matcher(doc, as_spans=True))
             for vessel_span in potential_vessel_spans:
                 vessel_name = vessel_span.text
-                for v_type in SORTED_VESSEL_TYPES:
-                    if vessel_name.lower().endswith(f" {v_type}"):
-                        vessel_name = vessel_name[:-(len(v_type)+1)].strip()
+                vessel_name_lower = vessel_name.lower()
+                for v_type_suffix in SORTED_VESSEL_TYPE_SUFFIXES:
+                    if vessel_name_lower.endswith(v_type_suffix):
+                        vessel_name = vessel_name[:-len(v_type_suffix)].strip()
                         break
                 if vessel_name.lower() in VESSEL_TYPES or len(vessel_name) < 4:
                     continue
-                sent = vessel_span.sent
-                sent_text_lower = sent.text.lower()
-                if vessel_name not in vessel_profiles:
-                    vessel_profiles[vessel_name] = {}
-                profile = vessel_profiles[vessel_name]
-                if 'Type' not in profile:
-                    for v_type in SORTED_VESSEL_TYPES:
+                sent_i = views["sent_index"][vessel_span.start]
+                sent_view = sent_views.get(sent_i)
+                if sent_view is None:
+                    sent_text_lower = views["sents_lower"][sent_i]
+                    sent_orgs = [(ent.text, f"{ent.text}'s".lower() in sent_text_lower) for ent in views["sents"][sent_i].ents if ent.label_ == 'ORG']
+                    sent_view = sent_views[sent_i] = (sent_text_lower, sent_orgs, VESSEL_CHARTER_VERB_REGEX.search(sent_text_lower) is not None)
+                sent_text_lower, sent_orgs, has_charter_verb = sent_view
+                if vessel_name not in vessel_types:
+                    for v_type, v_type_title in SORTED_VESSEL_TYPE_TITLES:
                         if v_type in sent_text_lower:
-                            profile['Type'] = v_type.title()
+                            vessel_types[vessel_name] = v_type_title
                             break
-                for ent in sent.ents:
-                    if ent.label_ == 'ORG':
-                        if f"{ent.text}'s".lower() in sent_text_lower and 'Owner' not in profile:
-                            profile['Owner'] = ent.text
-                        if any(verb in sent_text_lower for verb in VESSEL_CHARTER_VERBS) and 'Charterer' not in profile:
-                            if 'Owner' not in profile or profile['Owner'] != ent.text:
-                                profile['Charterer'] = ent.text
-                day_rate_match = re.search(r"((?:[\$€£]|usd)\s?[\d,]+(?:\.\d+)?(?:k| thousand)?)\s*(?:per day|a day|dayrate)", sent_text_lower)
-                if day_rate_match and 'Day Rate' not in profile:
-                    profile['Day Rate'] = day_rate_match.group(1).replace(" thousand", "k")
-                duration_match = re.search(r"(?:for|of)\s+((?:a firm period of\s+)?(?:up to\s+)?(?:\d+|[\w\s]+)\s(?:year|month|week|day)s?)", sent_text_lower)
-                if duration_match and 'Duration' not in profile:
-                    profile['Duration'] = duration_match.group(1).strip()
-                scope_match = re.search(r"(?:to|for|perform|carry out)\s+((?:[\w\s-]+\s)?(?:{})(?:[\w\s-]+)?)".format("|".join(VESSEL_SCOPE_KEYWORDS)), sent_text_lower)
-                if scope_match and 'Scope' not in profile:
-                    scope_text = re.sub(r'\s+', ' ', scope_match.group(1)).strip(" .,").strip()
-                    profile['Scope'] = scope_text
+                for org_text, is_possessive in sent_orgs:
+                    if is_possessive and vessel_name not in vessel_owners:
+                        vessel_owners[vessel_name] = org_text
+                    if has_charter_verb and vessel_name not in vessel_charterers:
+                        if vessel_owners.get(vessel_name) != org_text:
+                            vessel_charterers[vessel_name] = org_text
+                if vessel_name not in vessel_day_rates and (day_rate_match := VESSEL_DAY_RATE_REGEX.search(sent_text_lower)):
+                    vessel_day_rates[vessel_name] = day_rate_match.group(1).replace(" thousand", "k")
+                if vessel_name not in vessel_durations and (duration_match := VESSEL_DURATION_REGEX.search(sent_text_lower)):
+                    vessel_durations[vessel_name] = duration_match.group(1).strip()
+                if vessel_name not in vessel_scopes and (scope_match := VESSEL_SCOPE_REGEX.search(sent_text_lower)):
+                    vessel_scopes[vessel_name] = WHITESPACE_REGEX.sub(' ', scope_match.group(1)).strip(" .,").strip()
             output_parts = []
-            for vessel_name, profile in sorted(vessel_profiles.items()):
-                if not profile:
-                    continue
-                details = []
-                if 'Type' in profile: details.append(f"Type: {profile['Type']}")
-                if 'Owner' in profile: details.append(f"Owner: {profile['Owner']}")
-                if 'Charterer' in profile: details.append(f"Charterer: {profile['Charterer']}")
-                if 'Day Rate' in profile: details.append(f"Day Rate: {profile['Day Rate']}")
-                if 'Duration' in profile: details.append(f"Duration: {profile['Duration']}")
-                if 'Scope' in profile: details.append(f"Scope: {profile['Scope']}")
-                detail_str = ", ".join(details)
-                if detail_str:
-                    output_parts.append(f"{vessel_name} ({detail_str})")
-                else:
-                    output_parts.append(vessel_name)
+            for vessel_name in sorted(set().union(*vessel_fields.values())):
+                details = [f"{field}: {vessel_fields[field][vessel_name]}" for field in VESSEL_FIELDS if vessel_name in vessel_fields[field]]
+                output_parts.append(f"{vessel_name} ({', '.join(details)})")
             return "; ".join(output_parts)
 
+        part_phrase_matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        part_phrase_matcher.add("MULTI_WORD_PART", [nlp.make_doc(part) for part in MULTI_WORD_TARGET_PARTS])
+        part_phrase_matcher.add("MULTI_WORD_UNIT", [nlp.make_doc(phrase) for phrase in MULTI_WORD_UNIT_PHRASES])
+
+        spec_matcher = Matcher(nlp.vocab)
+        length_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
+        length_pattern1a = [ {"TEXT": {"REGEX": r"(?i)^\d+(\.\d+)?(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")$"}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
+        length_pattern2 = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}} ]
+        length_pattern2a = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"TEXT": {"REGEX": r"(?i)^\d+(\.\d+)?(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")$"}} ]
+        length_pattern3 = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["measuring", "stretching", "spanning", "long"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}} ]
+        length_pattern4 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-"}, {"LOWER": {"IN": [unit for unit in LENGTH_UNITS if unit not in LENGTH_UNITS_SHORT_EXACT]}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
+        spec_matcher.add("LENGTH_SPEC", [length_pattern1, length_pattern1a, length_pattern2, length_pattern2a, length_pattern3, length_pattern4])
+        weight_pattern1 = [{"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}, {"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}]
+        weight_pattern2 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
+        weight_pattern3 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "weighing"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
+        weight_pattern4 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "with"}, {"LOWER": "a", "OP": "?"}, {"LOWER": "weight"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
+        spec_matcher.add("WEIGHT_SPEC", [weight_pattern1, weight_pattern2, weight_pattern3, weight_pattern4])
+        diameter_pattern1 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-", "OP": "?"}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "diameter", "OP": "?"}, {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"} ]
+        diameter_pattern2 = [ {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"}, {"LOWER": "with"}, {"LOWER": {"IN": ["a", "an"]}, "OP": "?"}, {"LOWER": "diameter"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}} ]
+        diameter_pattern3 = [ {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "in"}, {"LOWER": "diameter"} ]
+        diameter_pattern4 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["to", "-"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "diameter", "OP": "?"}, {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"} ]
+        spec_matcher.add("DIAMETER_SPEC", [diameter_pattern1, diameter_pattern2, diameter_pattern3, diameter_pattern4])
+        depth_pattern1 = [ {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed"]}}, {"LOWER": "for"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": {"IN": ["depth", "water", "water depth"]}, "OP": "?"} ]
+        depth_pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": {"IN": ["depth", "water", "water depth"]}}, {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"} ]
+        depth_pattern3 = [ {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"}, {"LOWER": "for"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": "water", "OP": "?"} ]
+        spec_matcher.add("DEPTH_RATING_SPEC", [depth_pattern1, depth_pattern2, depth_pattern3])
+        pressure_pattern1 = [ {"TEXT": {"REGEX": r"[\d,]+(?:k|K)?"}}, {"LOWER": {"IN": PRESSURE_UNITS}}, {"LOWER": {"IN": PRESSURE_TARGET_PARTS}, "OP": "+"} ]
+        pressure_pattern2 = [ {"LOWER": {"IN": PRESSURE_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed"]}}, {"LOWER": "for", "OP": "?"}, {"TEXT": {"REGEX": r"[\d,]+(?:k|K)?"}}, {"LOWER": {"IN": PRESSURE_UNITS}} ]
+        spec_matcher.add("PRESSURE_SPEC", [pressure_pattern1, pressure_pattern2])
+        quantity_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": SORTED_QUANTITY_TARGET_PARTS}, "OP": "+"} ]
+        quantity_pattern2 = [ {"LEMMA": {"IN": ["supply", "install", "deliver", "provide", "order", "fabricate", "build", "construct"]}}, {"LOWER": "of", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": SORTED_QUANTITY_TARGET_PARTS}, "OP": "+"} ]
+        spec_matcher.add("QUANTITY_SPEC", [quantity_pattern1, quantity_pattern2])
+        flow_cap_pattern1 = [ {"LOWER": {"IN": FLOW_CAPACITY_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has"]}}, {"LOWER": "a", "OP": "?"}, {"LOWER": {"IN": ["capacity", "flow", "rate", "throughput", "output"]}}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": FLOW_CAPACITY_UNITS}} ]
+        flow_cap_pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": FLOW_CAPACITY_UNITS}}, {"LOWER": {"IN": FLOW_CAPACITY_TARGET_PARTS}, "OP": "+"} ]
+        spec_matcher.add("FLOW_CAP_SPEC", [flow_cap_pattern1, flow_cap_pattern2])
+        temp_pattern1 = [ {"LOWER": {"IN": TEMP_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed", "operating"]}}, {"LOWER": {"IN": ["to", "at", "for"]}, "OP": "?"}, {"TEXT": {"REGEX": r"-?\d+"}}, {"LOWER": {"IN": TEMP_UNITS}} ]
+        spec_matcher.add("TEMP_SPEC", [temp_pattern1])
+        dimension_pattern1 = [ {"LOWER": {"IN": DIMENSION_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has", "measuring"]}, "OP": "?"}, {"LOWER": {"IN": ["dimensions", "a size"]}, "OP": "?"}, {"LOWER": "of", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["by", "x"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIMENSION_UNITS}, "OP": "?"} ]
+        spec_matcher.add("DIMENSION_SPEC", [dimension_pattern1])
+        accommodation_pattern1 = [ {"LOWER": {"IN": ["accommodation", "accommodate", "capacity"]}}, {"LOWER": "for", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ACCOMMODATION_UNITS}} ]
+        accommodation_pattern2 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-", "OP": "?"}, {"LOWER": {"IN": ACCOMMODATION_UNITS}}, {"LOWER": {"IN": ACCOMMODATION_TARGET_PARTS}, "OP": "+"} ]
+        spec_matcher.add("ACCOMMODATION_SPEC", [accommodation_pattern1, accommodation_pattern2])
+        storage_pattern1 = [ {"LOWER": {"IN": STORAGE_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has", "can"]}, "OP": "?"}, {"LOWER": "a", "OP": "?"}, {"LOWER": "storage"}, {"LOWER": "capacity"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand"]}, "OP": "?"}, {"LOWER": {"IN": STORAGE_UNITS}} ]
+        storage_pattern2 = [ {"LEMMA": "store"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand"]}, "OP": "?"}, {"LOWER": {"IN": STORAGE_UNITS}} ]
+        spec_matcher.add("STORAGE_SPEC", [storage_pattern1, storage_pattern2])
+        power_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": POWER_UNITS}}, {"LOWER": "power", "OP": "?"}, {"LOWER": {"IN": ["generation", "capacity", "output"]}, "OP": "?"}, {"LOWER": {"IN": POWER_TARGET_PARTS}, "OP": "+"} ]
+        spec_matcher.add("POWER_SPEC", [power_pattern1])
+
+        def parse_length_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_TARGET_BUILD_PART_NAMES, span_text_lower)
+            num_match = NUM_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                unit = LENGTH_UNIT_NORMALIZATION.get(unit.lower(), unit)
+                identified_spec_str = f"{value} {unit}"
+            else:
+                num_tok, unit_tok = last_num_unit(span, LENGTH_UNIT_SET)
+                if num_tok and unit_tok:
+                    identified_spec_str = f"{num_tok} {unit_tok}"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_weight_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_WEIGHT_TARGET_PART_NAMES, span_text_lower)
+            num_match = NUM_WEIGHT_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                value = value.replace(',', '')
+                unit = WEIGHT_UNIT_NORMALIZATION.get(unit.lower(), unit)
+                identified_spec_str = f"{value} {unit}"
+            else:
+                num_tok, unit_tok = last_num_unit(span, WEIGHT_UNIT_SET)
+                if num_tok and unit_tok:
+                    identified_spec_str = f"{num_tok} {unit_tok}"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_diameter_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_DIAMETER_TARGET_PART_NAMES, span_text_lower)
+            range_match = DIAMETER_RANGE_REGEX.search(span_text)
+            if range_match:
+                val1, val2, unit_str = range_match.groups()
+                val1 = val1.replace(',', '')
+                val2 = val2.replace(',', '')
+                unit = DIAMETER_RANGE_UNIT_NORMALIZATION.get(unit_str.lower(), unit_str.lower())
+                identified_spec_str = f"{val1}-{val2} {unit} diameter"
+            else:
+                num_match = NUM_DIAMETER_UNIT_REGEX.search(span_text)
+                if num_match:
+                    value, unit = num_match.groups()
+                    value = value.replace(',', '')
+                    unit = DIAMETER_UNIT_NORMALIZATION.get(unit.lower(), unit)
+                    identified_spec_str = f"{value} {unit} diameter"
+                else:
+                    num_tok, unit_tok = last_num_unit(span, DIAMETER_UNIT_SET)
+                    if num_tok and unit_tok:
+                        identified_spec_str = f"{num_tok} {unit_tok} diameter"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_depth_rating_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_DEPTH_RATING_TARGET_PART_NAMES, span_text_lower)
+            num_match = NUM_DEPTH_RATING_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                value = value.replace(',', '')
+                unit = DEPTH_RATING_UNIT_NORMALIZATION.get(unit.lower(), unit)
+                identified_spec_str = f"{value} {unit} depth"
+            else:
+                num_tok, unit_tok = last_num_unit(span, DEPTH_RATING_UNIT_SET)
+                if num_tok and unit_tok:
+                    identified_spec_str = f"{num_tok} {unit_tok} depth"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_pressure_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_PRESSURE_TARGET_PART_NAMES, span_text_lower)
+            num_match = NUM_PRESSURE_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                value = value.replace(',', '').lower()
+                if 'k' in value:
+                    value = str(int(float(value.replace('k', '')) * 1000))
+                identified_spec_str = f"{value} {unit.lower()}"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_quantity_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            num_token, num_val = None, None
+            for token in span:
+                if token.like_num:
+                    try:
+                        token_val = float(token.text)
+                    except ValueError:
+                        num_token, num_val = token, None
+                        continue
+                    if 1950 < token_val < 2100: continue
+                    num_token, num_val = token, token_val
+            identified_part_canonical = find_canonical_part(SORTED_QUANTITY_TARGET_PART_NAMES, span_text_lower)
+            if num_token and identified_part_canonical:
+                if not identified_part_canonical.endswith('s') and num_token.is_digit and num_val > 100:
+                    return None
+                identified_spec_str = f"{num_token.text} units"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_flow_capacity_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_FLOW_CAPACITY_TARGET_PART_NAMES, span_text_lower)
+            num_match = NUM_FLOW_CAPACITY_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                value = value.replace(',', '')
+                identified_spec_str = f"{value} {unit.lower()} capacity"
+            return identified_part_canonical, identified_spec_str
+
+        def parse_temperature_spec(span, span_text, span_text_lower):
+            identified_spec_str = None
+            identified_part_canonical = find_canonical_part(SORTED_TEMP_TARGET_PART_NAMES, span_text_lower) or find_canonical_part(SORTED_TEMP_TARGET_PART_NAMES, span.sent.text.lower())
+            num_match = NUM_TEMP_UNIT_REGEX.search(span_text)
+            if num_match:
+                value, unit = num_match.groups()
+                unit = unit.replace('°', '').lower()
+                unit = TEMP_UNIT_NORMALIZATION.get(unit, unit)
+                identified_spec_str = f"{value} {unit} temperature"
+            return identified_part_canonical, identified_spec_str
+
+        spec_parsers = {nlp.vocab.strings[label]: parser for label, parser in {"LENGTH_SPEC": parse_length_spec, "WEIGHT_SPEC": parse_weight_spec, "DIAMETER_SPEC": parse_diameter_spec, "DEPTH_RATING_SPEC": parse_depth_rating_spec, "PRESSURE_SPEC": parse_pressure_spec, "QUANTITY_SPEC": parse_quantity_spec, "FLOW_CAP_SPEC": parse_flow_capacity_spec, "TEMP_SPEC": parse_temperature_spec}.items()}
+
         def extract_build_part_specifications(text):
             text = clean_text(text)
-            if not text:
+            if not text or not SPEC_PRESCREEN_REGEX.search(text.lower()):
                 return ''
-            doc = nlp(text)
-            matcher = Matcher(nlp.vocab)
+            doc = parse(text)
+            text_lower = ensure_precomputed(doc)["text_lower"] # Merging parts keeps the text, so offsets still line up
+            part_spans = spacy.util.filter_spans(part_phrase_matcher(doc, as_spans=True))
+            if part_spans:
+                doc = Doc(nlp.vocab).from_bytes(doc.to_bytes(exclude=["user_data"]))
+                with doc.retokenize() as retokenizer:
+                    for part_span in part_spans:
+                        retokenizer.merge(doc[part_span.start:part_span.end])
             parsed_specs_set = set()
-            length_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
-            length_pattern1a = [ {"TEXT": {"REGEX": r"(?i)^\d+(\.\d+)?(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")$"}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
-            length_pattern2 = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}} ]
-            length_pattern2a = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"TEXT": {"REGEX": r"(?i)^\d+(\.\d+)?(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")$"}} ]
-            length_pattern3 = [ {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["measuring", "stretching", "spanning", "long"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": LENGTH_UNITS}} ]
-            length_pattern4 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-"}, {"LOWER": {"IN": [unit for unit in LENGTH_UNITS if unit not in LENGTH_UNITS_SHORT_EXACT]}}, {"LOWER": {"IN": TARGET_BUILD_PARTS}, "OP": "+"} ]
-            matcher.add("LENGTH_SPEC", [length_pattern1, length_pattern1a, length_pattern2, length_pattern2a, length_pattern3, length_pattern4])
-            weight_pattern1 = [{"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}, {"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}]
-            weight_pattern2 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
-            weight_pattern3 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "weighing"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
-            weight_pattern4 = [{"LOWER": {"IN": WEIGHT_TARGET_PARTS}, "OP": "+"}, {"LOWER": "with"}, {"LOWER": "a", "OP": "?"}, {"LOWER": "weight"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": WEIGHT_UNITS}}]
-            matcher.add("WEIGHT_SPEC", [weight_pattern1, weight_pattern2, weight_pattern3, weight_pattern4])
-            diameter_pattern1 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-", "OP": "?"}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "diameter", "OP": "?"}, {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"} ]
-            diameter_pattern2 = [ {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"}, {"LOWER": "with"}, {"LOWER": {"IN": ["a", "an"]}, "OP": "?"}, {"LOWER": "diameter"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}} ]
-            diameter_pattern3 = [ {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "in"}, {"LOWER": "diameter"} ]
-            diameter_pattern4 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["to", "-"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIAMETER_UNITS}}, {"LOWER": "diameter", "OP": "?"}, {"LOWER": {"IN": DIAMETER_TARGET_PARTS}, "OP": "+"} ]
-            matcher.add("DIAMETER_SPEC", [diameter_pattern1, diameter_pattern2, diameter_pattern3, diameter_pattern4])
-            depth_pattern1 = [ {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed"]}}, {"LOWER": "for"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": {"IN": ["depth", "water", "water depth"]}, "OP": "?"} ]
-            depth_pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": {"IN": ["depth", "water", "water depth"]}}, {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"} ]
-            depth_pattern3 = [ {"LOWER": {"IN": DEPTH_RATING_TARGET_PARTS}, "OP": "+"}, {"LOWER": "for"}, {"LIKE_NUM": True}, {"LOWER": {"IN": DEPTH_RATING_UNITS}}, {"LOWER": "water", "OP": "?"} ]
-            matcher.add("DEPTH_RATING_SPEC", [depth_pattern1, depth_pattern2, depth_pattern3])
-            pressure_pattern1 = [ {"TEXT": {"REGEX": r"[\d,]+(?:k|K)?"}}, {"LOWER": {"IN": PRESSURE_UNITS}}, {"LOWER": {"IN": PRESSURE_TARGET_PARTS}, "OP": "+"} ]
-            pressure_pattern2 = [ {"LOWER": {"IN": PRESSURE_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed"]}}, {"LOWER": "for", "OP": "?"}, {"TEXT": {"REGEX": r"[\d,]+(?:k|K)?"}}, {"LOWER": {"IN": PRESSURE_UNITS}} ]
-            matcher.add("PRESSURE_SPEC", [pressure_pattern1, pressure_pattern2])
-            quantity_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": SORTED_QUANTITY_TARGET_PARTS}, "OP": "+"} ]
-            quantity_pattern2 = [ {"LEMMA": {"IN": ["supply", "install", "deliver", "provide", "order", "fabricate", "build", "construct"]}}, {"LOWER": "of", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": SORTED_QUANTITY_TARGET_PARTS}, "OP": "+"} ]
-            matcher.add("QUANTITY_SPEC", [quantity_pattern1, quantity_pattern2])
-            flow_cap_pattern1 = [ {"LOWER": {"IN": FLOW_CAPACITY_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has"]}}, {"LOWER": "a", "OP": "?"}, {"LOWER": {"IN": ["capacity", "flow", "rate", "throughput", "output"]}}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": FLOW_CAPACITY_UNITS}} ]
-            flow_cap_pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": FLOW_CAPACITY_UNITS}}, {"LOWER": {"IN": FLOW_CAPACITY_TARGET_PARTS}, "OP": "+"} ]
-            matcher.add("FLOW_CAP_SPEC", [flow_cap_pattern1, flow_cap_pattern2])
-            temp_pattern1 = [ {"LOWER": {"IN": TEMP_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["rated", "designed", "operating"]}}, {"LOWER": {"IN": ["to", "at", "for"]}, "OP": "?"}, {"TEXT": {"REGEX": r"-?\d+"}}, {"LOWER": {"IN": TEMP_UNITS}} ]
-            matcher.add("TEMP_SPEC", [temp_pattern1])
-            dimension_pattern1 = [ {"LOWER": {"IN": DIMENSION_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has", "measuring"]}, "OP": "?"}, {"LOWER": {"IN": ["dimensions", "a size"]}, "OP": "?"}, {"LOWER": "of", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["by", "x"]}}, {"LIKE_NUM": True}, {"LOWER": {"IN": DIMENSION_UNITS}, "OP": "?"} ]
-            matcher.add("DIMENSION_SPEC", [dimension_pattern1])
-            accommodation_pattern1 = [ {"LOWER": {"IN": ["accommodation", "accommodate", "capacity"]}}, {"LOWER": "for", "OP": "?"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ACCOMMODATION_UNITS}} ]
-            accommodation_pattern2 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-", "OP": "?"}, {"LOWER": {"IN": ACCOMMODATION_UNITS}}, {"LOWER": {"IN": ACCOMMODATION_TARGET_PARTS}, "OP": "+"} ]
-            matcher.add("ACCOMMODATION_SPEC", [accommodation_pattern1, accommodation_pattern2])
-            storage_pattern1 = [ {"LOWER": {"IN": STORAGE_TARGET_PARTS}, "OP": "+"}, {"LOWER": {"IN": ["with", "has", "can"]}, "OP": "?"}, {"LOWER": "a", "OP": "?"}, {"LOWER": "storage"}, {"LOWER": "capacity"}, {"LOWER": "of"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand"]}, "OP": "?"}, {"LOWER": {"IN": STORAGE_UNITS}} ]
-            storage_pattern2 = [ {"LEMMA": "store"}, {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand"]}, "OP": "?"}, {"LOWER": {"IN": STORAGE_UNITS}} ]
-            matcher.add("STORAGE_SPEC", [storage_pattern1, storage_pattern2])
-            power_pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": POWER_UNITS}}, {"LOWER": "power", "OP": "?"}, {"LOWER": {"IN": ["generation", "capacity", "output"]}, "OP": "?"}, {"LOWER": {"IN": POWER_TARGET_PARTS}, "OP": "+"} ]
-            matcher.add("POWER_SPEC", [power_pattern1])
-            mooring_pattern1 = [ {"LIKE_NUM": True}, {"IS_PUNCT": True, "LOWER": "-", "OP": "?"}, {"LOWER": "point"}, {"LOWER": {"IN": MOORING_TYPES}, "OP": "?"}, {"LOWER": "mooring"}, {"LOWER": "system", "OP": "?"} ]
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                string_id = nlp.vocab.strings[match_id]
-                span = doc[start:end]
+            matches = spacy.util.filter_spans(spec_matcher(doc, as_spans=True))
+            for span in matches:
                 span_text = span.text
-                span_text_lower = span_text.lower()
-                identified_part_canonical = None
-                identified_spec_str = None
-                if string_id == "LENGTH_SPEC":
-                    for part_kw in SORTED_TARGET_BUILD_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    num_match = NUM_UNIT_REGEX_SPACED.search(span_text) or NUM_UNIT_REGEX_NOSPACE.search(span_text) or NUM_DASH_UNIT_REGEX.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        if unit.lower() in ["kilometer", "kilometers"]: unit = "km"
-                        elif unit.lower() in ["meter", "meters", "metres"]: unit = "m"
-                        elif unit.lower() in ["mile", "miles"]: unit = "miles"
-                        elif unit.lower() in ["foot", "feet"]: unit = "ft"
-                        identified_spec_str = f"{value} {unit}"
-                    else:
-                        num_tok, unit_tok = None, None
-                        for token in span:
-                            if token.like_num: num_tok = token.text
-                            if token.lower_ in LENGTH_UNITS: unit_tok = token.lower_
-                        if num_tok and unit_tok:
-                            identified_spec_str = f"{num_tok} {unit_tok}"
-                elif string_id == "WEIGHT_SPEC":
-                    for part_kw in SORTED_WEIGHT_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    num_match = NUM_WEIGHT_UNIT_REGEX_SPACED.search(span_text) or NUM_WEIGHT_UNIT_REGEX_NOSPACE.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        value = value.replace(',', '')
-                        if unit.lower() in ["tonne", "tonnes", "ton", "te"]: unit = "t"
-                        elif unit.lower() in ["kilogram", "kilograms"]: unit = "kg"
-                        elif unit.lower() in ["pound", "pounds"]: unit = "lbs"
-                        identified_spec_str = f"{value} {unit}"
-                    else:
-                        num_tok, unit_tok = None, None
-                        for token in span:
-                            if token.like_num: num_tok = token.text
-                            if token.lower_ in WEIGHT_UNITS: unit_tok = token.lower_
-                        if num_tok and unit_tok:
-                            identified_spec_str = f"{num_tok} {unit_tok}"
-                elif string_id == "DIAMETER_SPEC":
-                    for part_kw in SORTED_DIAMETER_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    range_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")", span_text, re.IGNORECASE)
-                    if range_match:
-                        val1, val2, unit_str = range_match.groups()
-                        val1 = val1.replace(',', '')
-                        val2 = val2.replace(',', '')
-                        if unit_str.lower() in ['inch', 'inches', '"']: unit = 'in'
-                        elif unit_str.lower() in ['millimeter', 'millimeters']: unit = 'mm'
-                        elif unit_str.lower() in ['centimeter', 'centimeters']: unit = 'cm'
-                        elif unit_str.lower() in ['meter', 'meters']: unit = 'm'
-                        elif unit_str.lower() in ['foot', 'feet']: unit = 'ft'
-                        else: unit = unit_str.lower()
-                        identified_spec_str = f"{val1}-{val2} {unit} diameter"
-                    else:
-                        num_match = NUM_DIAMETER_UNIT_REGEX_SPACED.search(span_text) or NUM_DASH_DIAMETER_UNIT_REGEX.search(span_text) or NUM_DIAMETER_UNIT_REGEX_NOSPACE.search(span_text)
-                        if num_match:
-                            value, unit = num_match.groups()
-                            value = value.replace(',', '')
-                            if unit.lower() in ['inch', 'inches', '"']: unit = 'in'
-                            elif unit.lower() in ['millimeter', 'millimeters']: unit = 'mm'
-                            elif unit.lower() in ['centimeter', 'centimeters']: unit = 'cm'
-                            elif unit.lower() in ['foot', 'feet']: unit = 'ft'
-                            identified_spec_str = f"{value} {unit} diameter"
-                        else:
-                            num_tok, unit_tok = None, None
-                            for token in span:
-                                if token.like_num: num_tok = token.text
-                                if token.lower_ in DIAMETER_UNITS: unit_tok = token.lower_
-                            if num_tok and unit_tok:
-                                identified_spec_str = f"{num_tok} {unit_tok} diameter"
-                elif string_id == "DEPTH_RATING_SPEC":
-                    for part_kw in SORTED_DEPTH_RATING_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    num_match = NUM_DEPTH_RATING_UNIT_REGEX.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        value = value.replace(',', '')
-                        if unit.lower() in ['meter', 'meters']: unit = 'm'
-                        elif unit.lower() in ['feet']: unit = 'ft'
-                        identified_spec_str = f"{value} {unit} depth"
-                    else:
-                        num_tok, unit_tok = None, None
-                        for token in span:
-                            if token.like_num: num_tok = token.text
-                            if token.lower_ in DEPTH_RATING_UNITS: unit_tok = token.lower_
-                        if num_tok and unit_tok:
-                            identified_spec_str = f"{num_tok} {unit_tok} depth"
-                elif string_id == "PRESSURE_SPEC":
-                    for part_kw in SORTED_PRESSURE_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    num_match = NUM_PRESSURE_UNIT_REGEX.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        value = value.replace(',', '').lower()
-                        if 'k' in value:
-                            value = str(int(float(value.replace('k', '')) * 1000))
-                        identified_spec_str = f"{value} {unit.lower()}"
-                elif string_id == "QUANTITY_SPEC":
-                    num_token, part_span = None, None
-                    for token in span:
-                        if token.like_num:
-                            try:
-                                num_val = float(token.text)
-                                if 1950 < num_val < 2100: continue
-                                num_token = token
-                            except ValueError:
-                                num_token = token
-                    for part_kw in SORTED_QUANTITY_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    if num_token and identified_part_canonical:
-                        if not identified_part_canonical.endswith('s') and num_token.is_digit and float(num_token.text) > 100:
-                            continue
-                        identified_spec_str = f"{num_token.text} units"
-                elif string_id == "FLOW_CAP_SPEC":
-                    for part_kw in SORTED_FLOW_CAPACITY_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            break
-                    num_match = NUM_FLOW_CAPACITY_UNIT_REGEX.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        value = value.replace(',', '')
-                        identified_spec_str = f"{value} {unit.lower()} capacity"
-                elif string_id == "TEMP_SPEC":
-                    part_found_in_span = False
-                    for part_kw in SORTED_TEMP_TARGET_PARTS:
-                        if part_kw.lower() in span_text_lower:
-                            identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                            part_found_in_span = True
-                            break
-                    if not part_found_in_span:
-                        sent_text_lower = span.sent.text.lower()
-                        for part_kw in SORTED_TEMP_TARGET_PARTS:
-                            if part_kw.lower() in sent_text_lower:
-                                identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                                break
-                    num_match = NUM_TEMP_UNIT_REGEX.search(span_text)
-                    if num_match:
-                        value, unit = num_match.groups()
-                        unit = unit.replace('°', '').lower()
-                        if unit == 'c': unit = 'Celsius'
-                        if unit == 'f': unit = 'Fahrenheit'
-                        identified_spec_str = f"{value} {unit} temperature"
+                spec_parser = spec_parsers.get(span.label)
+                spec = spec_parser(span, span_text, lower_span(text_lower, span)) if spec_parser else (None, None)
+                if spec is None:
+                    continue
+                identified_part_canonical, identified_spec_str = spec
                 if identified_part_canonical and identified_spec_str:
                     parsed_specs_set.add(f"{identified_part_canonical}: {identified_spec_str}")
                 else:
                     parsed_specs_set.add(span_text.strip())
             return ', '.join(sorted(list(parsed_specs_set))) if parsed_specs_set else ''
 
-        def filter_companies(company_list, text):
+        def filter_companies(company_list, text, doc=None):
             if not company_list:
                 return []
-            doc = nlp(text) 
+            if doc is None:
+                doc = parse(text)
             filtered = set()
-            designators = ['co\\.', 'inc\\.', 'ltd\\.', 'gmbh', 'llc', 'corp\\.', 'plc', 'group', 'solutions', 'energy', 'oil & gas', 'international', 'holdings', 'corporation', 'industries', 'ventures', 'resources', 'services', 'systems']
-            known_companies = ["Saudi Aramco", "Petronas", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor", "Chevron", "ConocoPhillips", "ENI", "Sinopec", "CNPC", "Gazprom", "Baker Hughes", "Schlumberger", "Halliburton", "TechnipFMC", "Subsea 7", "Saipem", "McDermott", "Wood", "Worley"]
+            org_ents = [(ent.text, len(ent.text.split()), bool(COMPANY_DESIGNATOR_REGEX.search(ent.text.lower())) or ent.text in KNOWN_COMPANY_SET) for ent in doc.ents if ent.label_ == 'ORG']
             for company_name_str in company_list: 
                 company_name = str(company_name_str).strip() 
+                company_name_lower = company_name.lower()
                 found = False
-                for kc in known_companies:
-                    if kc.lower() in company_name.lower() or company_name.lower() in kc.lower():
+                for kc_lower, kc in KNOWN_COMPANIES_LOWER:
+                    if kc_lower in company_name_lower or company_name_lower in kc_lower:
                         filtered.add(kc)
                         found = True
                         break
                 if found: continue
-                if any(re.search(r'\b' + d + r'\b', company_name.lower()) for d in designators):
+                if COMPANY_DESIGNATOR_REGEX.search(company_name_lower):
                     filtered.add(company_name)
                     continue
-                for ent in doc.ents:
-                    if ent.label_ == 'ORG' and company_name in ent.text and len(ent.text.split()) > len(company_name.split()):
-                        if any(re.search(r'\b' + d + r'\b', ent.text.lower()) for d in designators) or ent.text in known_companies:
-                            filtered.add(ent.text)
+                company_name_words = len(company_name.split())
+                for ent_text, ent_words, ent_is_company in org_ents:
+                    if company_name in ent_text and ent_words > company_name_words:
+                        if ent_is_company:
+                            filtered.add(ent_text)
                             found = True
                             break
                 if found: continue
                 if len(company_name.split()) == 1:
-                    if company_name.lower() in ["technology", "industrial", "energy", "company", "group", "systems", "solutions"]:
+                    if company_name_lower in ["technology", "industrial", "energy", "company", "group", "systems", "solutions"]:
                         continue
-                    if re.search(r'\b' + re.escape(company_name) + r'\s+(?:' + '|'.join(designators) + r')\b', text, re.IGNORECASE) or \
-                       re.search(r'\b(?:' + '|'.join(designators) + r')\s+' + re.escape(company_name) + r'\b', text, re.IGNORECASE) or \
+                    if designator_context_regex(company_name).search(text) or \
                        company_name in ["Aramco", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor"]: 
                         filtered.add(company_name)
                         continue
@@ -1228,10 +1793,10 @@ class AppWindow(QMainWindow):
         def extract_entities_by_label_refined(text, labels):
             text = clean_text(text)
             if not text: return ''
-            doc = nlp(text)
+            doc = parse(text)
             entities = [ent.text.strip() for ent in doc.ents if ent.label_ in labels]
             if 'ORG' in labels:
-                entities = filter_companies(entities, text) 
+                entities = filter_companies(entities, text, doc) 
             return ', '.join(sorted(set(entities)))
 
         def extract_scope_keywords(text):
@@ -1239,80 +1804,90 @@ class AppWindow(QMainWindow):
             if not text: return ''
             text_lower = text.lower()
             found_keywords = set()
-            for kw in ALL_BUILD_KEYWORDS:
-                if re.search(r'\b' + re.escape(kw.lower()) + r'\b', text_lower):
-                    found_keywords.add(kw)
-                elif len(kw.split()) > 1 and kw.lower() in text_lower:
-                    found_keywords.add(kw)
+            for kw_lower in find_keywords(SCOPE_KEYWORD_SCANNER, text_lower):
+                for kw, is_phrase in SCOPE_KEYWORDS_BY_LOWER[kw_lower]:
+                    if is_phrase or SCOPE_KEYWORD_REGEXES[kw_lower].search(text_lower):
+                        found_keywords.add(kw)
             return ', '.join(sorted(found_keywords))
 
         def extract_delays_dates(text):
             text = clean_text(text)
             if not text: return ''
-            doc = nlp(text)
-            delay_keywords = ['delay', 'postpone', 'push back', 'reschedule', 'deadline', 'extension', 'setback', 'deferment']
-            mentions_delay = any(kw in text.lower() for kw in delay_keywords)
-            if mentions_delay:
-                relevant_dates = []
-                for date_ent in doc.ents:
-                    if date_ent.label_ == 'DATE':
-                        span_around_date = doc[max(0, date_ent.start - 10):min(len(doc), date_ent.end + 10)].text.lower()
-                        if any(kw in span_around_date for kw in delay_keywords):
-                            relevant_dates.append(date_ent.text)
-                return ', '.join(sorted(set(relevant_dates)))
-            return ''
+            if not DELAY_KEYWORD_REGEX.search(text.lower()):
+                return ''
+            doc = parse(text)
+            relevant_dates = []
+            delay_sents = {}
+            for date_ent in doc.ents:
+                if date_ent.label_ == 'DATE':
+                    sent = date_ent.sent
+                    if sent.start not in delay_sents:
+                        delay_sents[sent.start] = bool(DELAY_KEYWORD_REGEX.search(sent.text.lower()))
+                    if delay_sents[sent.start]:
+                        relevant_dates.append(date_ent.text)
+            return ', '.join(sorted(set(relevant_dates)))
 
         def extract_budget(text):
             text = clean_text(text)
             if not text: return ''
-            doc = nlp(text)
+            doc = parse(text)
             money_entities = [ent.text for ent in doc.ents if ent.label_ == 'MONEY']
-            money_patterns = re.findall( r'\b(?:USD|EUR|GBP|A?\$|€|£)\s?\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)?\b|\b\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)\s*(?:USD|EUR|GBP|A?\$|€|£)?\b', text, re.IGNORECASE )
+            money_patterns = BUDGET_MONEY_REGEX.findall(text)
             all_money = list(set(money_entities + money_patterns))
             return ', '.join(sorted(all_money))
 
         def extract_quotes(text):
             text = clean_text(text)
             if not text: return ''
-            return ' | '.join(re.findall(r'"(.*?)"', text))
+            return ' | '.join(m.group(1) for m in QUOTE_REGEX.finditer(text))
+
+        # Status matching only reads LOWER/LEMMA/POS, so its lowercased parse skips the parser and NER.
+        status_disabled_pipes = [name for name in ("parser", "ner") if name in nlp.pipe_names]
+        status_patterns = {}
+        decommissioning_patterns = [ [{"LOWER": "plug"}, {"LOWER": "and"}, {"LOWER": "abandon"}], [{"LOWER": "p&a"}], [{"LEMMA": "decommission"}] ]
+        status_patterns["DECOMMISSIONING_STATUS"] = decommissioning_patterns
+        awarded_patterns = [ [{"LEMMA": "contract"}, {"LEMMA": "award"}], [{"LEMMA": "award"}, {"LEMMA": "contract"}], [{"LEMMA": "sign"}, {"LEMMA": "contract"}], [{"LEMMA": "contract"}, {"LEMMA": "sign"}], [{"LEMMA": "deal"}, {"LEMMA": "sign"}], [{"LEMMA": "agreement"}, {"LEMMA": "sign"}], [{"LEMMA": "award"}], [{"LEMMA": "secure"}], [{"LEMMA": "win"}], [{"LOWER": "letter"}, {"LOWER": "of"}, {"LOWER": "intent"}], [{"LOWER": "memorandum"}, {"LOWER": "of"}, {"LOWER": "understanding"}], [{"LOWER": "reach"}, {"LOWER": "agreement"}] ]
+        status_patterns["AWARDED_STATUS"] = awarded_patterns
+        tendered_patterns = [ [{"LEMMA": "tender"}, {"LEMMA": "issue"}], [{"LOWER": "invitation"}, {"LOWER": "to"}, {"LOWER": "bid"}], [{"LOWER": "pre-qualification"}], [{"LEMMA": "bid"}, {"LEMMA": "process"}], [{"LOWER": "call"}, {"LOWER": "for"}, {"LOWER": "tenders"}], [{"LEMMA": "tender"}, {"LEMMA": "launch"}], [{"LEMMA": "request"}, {"LOWER": "for"}, {"LOWER": "proposal"}], [{"LOWER": "rfp"}], [{"LOWER": "expressions"}, {"LOWER": "of"}, {"LOWER": "interest"}], [{"LOWER": "inviting"}, {"LOWER": "bids"}] ]
+        status_patterns["TENDERED_STATUS"] = tendered_patterns
+        planned_patterns = [ [{"LOWER": {"IN": ["project", "field", "development"]}}, {"LEMMA": "plan"}], [{"LEMMA": "plan"}, {"POS": "PART", "OP": "?"}, {"LEMMA": "to"}, {"LOWER": {"IN": ["develop", "build", "construct", "start", "proceed"]}}], [{"LOWER": "new"}, {"LOWER": {"IN": ["project", "development", "field"]}}, {"LEMMA": "propose"}], [{"LOWER": "feasibility"}, {"LOWER": "study"}], [{"LOWER": "concept"}, {"LOWER": "study"}], [{"LOWER": "pre-feed"}], [{"LOWER": "front-end"}, {"LOWER": "engineering"}, {"LOWER": "design"}], [{"LOWER": "conceptual"}, {"LOWER": "design"}], [{"LOWER": "environmental"}, {"LOWER": "impact"}, {"LOWER": "assessment"}], [{"LOWER": "considering"}, {"LOWER": "a"}, {"LOWER": {"IN": ["new", "potential"]}}, {"LOWER": "project"}], [{"LOWER": "exploring"}, {"LOWER": "options"}], [{"LOWER": "potential"}, {"LOWER": "development"}], [{"LOWER": "earmarked"}, {"LOWER": "for"}, {"LOWER": "development"}], [{"LOWER": "set"}, {"LOWER": "to"}, {"LOWER": "begin"}], [{"LOWER": "expected"}, {"LOWER": "to"}, {"LOWER": "start"}], ]
+        status_patterns["PLANNED_STATUS"] = planned_patterns
+        under_construction_patterns = [ [{"LOWER": "under"}, {"LOWER": "construction"}], [{"LOWER": "being"}, {"LEMMA": "build"}], [{"LOWER": "ongoing"}, {"LEMMA": "develop"}], [{"LEMMA": "fabrication"}, {"LOWER": "underway"}], [{"LEMMA": "construction"}, {"LOWER": "ongoing"}], [{"LEMMA": "install"}], [{"LEMMA": "drilling"}, {"LOWER": "commence"}], [{"LOWER": "drilling"}, {"LOWER": "campaign"}], [{"LOWER": "work"}, {"LOWER": "begun"}], [{"LOWER": "construction"}, {"LEMMA": "progress"}], [{"LOWER": "hook-up"}, {"LOWER": "and"}, {"LOWER": "commissioning"}], [{"LOWER": "nearing"}, {"LOWER": "completion"}], ]
+        status_patterns["UNDER_CONSTRUCTION_STATUS"] = under_construction_patterns
+        completed_patterns = [ [{"LEMMA": "complete"}], [{"LEMMA": "commission"}], [{"LOWER": "online"}], [{"LEMMA": "production"}, {"LEMMA": "start"}], [{"LOWER": "handed"}, {"LOWER": "over"}], [{"LEMMA": "deliver"}], [{"LEMMA": "achieve"}, {"LOWER": "first"}, {"LOWER": "oil"}], [{"LOWER": "first"}, {"LOWER": "gas"}], [{"LOWER": "brought"}, {"LOWER": "into"}, {"LOWER": "production"}], [{"LOWER": "commence"}, {"LOWER": "production"}], [{"LOWER": "fully"}, {"LOWER": "operational"}], [{"LOWER": "production"}, {"LOWER": "began"}] ]
+        status_patterns["COMPLETED_STATUS"] = completed_patterns
+        delayed_patterns = [ [{"LEMMA": {"IN": ["delay", "postpone", "reschedule", "defer", "stall", "halt"]}}], [{"LOWER": "push"}, {"LOWER": "back"}], [{"LOWER": "pushed"}, {"LOWER": "out"}], [{"LEMMA": "setback"}], [{"LEMMA": "deferment"}], [{"LOWER": "on"}, {"LOWER": "hold"}], [{"LEMMA": "suspension"}], [{"LEMMA": "slippage"}], [{"LOWER": "behind"}, {"LOWER": "schedule"}], [{"LOWER": "timeline"}, {"LEMMA": "extension"}], [{"LEMMA": "late"}], [{"LOWER": "running"}, {"LOWER": "late"}], [{"LOWER": "experiencing"}, {"LEMMA": "delay", "OP": "+"}], [{"LEMMA": "face"}, {"LEMMA": "delay", "OP": "+"}] ]
+        status_patterns["DELAYED_STATUS"] = delayed_patterns
+        cancelled_patterns = [ [{"LEMMA": {"IN": ["cancel", "scrap", "terminate", "shelve", "withdraw"]}}], [{"LEMMA": "abandon"}, {"LOWER": {"IN": ["project", "plan", "development", "effort", "initiative"]}}], [{"LEMMA": "halted"}], [{"LOWER": "not"}, {"LOWER": "proceed"}], [{"LOWER": "no"}, {"LOWER": "longer"}, {"LOWER": "planned"}], [{"LOWER": "no"}, {"LOWER": "longer"}, {"LEMMA": "pursue"}], [{"LOWER": "project"}, {"LOWER": "fail"}], [{"LOWER": {"IN": ["contract", "agreement"]}}, {"LEMMA": "terminate"}], [{"LOWER": "project"}, {"LEMMA": "terminate"}], [{"LOWER": "pull"}, {"LOWER": "the"}, {"LOWER": "plug"}], [{"LOWER": "put"}, {"LOWER": "on"}, {"LOWER": "ice"}], [{"LEMMA": "suspend"}, {"LOWER": "indefinitely"}] ]
+        status_patterns["CANCELLED_STATUS"] = cancelled_patterns
+        fid_patterns = [ [{"LOWER": "final"}, {"LOWER": "investment"}, {"LOWER": "decision"}], [{"LOWER": "fid"}] ]
+        status_patterns["FID_STATUS"] = fid_patterns
+        status_names = { "AWARDED_STATUS": 'awarded', "TENDERED_STATUS": 'tendered', "PLANNED_STATUS": 'planned', "UNDER_CONSTRUCTION_STATUS": 'under construction', "COMPLETED_STATUS": 'completed', "DELAYED_STATUS": 'delayed', "CANCELLED_STATUS": 'cancelled', "FID_STATUS": 'FID', "DECOMMISSIONING_STATUS": 'decommissioning' }
+        status_matchers_by_priority = []
+        for label in ["CANCELLED_STATUS", "DECOMMISSIONING_STATUS", "COMPLETED_STATUS", "DELAYED_STATUS", "FID_STATUS", "AWARDED_STATUS", "UNDER_CONSTRUCTION_STATUS", "TENDERED_STATUS", "PLANNED_STATUS"]:
+            priority_matcher = Matcher(nlp.vocab)
+            priority_matcher.add(label, status_patterns[label])
+            status_matchers_by_priority.append((status_names[label], priority_matcher))
 
         def extract_project_status(text):
             text = clean_text(text).lower()
             if not text: return ''
-            doc = nlp(text)
-            found_statuses = set()
-            matcher = Matcher(nlp.vocab)
-            decommissioning_patterns = [ [{"LOWER": "plug"}, {"LOWER": "and"}, {"LOWER": "abandon"}], [{"LOWER": "p&a"}], [{"LEMMA": "decommission"}] ]
-            matcher.add("DECOMMISSIONING_STATUS", decommissioning_patterns)
-            awarded_patterns = [ [{"LEMMA": "contract"}, {"LEMMA": "award"}], [{"LEMMA": "award"}, {"LEMMA": "contract"}], [{"LEMMA": "sign"}, {"LEMMA": "contract"}], [{"LEMMA": "contract"}, {"LEMMA": "sign"}], [{"LEMMA": "deal"}, {"LEMMA": "sign"}], [{"LEMMA": "agreement"}, {"LEMMA": "sign"}], [{"LEMMA": "award"}], [{"LEMMA": "secure"}], [{"LEMMA": "win"}], [{"LOWER": "letter"}, {"LOWER": "of"}, {"LOWER": "intent"}], [{"LOWER": "memorandum"}, {"LOWER": "of"}, {"LOWER": "understanding"}], [{"LOWER": "reach"}, {"LOWER": "agreement"}] ]
-            matcher.add("AWARDED_STATUS", awarded_patterns)
-            tendered_patterns = [ [{"LEMMA": "tender"}, {"LEMMA": "issue"}], [{"LOWER": "invitation"}, {"LOWER": "to"}, {"LOWER": "bid"}], [{"LOWER": "pre-qualification"}], [{"LEMMA": "bid"}, {"LEMMA": "process"}], [{"LOWER": "call"}, {"LOWER": "for"}, {"LOWER": "tenders"}], [{"LEMMA": "tender"}, {"LEMMA": "launch"}], [{"LEMMA": "request"}, {"LOWER": "for"}, {"LOWER": "proposal"}], [{"LOWER": "rfp"}], [{"LOWER": "expressions"}, {"LOWER": "of"}, {"LOWER": "interest"}], [{"LOWER": "inviting"}, {"LOWER": "bids"}] ]
-            matcher.add("TENDERED_STATUS", tendered_patterns)
-            planned_patterns = [ [{"LOWER": {"IN": ["project", "field", "development"]}}, {"LEMMA": "plan"}], [{"LEMMA": "plan"}, {"POS": "PART", "OP": "?"}, {"LEMMA": "to"}, {"LOWER": {"IN": ["develop", "build", "construct", "start", "proceed"]}}], [{"LOWER": "new"}, {"LOWER": {"IN": ["project", "development", "field"]}}, {"LEMMA": "propose"}], [{"LOWER": "feasibility"}, {"LOWER": "study"}], [{"LOWER": "concept"}, {"LOWER": "study"}], [{"LOWER": "pre-feed"}], [{"LOWER": "front-end"}, {"LOWER": "engineering"}, {"LOWER": "design"}], [{"LOWER": "conceptual"}, {"LOWER": "design"}], [{"LOWER": "environmental"}, {"LOWER": "impact"}, {"LOWER": "assessment"}], [{"LOWER": "considering"}, {"LOWER": "a"}, {"LOWER": {"IN": ["new", "potential"]}}, {"LOWER": "project"}], [{"LOWER": "exploring"}, {"LOWER": "options"}], [{"LOWER": "potential"}, {"LOWER": "development"}], [{"LOWER": "earmarked"}, {"LOWER": "for"}, {"LOWER": "development"}], [{"LOWER": "set"}, {"LOWER": "to"}, {"LOWER": "begin"}], [{"LOWER": "expected"}, {"LOWER": "to"}, {"LOWER": "start"}], ]
-            matcher.add("PLANNED_STATUS", planned_patterns)
-            under_construction_patterns = [ [{"LOWER": "under"}, {"LOWER": "construction"}], [{"LOWER": "being"}, {"LEMMA": "build"}], [{"LOWER": "ongoing"}, {"LEMMA": "develop"}], [{"LEMMA": "fabrication"}, {"LOWER": "underway"}], [{"LEMMA": "construction"}, {"LOWER": "ongoing"}], [{"LEMMA": "install"}], [{"LEMMA": "drilling"}, {"LOWER": "commence"}], [{"LOWER": "drilling"}, {"LOWER": "campaign"}], [{"LOWER": "work"}, {"LOWER": "begun"}], [{"LOWER": "construction"}, {"LEMMA": "progress"}], [{"LOWER": "hook-up"}, {"LOWER": "and"}, {"LOWER": "commissioning"}], [{"LOWER": "nearing"}, {"LOWER": "completion"}], ]
-            matcher.add("UNDER_CONSTRUCTION_STATUS", under_construction_patterns)
-            completed_patterns = [ [{"LEMMA": "complete"}], [{"LEMMA": "commission"}], [{"LOWER": "online"}], [{"LEMMA": "production"}, {"LEMMA": "start"}], [{"LOWER": "handed"}, {"LOWER": "over"}], [{"LEMMA": "deliver"}], [{"LEMMA": "achieve"}, {"LOWER": "first"}, {"LOWER": "oil"}], [{"LOWER": "first"}, {"LOWER": "gas"}], [{"LOWER": "brought"}, {"LOWER": "into"}, {"LOWER": "production"}], [{"LOWER": "commence"}, {"LOWER": "production"}], [{"LOWER": "fully"}, {"LOWER": "operational"}], [{"LOWER": "production"}, {"LOWER": "began"}] ]
-            matcher.add("COMPLETED_STATUS", completed_patterns)
-            delayed_patterns = [ [{"LEMMA": {"IN": ["delay", "postpone", "reschedule", "defer", "stall", "halt"]}}], [{"LOWER": "push"}, {"LOWER": "back"}], [{"LOWER": "pushed"}, {"LOWER": "out"}], [{"LEMMA": "setback"}], [{"LEMMA": "deferment"}], [{"LOWER": "on"}, {"LOWER": "hold"}], [{"LEMMA": "suspension"}], [{"LEMMA": "slippage"}], [{"LOWER": "behind"}, {"LOWER": "schedule"}], [{"LOWER": "timeline"}, {"LEMMA": "extension"}], [{"LEMMA": "late"}], [{"LOWER": "running"}, {"LOWER": "late"}], [{"LOWER": "experiencing"}, {"LEMMA": "delay", "OP": "+"}], [{"LEMMA": "face"}, {"LEMMA": "delay", "OP": "+"}] ]
-            matcher.add("DELAYED_STATUS", delayed_patterns)
-            cancelled_patterns = [ [{"LEMMA": {"IN": ["cancel", "scrap", "terminate", "shelve", "withdraw"]}}], [{"LEMMA": "abandon"}, {"LOWER": {"IN": ["project", "plan", "development", "effort", "initiative"]}}], [{"LEMMA": "halted"}], [{"LOWER": "not"}, {"LOWER": "proceed"}], [{"LOWER": "no"}, {"LOWER": "longer"}, {"LOWER": "planned"}], [{"LOWER": "no"}, {"LOWER": "longer"}, {"LEMMA": "pursue"}], [{"LOWER": "project"}, {"LOWER": "fail"}], [{"LOWER": {"IN": ["contract", "agreement"]}}, {"LEMMA": "terminate"}], [{"LOWER": "project"}, {"LEMMA": "terminate"}], [{"LOWER": "pull"}, {"LOWER": "the"}, {"LOWER": "plug"}], [{"LOWER": "put"}, {"LOWER": "on"}, {"LOWER": "ice"}], [{"LEMMA": "suspend"}, {"LOWER": "indefinitely"}] ]
-            matcher.add("CANCELLED_STATUS", cancelled_patterns)
-            fid_patterns = [ [{"LOWER": "final"}, {"LOWER": "investment"}, {"LOWER": "decision"}], [{"LOWER": "fid"}] ]
-            matcher.add("FID_STATUS", fid_patterns)
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                string_id = nlp.vocab.strings[match_id]
-                status_map = { "AWARDED_STATUS": 'awarded', "TENDERED_STATUS": 'tendered', "PLANNED_STATUS": 'planned', "UNDER_CONSTRUCTION_STATUS": 'under construction', "COMPLETED_STATUS": 'completed', "DELAYED_STATUS": 'delayed', "CANCELLED_STATUS": 'cancelled', "FID_STATUS": 'FID', "DECOMMISSIONING_STATUS": 'decommissioning' }
-                if string_id in status_map:
-                    found_statuses.add(status_map[string_id])
-            priority_order = ['cancelled', 'decommissioning', 'completed', 'delayed', 'FID', 'awarded', 'under construction', 'tendered', 'planned']
-            for status in priority_order:
-                if status in found_statuses:
+            doc = parse(text, disable=status_disabled_pipes)
+            for status, priority_matcher in status_matchers_by_priority:
+                if priority_matcher(doc):
                     return status
             return ''
 
-        def find_capacity_subject(capacity_span, doc):
+        def index_noun_chunks(doc):
+            chunks = list(doc.noun_chunks)
+            chunk_by_token = [None] * len(doc)
+            for chunk in chunks:
+                for i in range(chunk.start, chunk.end):
+                    chunk_by_token[i] = chunk
+            return chunks, [chunk.start for chunk in chunks], chunk_by_token
+
+        def find_capacity_subject(capacity_span, doc, chunk_index=None):
+            chunks, chunk_starts, chunk_by_token = chunk_index or index_noun_chunks(doc)
             verb = None
             for ancestor in capacity_span.root.ancestors:
                 if ancestor.pos_ == "VERB":
@@ -1321,52 +1896,49 @@ class AppWindow(QMainWindow):
             if verb:
                 subjects = [child for child in verb.children if child.dep_ in ("nsubj", "nsubjpass")]
                 if subjects:
-                    subject_root = subjects[0]
-                    for chunk in doc.noun_chunks:
-                        if subject_root in chunk:
-                            name = " ".join(tok.text for tok in chunk if tok.pos_ not in ['DET', 'PRON'])
-                            return name.strip()
-            if capacity_span.root.head.text.lower() in ['of', 'for']:
-                owner = capacity_span.root.head.head
-                for chunk in doc.noun_chunks:
-                    if owner in chunk:
+                    chunk = chunk_by_token[subjects[0].i]
+                    if chunk is not None:
                         name = " ".join(tok.text for tok in chunk if tok.pos_ not in ['DET', 'PRON'])
-                        if name.lower() not in ["capacity", "production", "output", "throughput"]:
-                            return name.strip()
+                        return name.strip()
+            if capacity_span.root.head.text.lower() in ['of', 'for']:
+                chunk = chunk_by_token[capacity_span.root.head.head.i]
+                if chunk is not None:
+                    name = " ".join(tok.text for tok in chunk if tok.pos_ not in ['DET', 'PRON'])
+                    if name.lower() not in ["capacity", "production", "output", "throughput"]:
+                        return name.strip()
             window_start = max(0, capacity_span.start - 15)
-            context_window_chunks = [chunk for chunk in doc.noun_chunks if chunk.end <= capacity_span.start and chunk.start >= window_start]
+            context_window_chunks = chunks[bisect_left(chunk_starts, window_start):bisect_right(chunk_starts, capacity_span.start)]
             for chunk in reversed(context_window_chunks):
-                chunk_text_lower = chunk.text.lower()
-                if any(kw in chunk_text_lower for keywords in ENTITY_KEYWORDS_FOR_CAPACITY.values() for kw in keywords):
+                if chunk.end <= capacity_span.start and CAPACITY_ENTITY_KEYWORD_REGEX.search(chunk.text.lower()):
                     name = " ".join(tok.text for tok in chunk if tok.pos_ not in ['DET', 'PRON'])
                     return name.strip()
-            sent = capacity_span.sent
-            for entity_type, keywords in ENTITY_KEYWORDS_FOR_CAPACITY.items():
-                if any(kw in sent.text.lower() for kw in keywords):
+            sent_text_lower = capacity_span.sent.text.lower()
+            for entity_type, keyword_regex in CAPACITY_ENTITY_TYPE_REGEXES:
+                if keyword_regex.search(sent_text_lower):
                     return f"({entity_type})"
             return None
 
+        CAPACITY_UNITS_REGEX = r"bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|gj/d|tonnes/year|t/y|t/d|barrels of oil equivalent per day|cubic feet per day|m3/d|tonne/day|barrels per day|cubic meters per day|tonnes per day"
+        CAPACITY_NOUNS_REGEX = r"barrels|cubic|feet|meters|tonnes|bbl|cf|m3|boe"
+        TIME_UNITS_REGEX = r"day|d|hour|hr|h|year|yr|y|annum"
+        capacity_matcher = Matcher(nlp.vocab)
+        pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand", "mn", "bn", "k"]}, "OP": "?"}, {"LOWER": {"REGEX": CAPACITY_UNITS_REGEX}}, ]
+        pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand", "mn", "bn", "k"]}}, {"LOWER": {"REGEX": CAPACITY_NOUNS_REGEX}}, {"LOWER": "per"}, {"LOWER": {"REGEX": TIME_UNITS_REGEX}}, ]
+        pattern3 = [ {"LIKE_NUM": True}, {"LOWER": {"REGEX": CAPACITY_NOUNS_REGEX}}, {"LOWER": "per", "OP": "?"}, {"LOWER": {"REGEX": TIME_UNITS_REGEX}, "OP": "?"}, ]
+        capacity_matcher.add("PRODUCTION_CAPACITY", [pattern1, pattern2, pattern3])
+
         def extract_production_capacity_refined(text):
             text = clean_text(text)
             if not text: return ''
-            doc = nlp(text)
+            doc = parse(text)
             extracted_capacities = set()
-            CAPACITY_UNITS_REGEX = r"bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|gj/d|tonnes/year|t/y|t/d|barrels of oil equivalent per day|cubic feet per day|m3/d|tonne/day|barrels per day|cubic meters per day|tonnes per day"
-            CAPACITY_NOUNS_REGEX = r"barrels|cubic|feet|meters|tonnes|bbl|cf|m3|boe"
-            TIME_UNITS_REGEX = r"day|d|hour|hr|h|year|yr|y|annum"
-            capacity_matcher = Matcher(nlp.vocab)
-            pattern1 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand", "mn", "bn", "k"]}, "OP": "?"}, {"LOWER": {"REGEX": CAPACITY_UNITS_REGEX}}, ]
-            pattern2 = [ {"LIKE_NUM": True}, {"LOWER": {"IN": ["million", "billion", "thousand", "mn", "bn", "k"]}}, {"LOWER": {"REGEX": CAPACITY_NOUNS_REGEX}}, {"LOWER": "per"}, {"LOWER": {"REGEX": TIME_UNITS_REGEX}}, ]
-            pattern3 = [ {"LIKE_NUM": True}, {"LOWER": {"REGEX": CAPACITY_NOUNS_REGEX}}, {"LOWER": "per", "OP": "?"}, {"LOWER": {"REGEX": TIME_UNITS_REGEX}, "OP": "?"}, ]
-            capacity_matcher.add("PRODUCTION_CAPACITY", [pattern1, pattern2, pattern3])
-            matches = capacity_matcher(doc)    
-            spans = [doc[start:end] for _, start, end in matches]
-            filtered_spans = spacy.util.filter_spans(spans)
+            filtered_spans = spacy.util.filter_spans(capacity_matcher(doc, as_spans=True))
+            chunk_index = index_noun_chunks(doc) if filtered_spans else None
             for span in filtered_spans:
                 is_irrelevant = any(ent.label_ in ['DATE', 'MONEY'] for ent in span.sent.ents if ent.start < span.end and ent.end > span.start)
                 if is_irrelevant: continue
                 capacity_text = " ".join(span.text.split())
-                subject = find_capacity_subject(span, doc)
+                subject = find_capacity_subject(span, doc, chunk_index)
                 if subject:
                     if subject.startswith("(") and subject.endswith(")"):
                         extracted_capacities.add(f"{capacity_text} {subject}")
@@ -1376,33 +1948,33 @@ class AppWindow(QMainWindow):
                     extracted_capacities.add(capacity_text)
             return ', '.join(sorted(list(extracted_capacities)))
 
+        contract_matcher = Matcher(nlp.vocab)
+        pattern1 = [ {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}}, {"LEMMA": {"IN": ["contract", "agreement", "deal", "accord", "pact", "charter", "lease", "terms"]}} ]
+        contract_matcher.add("CONTRACT_TYPE_PHRASE_1", [pattern1])
+        pattern2 = [ {"LEMMA": {"IN": ["contract", "agreement"]}}, {"LOWER": {"IN": ["for", "to"]}, "OP": "?"}, {"LOWER": {"IN": ["the", "provide"]}, "OP": "?"}, {"LOWER": "of", "OP": "?"}, {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}} ]
+        contract_matcher.add("CONTRACT_TYPE_PHRASE_2", [pattern2])
+        pattern3 = [ {"LEMMA": {"IN": ["award", "sign", "secure", "win", "enter", "finalize", "negotiate", "issue", "grant", "land"]}}, {"LOWER": {"IN": ["a", "an", "the"]}, "OP": "?"}, {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}}, {"LEMMA": {"IN": ["contract", "agreement", "deal"]}, "OP": "?"} ]
+        contract_matcher.add("VERB_CONTRACT_TYPE", [pattern3])
+
         def extract_contract_types(text):
             text = clean_text(text)
             if not text: return ''
-            contract_keywords_list = [ 'EPC', 'EPCI', 'EPCC', 'FEED', 'LSTK', 'MOU', 'joint venture', 'framework agreement', 'EPMC', 'EPC-E', 'EPC-E/E', 'service agreement', 'subcontract', 'supply agreement', 'alliance agreement', 'lease agreement', 'charter agreement', 'drilling contract', 'construction contract', 'maintenance contract', 'operation and maintenance', 'O&M', 'engineering contract', 'procurement contract', 'turnkey contract', 'build-own-operate-transfer', 'BOOT', 'production sharing agreement', 'PSA', 'rig contract', 'vessel contract', 'consultancy contract' ]
-            doc = nlp(text)
+            doc = parse(text)
             found_contract_types = set()
-            matcher = Matcher(nlp.vocab)
-            pattern1 = [ {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}}, {"LEMMA": {"IN": ["contract", "agreement", "deal", "accord", "pact", "charter", "lease", "terms"]}} ]
-            matcher.add("CONTRACT_TYPE_PHRASE_1", [pattern1])
-            pattern2 = [ {"LEMMA": {"IN": ["contract", "agreement"]}}, {"LOWER": {"IN": ["for", "to"]}, "OP": "?"}, {"LOWER": {"IN": ["the", "provide"]}, "OP": "?"}, {"LOWER": "of", "OP": "?"}, {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}} ]
-            matcher.add("CONTRACT_TYPE_PHRASE_2", [pattern2])
-            pattern3 = [ {"LEMMA": {"IN": ["award", "sign", "secure", "win", "enter", "finalize", "negotiate", "issue", "grant", "land"]}}, {"LOWER": {"IN": ["a", "an", "the"]}, "OP": "?"}, {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}}, {"LEMMA": {"IN": ["contract", "agreement", "deal"]}, "OP": "?"} ]
-            matcher.add("VERB_CONTRACT_TYPE", [pattern3])
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                span = doc[start:end]
+            matches = contract_matcher(doc, as_spans=True)
+            for span in matches:
                 span_text_lower = span.text.lower()
+                span_keywords = find_keywords(CONTRACT_KEYWORD_SCANNER, span_text_lower)
                 best_found_kw = ""
-                for canonical_kw in contract_keywords_list:
-                    if re.search(r'\b' + re.escape(canonical_kw.lower()) + r'\b', span_text_lower):
-                        if len(canonical_kw) > len(best_found_kw):
-                            best_found_kw = canonical_kw
+                for kw_lower, (canonical_kw, kw_regex) in CONTRACT_KEYWORD_REGEXES.items():
+                    if kw_lower in span_keywords and len(canonical_kw) > len(best_found_kw) and kw_regex.search(span_text_lower):
+                        best_found_kw = canonical_kw
                 if best_found_kw:
                     found_contract_types.add(best_found_kw)
             if not found_contract_types:
-                for ct in contract_keywords_list:
-                    if re.search(r'\b' + re.escape(ct) + r'\b', text, re.IGNORECASE):
+                for kw_lower in find_keywords(CONTRACT_KEYWORD_SCANNER, text.lower()):
+                    ct, ct_regex = CONTRACT_KEYWORD_REGEXES[kw_lower]
+                    if ct_regex.search(text):
                         found_contract_types.add(ct)
             return ', '.join(sorted(list(found_contract_types)))
 
@@ -1410,51 +1982,61 @@ class AppWindow(QMainWindow):
             text = clean_text(text)
             if not text:
                 return ''
-            doc = nlp(text)
-            sentences = [sent for sent in doc.sents if len(sent.text.strip()) > 5 and sent.vector_norm]
+            doc = parse(text)
+            views = ensure_precomputed(doc)
+            sentences = views["sents_v"]
             if not sentences or len(sentences) <= num_sentences:
-                original_sents = list(doc.sents)
+                original_sents = views["sents"]
                 return ' '.join([s.text.replace('\n', ' ').strip() for s in original_sents[:num_sentences]])
-            sentence_vectors = np.array([sent.vector for sent in sentences])
-            similarity_matrix = cosine_similarity(sentence_vectors)
+            sentence_vectors = np.array([sent.vector for sent in sentences], dtype=np.float32)
+            sentence_vectors /= np.linalg.norm(sentence_vectors, axis=1, keepdims=True)
+            similarity_matrix = sentence_vectors @ sentence_vectors.T
             initial_scores = np.ones(len(sentences))
-            status_keywords = ['award', 'complete', 'delay', 'cancel', 'fid', 'tender', 'plan', 'construct', 'decommission', 'sign', 'secure']
+            important_labels = {'ORG', 'PRODUCT', 'FAC', 'GPE', 'MONEY'}
+            sentence_starts = [sent.start for sent in sentences]
+            entity_sentences = set()
+            for ent in doc.ents:
+                if ent.label_ in important_labels:
+                    i = bisect_right(sentence_starts, ent.start) - 1
+                    if i >= 0 and ent.end <= sentences[i].end:
+                        entity_sentences.add(i)
             for i, sent in enumerate(sentences):
-                if any(ent.label_ in ['ORG', 'PRODUCT', 'FAC', 'GPE', 'MONEY'] for ent in sent.ents):
+                if i in entity_sentences:
                     initial_scores[i] += 0.3
-                if any(keyword in sent.text.lower() for keyword in status_keywords):
+                sent_text_lower = sent.text.lower()
+                if TEXTRANK_STATUS_REGEX.search(sent_text_lower):
                     initial_scores[i] += 0.4
                 if i == 0:
                     initial_scores[i] += 0.5
             scores = np.copy(initial_scores)
             damping_factor = 0.85
             try:
+                row_sums = similarity_matrix.sum(axis=1)
+                row_sums[row_sums == 0] = 1
+                transition_matrix = similarity_matrix / row_sums[:, None]
+                np.fill_diagonal(transition_matrix, 0)
+                transition_matrix = transition_matrix.T
                 for _ in range(100):
-                    prev_scores = np.copy(scores)
-                    for i in range(len(sentences)):
-                        rank_sum = sum( (similarity_matrix[j][i] * prev_scores[j]) / (np.sum(similarity_matrix[j]) or 1) for j in range(len(sentences)) if i != j )
-                        scores[i] = (1 - damping_factor) * initial_scores[i] + damping_factor * rank_sum
+                    prev_scores = scores
+                    scores = (1 - damping_factor) * initial_scores + damping_factor * (transition_matrix @ prev_scores)
                     if np.sum(np.abs(scores - prev_scores)) < 1e-5:
                         break
             except (ValueError, IndexError):
                 pass
             selected_indices = []
             try:
-                candidate_indices = list(range(len(sentences)))
+                candidate_mask = np.ones(len(sentences), dtype=bool)
                 best_start_idx = np.argmax(scores)
                 selected_indices.append(best_start_idx)
-                candidate_indices.remove(best_start_idx)
-                while len(selected_indices) < num_sentences and candidate_indices:
-                    mmr_scores = []
-                    for i in candidate_indices:
-                        relevance_score = scores[i]
-                        redundancy_score = max(similarity_matrix[i][j] for j in selected_indices)
-                        mmr = diversity_lambda * relevance_score - (1 - diversity_lambda) * redundancy_score
-                        mmr_scores.append((mmr, i))
-                    if not mmr_scores: break
-                    best_next_idx = max(mmr_scores)[1]
+                candidate_mask[best_start_idx] = False
+                max_similarity = similarity_matrix[:, best_start_idx].copy()
+                while len(selected_indices) < num_sentences and candidate_mask.any():
+                    mmr_scores = diversity_lambda * scores - (1 - diversity_lambda) * max_similarity
+                    mmr_scores[~candidate_mask] = -np.inf
+                    best_next_idx = len(mmr_scores) - 1 - np.argmax(mmr_scores[::-1])
                     selected_indices.append(best_next_idx)
-                    candidate_indices.remove(best_next_idx)
+                    candidate_mask[best_next_idx] = False
+                    max_similarity = np.maximum(max_similarity, similarity_matrix[:, best_next_idx])
             except (ValueError, IndexError):
                 selected_indices = []
             if not selected_indices:
@@ -1463,33 +2045,25 @@ class AppWindow(QMainWindow):
             sorted_indices = sorted(selected_indices)
             summary_sentences = [sentences[i].text.replace('\n', ' ').strip() for i in sorted_indices]
             if not summary_sentences:
-                original_sents = list(doc.sents)
+                original_sents = views["sents"]
                 return ' '.join([s.text.replace('\n', ' ').strip() for s in original_sents[:num_sentences]])
             return ' '.join(summary_sentences)
 
         def classify_offshore_onshore(text):
             text = clean_text(text).lower()
-            offshore_keywords = { 'offshore': 3, 'subsea': 3, 'fpso': 4, 'flng': 4, 'fsru': 4, 'floating': 2, 'deepwater': 2, 'mooring': 2, 'riser': 2, 'jack-up': 3, 'drillship': 3, 'spar': 3, 'tlp': 3, 'platform': 2, 'jacket': 2, 'hull': 1, 'caisson': 1, 'umbilical': 2, 'flowline': 2, 'topside': 2, 'topsides': 2, 'wellhead': 1, 'manifold': 1, 'christmas tree': 1, 'surf': 3, 'gbs': 2, 'sea bed': 2, 'marine': 2, 'vessel': 1, 'installation vessel': 3, 'anchor handling tug': 2, 'hook-up': 2, 'commissioning (offshore)': 3, 'offshore removal': 3, 'semisubmersible': 3, 'drilling rig': 2 }
-            onshore_keywords = { 'onshore': 3, 'land-based': 3, 'refinery': 4, 'petrochemical': 4, 'gas plant': 3, 'pipeline terminal': 2, 'compressor station': 2, 'gas treatment': 2, 'processing plant': 3, 'storage tank': 1, 'industrial complex': 2, 'onshore disposal': 3, 'midstream': 1, 'downstream': 1, 'lng terminal': 3, 'storage facility': 2, 'gas processing plant': 3 }
-            offshore_score = sum(score for kw, score in offshore_keywords.items() if kw in text)
-            onshore_score = sum(score for kw, score in onshore_keywords.items() if kw in text)
-            for keyword in BUILD_PARTS.union(BUILD_PROCESS_OPTIONS):
-                kw_lower = keyword.lower()
-                if kw_lower in text:
-                    if "subsea" in kw_lower or "offshore" in kw_lower or kw_lower in ['fpso', 'flng', 'fsru', 'tlp', 'spar', 'jacket', 'hull']:
-                        offshore_score += 1.5
-                    elif "topsides" in kw_lower: offshore_score += 0.5 
-                    elif "pipeline" in kw_lower:
-                        if 'subsea pipeline' in text: offshore_score += 1.5
-                        elif 'onshore pipeline' in text: onshore_score += 1.5
-                    elif "offshore removal" in kw_lower: offshore_score += 2
-                    elif "onshore disposal" in kw_lower: onshore_score += 2
-                    elif "installation" in kw_lower:
-                        if 'subsea installation' in text or 'offshore installation' in text: offshore_score += 1.5
-                        elif 'onshore installation' in text: onshore_score += 1.5
-                    elif "decommissioning" in kw_lower:
-                        if 'offshore decommissioning' in text: offshore_score += 1.5
-                        elif 'onshore decommissioning' in text: onshore_score += 1.5 
+            if any(kw in text for kw in STRONG_OFFSHORE_KEYWORDS) and not any(kw in text for kw in ONSHORE_SIGNAL_KEYWORDS):
+                return 'Offshore'
+            found_keywords = find_keywords(OFFSHORE_ONSHORE_SCANNER, text)
+            offshore_score = sum(OFFSHORE_KEYWORD_SCORES[kw] for kw in found_keywords if kw in OFFSHORE_KEYWORD_SCORES)
+            onshore_score = sum(ONSHORE_KEYWORD_SCORES[kw] for kw in found_keywords if kw in ONSHORE_KEYWORD_SCORES)
+            kind_counts = Counter(kind for kw_lower, kind in BUILD_KEYWORD_KINDS if kw_lower in found_keywords)
+            for kind, (offshore_weight, onshore_weight) in BUILD_KIND_WEIGHTS.items():
+                offshore_score += offshore_weight * kind_counts[kind]
+                onshore_score += onshore_weight * kind_counts[kind]
+            for kind, offshore_phrases, onshore_phrase in BUILD_CONTEXT_RULES:
+                if kind_counts[kind]:
+                    if any(phrase in found_keywords for phrase in offshore_phrases): offshore_score += 1.5 * kind_counts[kind]
+                    elif onshore_phrase in found_keywords: onshore_score += 1.5 * kind_counts[kind]
             if len(text.split()) < 20 and offshore_score > 0 and onshore_score > 0:
                 if offshore_score == onshore_score: return 'Unclear'
                 return 'Offshore' if offshore_score > onshore_score * 2 else ('Onshore' if onshore_score > onshore_score * 2 else 'Mixed')
@@ -1567,8 +2141,8 @@ class AppWindow(QMainWindow):
                     supporting_details.append(f"The project is {loc_text}.")
             if scope_details:
                 scope_list = [s.strip().lower() for s in scope_details.split(',')]
-                scope_groups = { 'full-field development (EPCI)': ['epc', 'epci', 'epcc'], 'SURF package': ['surf', 'pipelines', 'flowlines', 'riser', 'umbilical'], 'subsea production systems': ['subsea systems', 'tree', 'manifold', 'wellhead'], 'floating facilities': ['fpso', 'flng', 'fsru', 'tlp', 'spar'], 'fixed structures': ['jacket', 'hull', 'topside', 'topsides'], 'decommissioning activities': ['decommissioning'] }
-                found_groups = [group_name for group_name, keywords in scope_groups.items() if any(kw in scope_list for kw in keywords)]
+                scope_set = set(scope_list)
+                found_groups = [group_name for group_name, keywords in SCOPE_GROUPS.items() if not keywords.isdisjoint(scope_set)]
                 if found_groups:
                     scope_summary = " and ".join(found_groups)
                     supporting_details.append(f"Its scope is comprehensive, focusing on {scope_summary}.")
@@ -1588,9 +2162,9 @@ class AppWindow(QMainWindow):
                 supporting_details.append(f"Key technical elements include a {spec_summary}.")
             opinion_parts = [lead_sentence] + supporting_details
             final_opinion = " ".join(opinion_parts)
-            final_opinion = re.sub(r'\s+', ' ', final_opinion).strip()
+            final_opinion = WHITESPACE_REGEX.sub(' ', final_opinion).strip()
             if len(final_opinion) > 250:
-                doc = nlp(final_opinion)
+                doc = sentence_splitter(final_opinion)
                 sents = list(doc.sents)
                 truncated_opinion = ""
                 for sent in sents:
@@ -1606,26 +2180,26 @@ class AppWindow(QMainWindow):
                 return "General upstream oil and gas news."
             return final_opinion
 
+        package_matcher = Matcher(nlp.vocab)
+        pattern_standard = [ {"LOWER": {"IN": ["phase", "package", "epci"]}}, {"IS_ALPHA": True, "OP": "?"}, {"IS_DIGIT": True, "OP": "?"}, {"SHAPE": {"REGEX": "^(d|dd|X|XX|Xx)$"}, "OP": "?"} ]
+        package_matcher.add("STANDARD_PKG_PHASE", [pattern_standard])
+        pattern_phase_word_num = [ {"LOWER": "phase"}, {"LOWER": {"IN": ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", "first", "second", "third", "fourth", "fifth", "final", "next", "initial", "main"]}} ]
+        package_matcher.add("PHASE_WORD_NUM", [pattern_phase_word_num])
+        pattern_package_letter = [{"LOWER": "package"}, {"IS_UPPER": True, "LENGTH": 1}]
+        package_matcher.add("PACKAGE_LETTER", [pattern_package_letter])
+        pattern_descriptive_package = [ {"LOWER": {"IN": ["work", "contract", "subsea", "topsides", "drilling", "pipeline"]}}, {"LOWER": "package"}, {"IS_ALPHA": True, "OP": "?"}, {"IS_DIGIT": True, "OP": "?"}, {"SHAPE": {"REGEX": "^(d|dd|X|XX|Xx)$"}, "OP": "?"} ]
+        package_matcher.add("DESCRIPTIVE_PACKAGE", [pattern_descriptive_package])
+        pattern_phase_roman = [{"LOWER": "phase"}, {"TEXT": {"REGEX": r"^[IVXLCDM]+$"}, "OP": "+"}]
+        package_matcher.add("PHASE_ROMAN", [pattern_phase_roman])
+
         def extract_packages_phases_refined(text):
             text = clean_text(text)
             if not text:
                 return ''
-            doc = nlp(text)
+            doc = parse(text)
             found_items = set()
-            matcher = Matcher(nlp.vocab)
-            pattern_standard = [ {"LOWER": {"IN": ["phase", "package", "epci"]}}, {"IS_ALPHA": True, "OP": "?"}, {"IS_DIGIT": True, "OP": "?"}, {"SHAPE": {"REGEX": "^(d|dd|X|XX|Xx)$"}, "OP": "?"} ]
-            matcher.add("STANDARD_PKG_PHASE", [pattern_standard])
-            pattern_phase_word_num = [ {"LOWER": "phase"}, {"LOWER": {"IN": ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten", "first", "second", "third", "fourth", "fifth", "final", "next", "initial", "main"]}} ]
-            matcher.add("PHASE_WORD_NUM", [pattern_phase_word_num])
-            pattern_package_letter = [{"LOWER": "package"}, {"IS_UPPER": True, "LENGTH": 1}]
-            matcher.add("PACKAGE_LETTER", [pattern_package_letter])
-            pattern_descriptive_package = [ {"LOWER": {"IN": ["work", "contract", "subsea", "topsides", "drilling", "pipeline"]}}, {"LOWER": "package"}, {"IS_ALPHA": True, "OP": "?"}, {"IS_DIGIT": True, "OP": "?"}, {"SHAPE": {"REGEX": "^(d|dd|X|XX|Xx)$"}, "OP": "?"} ]
-            matcher.add("DESCRIPTIVE_PACKAGE", [pattern_descriptive_package])
-            pattern_phase_roman = [{"LOWER": "phase"}, {"TEXT": {"REGEX": r"^[IVXLCDM]+$"}, "OP": "+"}]
-            matcher.add("PHASE_ROMAN", [pattern_phase_roman])
-            matches = matcher(doc)
-            for match_id, start, end in matches:
-                span = doc[start:end]
+            matches = package_matcher(doc, as_spans=True)
+            for span in matches:
                 if 3 < len(span.text) <= 30 and len(span.text.split()) <= 4 :
                     found_items.add(span.text.strip())
             regex_fallback = re.findall( r'\b(Package\s*[A-Z0-9]+|EPCI\s*\d*|Phase\s*(?:\d+|[IVXLCDM]+(?:st|nd|rd|th)?|[Oo]ne|[Tt]wo|[Tt]hree|[Ff]irst|[Ss]econd|[Tt]hird|[Ff]inal))\b', text, re.IGNORECASE )
@@ -1643,14 +2217,7 @@ class AppWindow(QMainWindow):
             tqdm.pandas(desc="Processing news articles")
             worker.progress.emit(1)
             
-            # This is your original Tkinter file dialog logic. It is preserved.
-            # It will likely cause a crash or freeze if called from this thread.
-            root = tk.Tk()
-            root.withdraw()
-            file_path = filedialog.askopenfilename( title="Select Input Excel File", filetypes=(("Excel files", "*.xlsx *.xls"), ("All files", "*.*")) )
-            if not file_path:
-                print("No file selected. Exiting.")
-                return
+            # The input file is chosen with a QFileDialog on the GUI thread before this worker starts.
             print(f"Loading Excel file: {file_path}")
             worker.progress.emit(5)
             
@@ -1678,7 +2245,12 @@ class AppWindow(QMainWindow):
 
             print(f"Using column '{news_col_name}' for news content.")
             print("Starting structured data extraction...")
-            df['Cleaned Text'] = df[news_col_name].apply(clean_text)
+            df['Cleaned Text'] = df[news_col_name].fillna('').astype(str).str.strip()
+
+            print("Parsing articles...")
+            cleaned_texts = df['Cleaned Text'].tolist()
+            parse_batch(cleaned_texts)
+            parse_batch([text.lower() for text in cleaned_texts], disable=status_disabled_pipes)
 
             extraction_pipeline = {
                 'Field/Project Names': extract_project_profiles,
@@ -1701,24 +2273,29 @@ class AppWindow(QMainWindow):
             total_steps = len(extraction_pipeline) + 2 # +1 for AI opinion, +1 for saving
             for i, (col_name, func) in enumerate(extraction_pipeline.items()):
                 print(f"Analyzing: {col_name}...")
-                df[col_name] = df['Cleaned Text'].progress_apply(func)
+                # Memoize per column so duplicate article texts are only analyzed once.
+                df[col_name] = df['Cleaned Text'].progress_apply(lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)(func))
                 progress = int(((i + 1) / total_steps) * 100)
                 worker.progress.emit(progress)
 
+            doc_cache.clear()
+            gc.collect()
+
             print("Generating AI Opinion...")
-            df['AI Opinion'] = df.progress_apply(lambda row: generate_ai_opinion(row, row['Cleaned Text']), axis=1)
+            opinion_records = df[list(extraction_pipeline)].to_dict('records')
+            df['AI Opinion'] = [generate_ai_opinion(record, text) for record, text in zip(tqdm(opinion_records, desc="Generating AI opinions"), df['Cleaned Text'])]
             worker.progress.emit(int(((total_steps - 1) / total_steps) * 100))
             df.drop(columns=['Cleaned Text'], inplace=True)
             
             try:
-                df.to_excel(OUTPUT_PATH, index=False)
+                df.to_excel(OUTPUT_PATH, index=False, engine="xlsxwriter" if xlsxwriter else None)
                 print(f"✅ File saved to: {OUTPUT_PATH}")
             except Exception as e:
                 print(f"An unexpected error occurred while saving the file: {e}")
             
             # Emit results for the dashboard
             status_counts = df['Project Status'].value_counts().to_dict()
-            location_counts = df['Locations'].str.split(r',|;').explode().str.strip().value_counts().nlargest(10).to_dict()
+            location_counts = df['Locations'].str.split(',', regex=False).explode().str.strip().value_counts().nlargest(10).to_dict()
             type_counts = df['Offshore/Onshore Classification'].value_counts().to_dict()
             worker.results.emit({
                 "status_counts": status_counts,
@@ -1775,6 +2352,8 @@ if __name__ == "__main__":
     run_app()
 import os
 import time
+import hashlib
+import pickle
 from datetime import date, datetime, timedelta
 from tkinter import Tk, Label, Button
 from tkcalendar import Calendar
@@ -1782,7 +2361,21 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    print("Warning: 'selectolax' library not found. Listing pages will be parsed with the slower BeautifulSoup parser.")
+    print("Install it using: pip install selectolax")
+    LexborHTMLParser = None
+try:
+    import lxml
+except ImportError:
+    print("Warning: 'lxml' library not found. Article pages will be parsed with the slower built-in html.parser.")
+    print("Install it using: pip install lxml")
+    lxml = None
 try:
     from dateutil.parser import parse as dateutil_parse
 except ImportError:
@@ -1795,17 +2388,79 @@ except ImportError:
     print("Warning: 'requests' library not found. Online year verification is disabled.")
     print("Install it using: pip install requests")
     requests = None
+try:
+    import ntplib
+except ImportError:
+    print("Warning: 'ntplib' library not found. The system clock check will use the slower HTTP time service.")
+    print("Install it using: pip install ntplib")
+    ntplib = None
+try:
+    import xlsxwriter
+except ImportError:
+    print("Warning: 'xlsxwriter' library not found. Excel output will use the slower default writer.")
+    print("Install it using: pip install xlsxwriter")
+    xlsxwriter = None
 import re
 
 # --- Configuration ---
 PROFILE_PATH = r"C:\Users\i60475\AppData\Local\Google\Chrome\User Data\Selenium"
 WAIT_TIMEOUT = 20
 IMPLICIT_WAIT = 5
+ARTICLE_TABS = 4 # Article pages loaded concurrently, each in its own browser tab
+VERBOSE = False # Also log every skipped non-article link
+CLOCK_CHECK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".upstream_clock_check") # Offset from the last clock check
+CLOCK_CHECK_MAX_AGE = 24 * 60 * 60 # Seconds before the clock is checked online again
 BASE_URL = "https://www.upstreamonline.com/latest"
 OUTPUT_DIR = "C:/Office work/Upstream SCRAP news"
+ARTICLE_CACHE_DIR = os.path.join(OUTPUT_DIR, "_article_cache") # Extracted article details from earlier runs
+ARTICLE_CACHE_MAX_AGE = 24 * 60 * 60 # Seconds before a cached article is fetched again
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 # --- End Configuration ---
 
+# --- Article Page Parsing ---
+ARTICLE_HTML_PARSER = "lxml" if lxml else "html.parser"
+# Only the date span, the content containers and the topic holder are read from an article page,
+# so the strainer keeps everything else out of the tree.
+ARTICLE_PAGE_STRAINER = SoupStrainer(["span", "div", "article", "section"], attrs={"class": re.compile(r"dn-date-time|article-body|content|body|main|post|story|topic-holder", re.IGNORECASE)})
+ARTICLE_URL_REGEX = re.compile(r'/2-1-\d+$')
+RELATIVE_TIME_REGEX = re.compile(r'(\d+)\s+(minute|hour|day|week|month)s?\s+ago', re.IGNORECASE)
+NON_CONTENT_PARAGRAPH_REGEX = re.compile(r"^(advertisement|sponsored|related articles|read more|also read|subscribe now|follow us|share this article|photo:|image:|caption:)", re.IGNORECASE)
+# Content container selectors, from most specific to more general, compiled once instead of on every article
+CONTENT_CONTAINER_SELECTORS = tuple(sv.compile(selector) for selector in [
+    "div.article-body__content",  # Specific to Upstream
+    "article[class*='article-body']",
+    "div[class*='article-body']",
+    "div[class*='story-content']", # Common general content class
+    "div[class*='post-content']",
+    "div[class*='main-content']",
+    "div[class*='content-area']",
+    "article[class*='content']", # General article tag with 'content' in class
+    "section[class*='content']", # General section tag with 'content' in class
+    "div[class*='content']", # General div with 'content' in class
+])
+CONTENT_CONTAINER_UNION_SELECTOR = sv.compile(", ".join(selector.pattern for selector in CONTENT_CONTAINER_SELECTORS))
+CONTENT_CONTAINER_CLASS_REGEX = re.compile(r"article-body|content|body|main|post|story", re.IGNORECASE)
+ARTICLE_LINK_SELECTOR = sv.compile("a.card-link")
+ARTICLE_CATEGORY_SELECTOR = sv.compile("div.topic-holder a.dn-link.pill.tag")
+ARTICLE_READY_SELECTOR = "div.article-body__content"
+# The site's absolute date formats ("27 June 2024" and "27 June 2024, 14:23"), parsed without dateutil's full grammar
+SITE_DATE_REGEX = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})(?:,\s*(\d{1,2}):(\d{2}))?')
+MONTH_NUMBERS = {name: number for number, names in enumerate([("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"), ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"), ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december")], 1) for name in names}
+
+def parse_site_date(date_text):
+    """
+    Parses the site's own "day month year[, HH:MM]" dates with one compiled regex.
+    Returns None for anything else (or an impossible date), leaving it to dateutil/strptime.
+    """
+    match = SITE_DATE_REGEX.fullmatch(date_text)
+    month = match and MONTH_NUMBERS.get(match.group(2).lower())
+    if not month:
+        return None
+    try:
+        return datetime(int(match.group(3)), month, int(match.group(1)), int(match.group(4) or 0), int(match.group(5) or 0))
+    except ValueError:
+        return None
+
 # --- GUI Popup for Calendar Date Selection ---
 def select_date_range():
     start_date = None
@@ -1837,7 +2492,7 @@ def select_date_range():
     return start_date, end_date
 
 # --- Extract Article Links and Titles ---
-def get_article_links_and_titles(soup):
+def get_article_links_and_titles(html):
     articles = []
     # Use a set to prevent adding duplicate links if they are found by multiple selectors or exist on the page twice.
     seen_hrefs = set()
@@ -1846,31 +2501,172 @@ def get_article_links_and_titles(soup):
     # This is more robust because it finds any article link in a card, even if its
     # other styling classes (like 'text-reset') are different. This prevents the
     # scraper from missing articles with slightly different HTML structures.
-    for link in soup.select("a.card-link"):
-        href = link.get("href")
-        title = link.get_text(strip=True)
+    # lexbor (via selectolax) parses the listing page far faster than bs4's html.parser; bs4 is kept as the fallback.
+    if LexborHTMLParser:
+        card_links = ((node.attributes.get("href"), node) for node in LexborHTMLParser(html).css("a.card-link"))
+        link_text = lambda node: node.text(strip=True)
+    else:
+        card_links = ((link.get("href"), link) for link in ARTICLE_LINK_SELECTOR.select(BeautifulSoup(html, "html.parser")))
+        link_text = lambda link: link.get_text(strip=True)
+    for href, link in card_links:
+        if not href or href in seen_hrefs:
+            continue
 
         # New check: Ensure the link looks like an article URL and not a category page.
         # Article URLs on Upstream typically contain a pattern like '/2-1-1234567'.
-        if href and title and href not in seen_hrefs and re.search(r'/2-1-\d+$', href):
+        # This runs before the link text is extracted, so skipped links never pay for it.
+        if not ARTICLE_URL_REGEX.search(href):
+            seen_hrefs.add(href) # Add to seen even if skipped to avoid re-logging
+            if VERBOSE:
+                # This will log the links that are being skipped, making the output clearer.
+                print(f"ℹ️ Skipping non-article link: {link_text(link)} ({href})")
+            continue
+
+        title = link_text(link)
+        if title:
             full_link = href if href.startswith("https://") else f"https://www.upstreamonline.com{href}"
             articles.append((full_link, title))
             seen_hrefs.add(href)
             print(f"Found article link: {title}")
-        elif href and title and href not in seen_hrefs:
-            # This will log the links that are being skipped, making the output clearer.
-            print(f"ℹ️ Skipping non-article link: {title} ({href})")
-            seen_hrefs.add(href) # Add to seen even if skipped to avoid re-logging
     return articles
 
-# --- Extract Article Details ---
-def extract_article_details(driver, link):
-    driver.get(link)
+# --- Fetch Listing Pages ---
+def make_listing_session():
+    """Returns a keep-alive requests Session (gzip, pooled connections) for fetching listing pages without the browser."""
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+    return session
+
+def fetch_listing_html(session, page_url):
+    """
+    Fetches a listing page over plain HTTP. Returns None when the request fails or the
+    server-rendered HTML has no article cards (i.e. the page needs the browser).
+    """
+    try:
+        response = session.get(page_url, timeout=WAIT_TIMEOUT)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"ℹ️ Plain HTTP fetch of the listing failed, using the browser instead: {e}")
+        return None
+    if "card-link" not in response.text:
+        print("ℹ️ The listing is not served as plain HTML, using the browser instead.")
+        return None
+    return response.text
+
+# --- Load Article Pages ---
+def fetch_article_pages(driver, links):
+    """
+    Opens every link in its own background tab so the pages download concurrently, then reads
+    each tab's HTML in turn and closes the tabs. Returns one page source per link (None if it failed to load).
+    """
+    main_window = driver.current_window_handle
+    tabs = []
+    for link in links:
+        known_handles = set(driver.window_handles)
+        driver.execute_script("window.open(arguments[0], '_blank');", link)
+        new_handles = set(driver.window_handles) - known_handles
+        tabs.append((link, new_handles.pop() if new_handles else None))
+
+    page_sources = []
+    for link, handle in tabs:
+        page_source = None
+        try:
+            if handle is None:
+                raise RuntimeError("the article tab did not open")
+            driver.switch_to.window(handle)
+            # Wait for the article body (the date is rendered before it) instead of a fixed settle delay
+            try:
+                WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.CSS_SELECTOR, ARTICLE_READY_SELECTOR)))
+            except TimeoutException:
+                pass # No article body after WAIT_TIMEOUT; parse what is there
+            page_source = driver.page_source
+        except Exception as e:
+            print(f"❌ Error loading article: {link} - {e}")
+        page_sources.append(page_source)
+
+    for _, handle in tabs:
+        if handle is not None:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+    driver.switch_to.window(main_window)
+    return page_sources
+
+# --- Article Cache ---
+def article_cache_path(link):
+    """Returns the cache file for an article, named by the SHA-1 of its URL."""
+    return os.path.join(ARTICLE_CACHE_DIR, hashlib.sha1(link.encode("utf-8")).hexdigest() + ".pickle")
+
+def load_cached_article(link):
+    """
+    Returns the (date, content, classes, category) tuple saved for this URL by an earlier run,
+    or None if there is none or it is older than ARTICLE_CACHE_MAX_AGE.
+    """
+    cache_file = article_cache_path(link)
+    try:
+        if time.time() - os.path.getmtime(cache_file) < ARTICLE_CACHE_MAX_AGE:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not read cached article '{cache_file}': {e}")
+    return None
+
+def prune_article_cache():
+    """Deletes cached articles older than ARTICLE_CACHE_MAX_AGE, which load_cached_article() would ignore anyway."""
+    expired_before = time.time() - ARTICLE_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(ARTICLE_CACHE_DIR))
+    except OSError:
+        return # No cache yet
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < expired_before:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def store_article_details(link, details):
+    """
+    Saves the extracted details of an article so overlapping re-runs skip loading and parsing it.
+    Only complete extractions (a parsed date and content from a recognised container) are saved;
+    anything else is loaded again on the next run in case the page was not fully rendered.
+    """
+    parsed_date, article_content, container_classes, _ = details
+    if not (isinstance(parsed_date, date) and article_content != "No Content Found" and container_classes):
+        return
+    cache_file = article_cache_path(link)
+    try:
+        os.makedirs(ARTICLE_CACHE_DIR, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump(details, f)
+    except OSError as e:
+        print(f"Warning: Could not write cached article '{cache_file}': {e}")
 
-    WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-    time.sleep(2) # Allow dynamic content to load
+def load_articles(driver, articles):
+    """
+    Yields (link, title, page_source, details) for each article in listing order, loading ARTICLE_TABS pages at a time.
+    Articles found in the cache come with their details and no page source; only the rest are opened in the browser.
+    Stopping the iteration early means no further batches are opened.
+    """
+    for batch_start in range(0, len(articles), ARTICLE_TABS):
+        batch = articles[batch_start:batch_start + ARTICLE_TABS]
+        cached = {link: details for link, _ in batch if (details := load_cached_article(link)) is not None}
+        uncached_links = [link for link, _ in batch if link not in cached]
+        page_sources = iter(fetch_article_pages(driver, uncached_links) if uncached_links else ()) # No browser round trips for a fully cached batch
+        for link, title in batch:
+            if link in cached:
+                yield link, title, None, cached[link]
+            else:
+                yield link, title, next(page_sources), None
 
-    article_soup = BeautifulSoup(driver.page_source, "html.parser")
+# --- Extract Article Details ---
+def extract_article_details(page_source, link):
+    article_soup = BeautifulSoup(page_source, ARTICLE_HTML_PARSER, parse_only=ARTICLE_PAGE_STRAINER)
 
     date_element = article_soup.find("span", class_="dn-date-time")
     date_published = "No Date Found"
@@ -1886,7 +2682,7 @@ def extract_article_details(driver, link):
         parsed_dt_obj = None
 
         # 1. Handle relative time formats first (e.g., "X minutes ago", "today", "yesterday")
-        relative_time_match = re.search(r'(\d+)\s+(minute|hour|day|week|month)s?\s+ago', date_text, re.IGNORECASE)
+        relative_time_match = RELATIVE_TIME_REGEX.search(date_text)
         if relative_time_match:
             value = int(relative_time_match.group(1))
             unit = relative_time_match.group(2).lower()
@@ -1906,8 +2702,11 @@ def extract_article_details(driver, link):
             parsed_dt_obj = current_datetime - timedelta(days=1)
         elif "today" in date_text.lower():
             parsed_dt_obj = current_datetime
+        elif (site_datetime := parse_site_date(date_text)):
+            # 2. The site's usual absolute formats, without going through dateutil
+            parsed_dt_obj = site_datetime
         elif dateutil_parse:
-            # 2. Use dateutil for other formats (e.g., "27 June 2024", "June 27")
+            # 3. Use dateutil for other formats (e.g., "June 27")
             try:
                 # The fuzzy=False argument is safer to avoid misinterpreting surrounding text.
                 datetime_object = dateutil_parse(date_text, fuzzy=False) 
@@ -1915,7 +2714,7 @@ def extract_article_details(driver, link):
             except (ValueError, TypeError) as e:
                 print(f"❌ Date format not recognized by dateutil: '{date_text}' for URL: {link} - Error: {e}")
         else:
-            # 3. Fallback to strptime if dateutil is not installed
+            # 4. Fallback to strptime if dateutil is not installed
             try:
                 datetime_object = datetime.strptime(date_text, '%d %B %Y, %H:%M')
                 parsed_dt_obj = datetime_object
@@ -1948,28 +2747,18 @@ def extract_article_details(driver, link):
     article_content = "No Content Found"
     main_content_container = None
 
-    # Try a list of preferred selectors, from most specific to more general
-    preferred_selectors = [
-        "div.article-body__content",  # Specific to Upstream
-        "article[class*='article-body']",
-        "div[class*='article-body']",
-        "div[class*='story-content']", # Common general content class
-        "div[class*='post-content']",
-        "div[class*='main-content']",
-        "div[class*='content-area']",
-        "article[class*='content']", # General article tag with 'content' in class
-        "section[class*='content']", # General section tag with 'content' in class
-        "div[class*='content']", # General div with 'content' in class
-    ]
-
-    for selector in preferred_selectors:
-        candidate_container = article_soup.select_one(selector)
+    # Try the preferred selectors, from most specific to more general.
+    # One walk of the page collects every element any of them matches (in document order), and each
+    # selector then takes its first match from that short list instead of walking the page again.
+    container_candidates = CONTENT_CONTAINER_UNION_SELECTOR.select(article_soup)
+    for selector in CONTENT_CONTAINER_SELECTORS:
+        candidate_container = next((candidate for candidate in container_candidates if selector.match(candidate)), None)
         if candidate_container:
             # Basic check: does it have a few paragraphs? Avoid tiny, irrelevant containers.
-            if len(candidate_container.find_all("p", recursive=False)) > 1:  # Check direct children first
-                main_content_container = candidate_container
-                break
-            elif len(candidate_container.find_all("p")) > 2:  # Check all descendants
+            # One walk collects every descendant <p>; the direct children are the ones whose parent is the container.
+            paragraphs = candidate_container.find_all("p")
+            direct_paragraphs = sum(1 for p in paragraphs if p.parent is candidate_container)
+            if direct_paragraphs > 1 or len(paragraphs) > 2:  # Two direct paragraphs, or three anywhere below
                 main_content_container = candidate_container
                 break
 
@@ -1977,23 +2766,25 @@ def extract_article_details(driver, link):
     if not main_content_container:
         potential_containers = article_soup.find_all(
             ["div", "article", "section"], # Common semantic tags for content
-            class_=re.compile(r"article-body|content|body|main|post|story", re.IGNORECASE),
+            class_=CONTENT_CONTAINER_CLASS_REGEX,
         )
         if potential_containers:
-            # Heuristic: choose the container with the most paragraph tags
-            main_content_container = max(potential_containers, key=lambda c: len(c.find_all("p")), default=None)
+            # Heuristic: choose the container with the most paragraph tags.
+            # One pass over the page's paragraphs credits every candidate container they sit in,
+            # instead of a separate find_all("p") under each candidate.
+            paragraph_counts = dict.fromkeys(map(id, potential_containers), 0)
+            for p in article_soup.find_all("p"):
+                for ancestor in p.parents:
+                    if id(ancestor) in paragraph_counts:
+                        paragraph_counts[id(ancestor)] += 1
+            main_content_container = max(potential_containers, key=lambda c: paragraph_counts[id(c)], default=None)
 
     collected_paragraphs_text = []
     if main_content_container:
-        paragraphs = main_content_container.find_all("p")
-        seen_texts = set() # To store text of paragraphs to ensure uniqueness
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            # Filter out common non-content paragraphs (e.g., ads, share lines, very short text)
-            if text and len(text) > 30 and not re.search(r"^(advertisement|sponsored|related articles|read more|also read|subscribe now|follow us|share this article|photo:|image:|caption:)", text, re.IGNORECASE):
-                if text not in seen_texts:
-                    collected_paragraphs_text.append(text)
-                    seen_texts.add(text)
+        paragraph_texts = (p.get_text(strip=True) for p in main_content_container.find_all("p"))
+        # Filter out common non-content paragraphs (e.g., ads, share lines, very short text).
+        # dict.fromkeys drops repeated paragraphs while keeping first-seen order, so no separate seen-set is needed.
+        collected_paragraphs_text = list(dict.fromkeys(text for text in paragraph_texts if len(text) > 30 and not NON_CONTENT_PARAGRAPH_REGEX.search(text)))
         
         if collected_paragraphs_text:
             article_content = "\n\n".join(collected_paragraphs_text).strip()
@@ -2001,7 +2792,7 @@ def extract_article_details(driver, link):
     # Extract category from the article page
     category = "No Category Found"
     try:
-        category_element = article_soup.select_one("div.topic-holder a.dn-link.pill.tag")
+        category_element = ARTICLE_CATEGORY_SELECTOR.select_one(article_soup)
         if category_element:
             category = category_element.text.strip()
     except Exception:
@@ -2010,25 +2801,41 @@ def extract_article_details(driver, link):
     container_classes_list = main_content_container.get("class", []) if main_content_container and main_content_container.has_attr("class") else []
     return date_published, article_content, container_classes_list, category
 
+# --- Stream Articles to the Workbook ---
+ARTICLE_COLUMNS = ["Topic", "Link", "Date", "Content", "Content Classes", "Serial Number", "URL Content Class"]
+
+def open_article_workbook(file_path):
+    """
+    Opens a constant-memory xlsxwriter workbook and writes the header row (styled like pandas' to_excel).
+    Rows are then streamed to disk one article at a time with write_article_row().
+    """
+    workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True, "default_date_format": "yyyy-mm-dd"})
+    worksheet = workbook.add_worksheet()
+    worksheet.write_row(0, 0, ARTICLE_COLUMNS, workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"}))
+    return workbook, worksheet
+
+def write_article_row(worksheet, row_number, article):
+    """Writes one article in ARTICLE_COLUMNS order; row_number doubles as its serial number."""
+    worksheet.write_row(row_number, 0, [article["Topic"], article["Link"], article["Date"], article["Content"], str(article["Content Classes"]), row_number, article["URL Content Class"]])
+
 # --- Verification Mechanism ---
-def verify_scraped_dates(scraped_data, start_date, end_date):
+def verify_scraped_dates(article_dates, start_date, end_date):
     """
-    After scraping, this function re-checks the collected data against the requested
+    After scraping, this function re-checks the dates of the collected articles against the requested
     date range and reports any calendar days for which no articles were found.
     """
     print("\n--- Verification Step ---")
-    if not scraped_data:
+    if not article_dates:
         print("⚠️ No data was scraped, so verification cannot be performed.")
         return
 
     # Create a set of all unique dates for which articles were successfully scraped
-    scraped_dates = {item['Date'] for item in scraped_data if isinstance(item.get('Date'), date)}
+    scraped_dates = {article_date for article_date in article_dates if isinstance(article_date, date)}
 
-    # Create a set of all calendar dates within the user-selected range
-    expected_dates = {start_date + timedelta(days=d) for d in range((end_date - start_date).days + 1)}
-
-    # Find which dates from the expected range are not in our scraped set
-    missing_dates = sorted(list(expected_dates - scraped_dates))
+    # Walk the calendar days of the user-selected range in order and keep the ones not in our scraped set
+    # (already sorted, and no second set of the whole range is built)
+    calendar_days = (start_date + timedelta(days=d) for d in range((end_date - start_date).days + 1))
+    missing_dates = [day for day in calendar_days if day not in scraped_dates]
 
     if not missing_dates:
         print("✅ Verification successful: At least one article was found for every calendar day in the selected range.")
@@ -2039,11 +2846,17 @@ def verify_scraped_dates(scraped_data, start_date, end_date):
         print("This could be because no articles were published on these days, or they were potentially missed by the scraper.")
 
 # --- Helper for System Clock Check ---
-def get_real_current_year_from_api():
+def fetch_real_timestamp():
     """
-    Fetches the current year from a reliable online source to perform a sanity check
-    on the system clock. Returns None if the check fails (e.g., no internet).
+    Returns the current Unix time from an online source: a single NTP round trip when ntplib
+    is installed, otherwise the worldtimeapi.org HTTP service. Returns None if both fail.
     """
+    if ntplib:
+        try:
+            print("Verifying system clock against NTP time source...")
+            return ntplib.NTPClient().request("pool.ntp.org", version=3, timeout=2).tx_time
+        except Exception as e:
+            print(f"⚠️  Warning: NTP time check failed, trying the online API. Error: {e}")
     if not requests:  # Check if the import of the 'requests' library succeeded
         print("ℹ️  Skipping online year verification because 'requests' library is not installed.")
         return None
@@ -2053,17 +2866,68 @@ def get_real_current_year_from_api():
         response = requests.get("http://worldtimeapi.org/api/ip", timeout=5)
         response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
         data = response.json()
-        # The datetime string is in ISO 8601 format, e.g., "2024-07-05T10:30:00.123456+01:00"
-        iso_datetime_str = data.get('datetime')
-        if iso_datetime_str and len(iso_datetime_str) >= 4:
-            real_year = int(iso_datetime_str[:4])
-            print(f"✅ Online time source reports the year is {real_year}.")
-            return real_year
-        return None
+        # Prefer the Unix time; the datetime string is in ISO 8601 format, e.g., "2024-07-05T10:30:00.123456+01:00"
+        return data.get('unixtime') or datetime.fromisoformat(data['datetime']).timestamp()
     except Exception as e:
         print(f"⚠️  Warning: Could not verify current year via online API. Error: {e}")
         return None
 
+def get_real_current_year_from_api():
+    """
+    Fetches the current year from a reliable online source to perform a sanity check
+    on the system clock. Returns None if the check fails (e.g., no internet).
+    The measured clock offset is cached on disk, so runs within CLOCK_CHECK_MAX_AGE skip the network entirely.
+    """
+    clock_offset = None
+    try:
+        # A negative age means the system clock has been moved back since the check was cached, so it is not trusted
+        if 0 <= time.time() - os.path.getmtime(CLOCK_CHECK_CACHE_PATH) < CLOCK_CHECK_MAX_AGE:
+            with open(CLOCK_CHECK_CACHE_PATH, encoding="utf-8") as f:
+                clock_offset = float(f.read())
+    except (OSError, ValueError):
+        pass # No usable cached check
+
+    from_cache = clock_offset is not None
+    if not from_cache:
+        real_timestamp = fetch_real_timestamp()
+        if real_timestamp is None:
+            return None
+        # Caching the offset (not the year) keeps the check right across a New Year within the cache window
+        clock_offset = real_timestamp - time.time()
+        try:
+            with open(CLOCK_CHECK_CACHE_PATH, "w", encoding="utf-8") as f:
+                f.write(repr(clock_offset))
+        except OSError:
+            pass
+
+    real_year = datetime.fromtimestamp(time.time() + clock_offset).year
+    if from_cache:
+        print(f"✅ Clock offset from the last online check (under {CLOCK_CHECK_MAX_AGE // 3600} h old) puts the year at {real_year}.")
+    else:
+        print(f"✅ Online time source reports the year is {real_year}.")
+    return real_year
+
+# --- Browser Session ---
+def build_driver():
+    """
+    Starts Chrome with the scraping profile. Pages report ready once the DOM is parsed ('eager'),
+    since every wait targets specific elements rather than the full page load.
+    """
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument(f"user-data-dir={PROFILE_PATH}")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    # Only the HTML is scraped, so images, stylesheets and web fonts are never downloaded (JavaScript stays on for dynamic content)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2, "profile.managed_default_content_settings.stylesheet": 2, "profile.managed_default_content_settings.fonts": 2})
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.page_load_strategy = "eager"
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    return driver
+
 # --- Main Scraping Logic ---
 def main():
     # --- System Clock Sanity Check ---
@@ -2087,17 +2951,22 @@ def main():
         print("Date selection cancelled or invalid. Exiting.")
         return
     print(f"\n📅 Scraping from {start_date} to {end_date}\n")
+    prune_article_cache()
+
+    today = date.today()
+    filename = f"news_filtered_by_date_{today.strftime('%Y-%m-%d')}.xlsx"
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    file_path = os.path.join(OUTPUT_DIR, filename)
 
+    # With xlsxwriter, each article is written to disk as soon as it is accepted, so memory stays flat however
+    # long the scrape runs; without it the rows are kept and written by pandas at the end.
+    article_workbook = None
+    article_dates = []
     scraped_data = []
 
-    chrome_options = webdriver.ChromeOptions()
-    chrome_options.add_argument(f"user-data-dir={PROFILE_PATH}")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument(f"user-agent={USER_AGENT}")
-
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(IMPLICIT_WAIT)
+    driver = build_driver()
+    # Listing pages are tried over plain HTTP first; the session is dropped (browser only) once a page needs the browser
+    listing_session = make_listing_session() if requests else None
 
     page_number = 1
     stop_scraping = False
@@ -2107,19 +2976,31 @@ def main():
         print(f"\n🌐 Visiting: {page_url}")
 
         try:
-            driver.get(page_url)
-            WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            articles = get_article_links_and_titles(soup)
+            page_html = fetch_listing_html(listing_session, page_url) if listing_session else None
+            if page_html is None:
+                listing_session = None
+                driver.get(page_url)
+                # Wait for the article cards themselves ("eager" returns before scripts have filled the listing in)
+                try:
+                    WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.card-link")))
+                except TimeoutException:
+                    pass # No cards: past the last page, which the empty-listing check below handles
+                page_html = driver.page_source
+            articles = get_article_links_and_titles(page_html)
 
             if not articles:
                 print("⚠️ No more articles found on the site. Ending pagination.")
                 break
 
-            for link, title in articles:
+            for link, title, page_source, details in load_articles(driver, articles):
+                if page_source is None and details is None:
+                    continue
                 try:
                     print(f"Processing article: {title} ({link})")
-                    parsed_date, article_content, container_classes, category = extract_article_details(driver, link)
+                    if details is None:
+                        details = extract_article_details(page_source, link)
+                        store_article_details(link, details)
+                    parsed_date, article_content, container_classes, category = details
                     print(f"Parsed date for {title}: {parsed_date} (type: {type(parsed_date)})")
  
                     if isinstance(parsed_date, date):
@@ -2132,14 +3013,21 @@ def main():
  
                         # Process article if it's within the desired date range
                         if start_date <= parsed_date <= end_date:
-                            scraped_data.append({
+                            article = {
                                 "Topic": title,
                                 "Link": link,
                                 "Date": parsed_date,
                                 "Content": article_content,
                                 "Content Classes": container_classes,
                                 "URL Content Class": category
-                            })
+                            }
+                            article_dates.append(parsed_date)
+                            if xlsxwriter:
+                                if article_workbook is None:
+                                    article_workbook = open_article_workbook(file_path)
+                                write_article_row(article_workbook[1], len(article_dates), article)
+                            else:
+                                scraped_data.append(article)
                             print(f"✅ Added '{title}' to the dataset.")
                         else:
                             # This case handles articles that are newer than the end_date
@@ -2160,18 +3048,16 @@ def main():
     driver.quit()
 
     # Call the verification function to check for missing dates before saving
-    verify_scraped_dates(scraped_data, start_date, end_date)
-
-    today = date.today()
-    filename = f"news_filtered_by_date_{today.strftime('%Y-%m-%d')}.xlsx"
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    file_path = os.path.join(OUTPUT_DIR, filename)
+    verify_scraped_dates(article_dates, start_date, end_date)
 
-    if scraped_data:
+    if article_workbook:
+        article_workbook[0].close()
+        print(f"\n✅ Data saved to: {file_path}")
+    elif scraped_data:
         df = pd.DataFrame(scraped_data)
         df["Serial Number"] = range(1, len(df) + 1)
         # Reorder columns to match original intent
-        df = df[["Topic", "Link", "Date", "Content", "Content Classes", "Serial Number", "URL Content Class"]]
+        df = df[ARTICLE_COLUMNS]
         df.to_excel(file_path, index=False)
         print(f"\n✅ Data saved to: {file_path}")
     else:
@@ -2183,17 +3069,32 @@ if __name__ == '__main__':
 
 import spacy
 import pandas as pd
+import os
 import re
 import numpy as np
 from collections import Counter
 from string import punctuation
 import heapq
-from sklearn.metrics.pairwise import cosine_similarity
 from spacy.matcher import Matcher
+from spacy.tokens import Doc
+from functools import lru_cache
+from bisect import bisect_right
 import tkinter as tk
 from tkinter import filedialog
 from tqdm import tqdm
 import spacy.cli  # Ensure spacy.cli is imported for model download
+try:
+    import re2 as fast_re
+except ImportError:
+    print("Warning: 'google-re2' library not found. Alternation-heavy unit patterns will use the slower built-in re engine.")
+    print("Install it using: pip install google-re2")
+    fast_re = re
+try:
+    import xlsxwriter
+except ImportError:
+    print("Warning: 'xlsxwriter' library not found. Excel output will use the slower default writer.")
+    print("Install it using: pip install xlsxwriter")
+    xlsxwriter = None
 
 # --- Configuration ---
 SPACY_MODEL = 'en_core_web_trf'
@@ -2219,6 +3120,22 @@ except OSError: # Fallback if retries fail
     print(f"Successfully downloaded and loaded SpaCy model: {SPACY_MODEL}")
 
 
+# Lightweight rule-based sentence splitter, used to trim generated opinions without running the full model
+sentence_splitter = spacy.blank("en")
+sentence_splitter.add_pipe("sentencizer")
+
+# Parsed Docs keyed by text, shared by all extractors (filled in bulk by parse_batch in main)
+PIPE_BATCH_SIZE = 64
+# Worker processes for nlp.pipe in parse_batch. Opt-in: each one loads its own copy of the model (a few GB for
+# the transformer pipeline), so only raise this on machines with the memory for it.
+PIPE_N_PROCESS = 1
+_doc_cache = {}
+# Status matching only reads LOWER/LEMMA/POS, so its lowercased parse skips the parser and NER
+STATUS_DISABLED_PIPES = tuple(name for name in ("parser", "ner") if name in nlp.pipe_names)
+# Opt-in: skip the profile/vessel extractors for texts without a designator word or vessel type. Faster, but
+# loses names found only by NER (e.g. a project name with no "field"/"project"/... word), so it is off by default.
+SKIP_SPACY_ON_NO_TRIGGER = False
+
 # Define file paths
 # FILE_PATH = r"C:\Office work\Upstream SCRAP news\news_filtered_by_date_2025-06-13.xlsx" # Will be selected via dialog
 OUTPUT_PATH = r"C:\Office work\Upstream SCRAP news\Filter output.xlsx" # Output path can remain or also be made dynamic
@@ -2289,13 +3206,17 @@ LENGTH_UNITS_SHORT_EXACT = ["km", "m", "ft"] # For regex like \d+km
 # Pre-sort target_build_parts for efficient matching of the most specific part first
 SORTED_TARGET_BUILD_PARTS = sorted(TARGET_BUILD_PARTS, key=len, reverse=True)
 
+def number_unit_regex(number_pattern, units, short_units):
+    """
+    Compiles one pattern for "10 km", "10km" and "10-kilometer" style measurements.
+    A dash is only accepted before the spelled-out units, as the separate patterns did.
+    """
+    long_units = "|".join(unit for unit in units if unit not in short_units)
+    return re.compile(number_pattern + r"(?:\s*-\s*(?=(?:" + long_units + r")\b)|\s*)(" + "|".join(units) + r")\b", re.IGNORECASE)
+
 # Compile regex patterns for efficiency (moved outside the function)
-# Pattern for "10 km", "10 kilometers" (allows space between number and unit)
-NUM_UNIT_REGEX_SPACED = re.compile(r"(\d+(?:\.\d+)?)\s*(" + "|".join(LENGTH_UNITS) + r")\b", re.IGNORECASE)
-# Pattern for "10km" (no space, short units only, case-insensitive unit)
-NUM_UNIT_REGEX_NOSPACE = re.compile(r"(\d+(?:\.\d+)?)(" + "|".join(LENGTH_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-# Pattern for "10-kilometer"
-NUM_DASH_UNIT_REGEX = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(" + "|".join(unit for unit in LENGTH_UNITS if unit not in LENGTH_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
+# Pattern for "10 km", "10km" and "10-kilometer" in a single pass
+NUM_UNIT_REGEX = number_unit_regex(r"(\d+(?:\.\d+)?)", LENGTH_UNITS, LENGTH_UNITS_SHORT_EXACT)
 
 # --- Keywords for Build Part Weight Extraction ---
 WEIGHT_TARGET_PARTS = [
@@ -2311,10 +3232,8 @@ WEIGHT_UNITS_SHORT_EXACT = ['t', 'kg', 'lb', 'lbs']
 SORTED_WEIGHT_TARGET_PARTS = sorted(WEIGHT_TARGET_PARTS, key=len, reverse=True)
 
 # Compile regex for weight, allowing for commas in numbers (e.g., 5,000)
-# Pattern for "5,000 tonnes"
-NUM_WEIGHT_UNIT_REGEX_SPACED = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS) + r")\b", re.IGNORECASE)
-# Pattern for "5000t"
-NUM_WEIGHT_UNIT_REGEX_NOSPACE = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
+# Pattern for "5,000 tonnes" and "5000t" (the short units are already in WEIGHT_UNITS)
+NUM_WEIGHT_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(WEIGHT_UNITS) + r")\b", re.IGNORECASE)
 
 # --- Keywords for Build Part Diameter Extraction ---
 DIAMETER_TARGET_PARTS = [
@@ -2330,10 +3249,8 @@ DIAMETER_UNITS_SHORT_EXACT = ['in', '"', 'mm', 'cm', 'm', 'ft']
 
 SORTED_DIAMETER_TARGET_PARTS = sorted(DIAMETER_TARGET_PARTS, key=len, reverse=True)
 
-# Compile regex for diameter
-NUM_DIAMETER_UNIT_REGEX_SPACED = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")\b", re.IGNORECASE)
-NUM_DIAMETER_UNIT_REGEX_NOSPACE = re.compile(r"([\d,]+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
-NUM_DASH_DIAMETER_UNIT_REGEX = re.compile(r"([\d,]+(?:\.\d+)?)\s*-\s*(" + "|".join(unit for unit in DIAMETER_UNITS if unit not in DIAMETER_UNITS_SHORT_EXACT) + r")\b", re.IGNORECASE)
+# Compile regex for diameter ("12 inch", "12in", "12-inch")
+NUM_DIAMETER_UNIT_REGEX = number_unit_regex(r"([\d,]+(?:\.\d+)?)", DIAMETER_UNITS, DIAMETER_UNITS_SHORT_EXACT)
 
 # --- Keywords for Dimensions (LxWxH) ---
 DIMENSION_TARGET_PARTS = [
@@ -2380,6 +3297,8 @@ VESSEL_TYPES = [
     "barge", "tanker", "carrier", "seismic vessel"
 ]
 SORTED_VESSEL_TYPES = sorted(VESSEL_TYPES, key=len, reverse=True)
+SORTED_VESSEL_TYPE_TITLES = [(v_type, v_type.title()) for v_type in SORTED_VESSEL_TYPES]
+SORTED_VESSEL_TYPE_SUFFIXES = [f" {v_type}" for v_type in SORTED_VESSEL_TYPES] # e.g. "Maersk Inventor drillship"
 
 VESSEL_SCOPE_KEYWORDS = [
     "support", "drilling", "installation", "construction", "pipelay", "decommissioning", "accommodation",
@@ -2390,6 +3309,35 @@ VESSEL_SCOPE_KEYWORDS = [
 VESSEL_CHARTER_VERBS = [
     "charter", "contract", "hire", "award", "secure", "fix", "book", "mobilise", "deploy", "take on"
 ]
+# Same substring semantics as checking each verb with `in`, but one scan per sentence
+VESSEL_CHARTER_VERB_REGEX = re.compile("|".join(re.escape(verb) for verb in VESSEL_CHARTER_VERBS))
+# Vessel fields in output order. Each is kept as its own vessel name -> value dict.
+VESSEL_FIELDS = ("Type", "Owner", "Charterer", "Day Rate", "Duration", "Scope")
+# Texts naming no vessel type are skipped when SKIP_SPACY_ON_NO_TRIGGER is set
+VESSEL_TRIGGER_REGEX = re.compile("|".join(re.escape(v_type) for v_type in VESSEL_TYPES), re.IGNORECASE)
+
+# Vessel detail patterns, matched against the lowercased sentence
+VESSEL_DAY_RATE_REGEX = re.compile(r"((?:[\$€£]|usd)\s?[\d,]+(?:\.\d+)?(?:k| thousand)?)\s*(?:per day|a day|dayrate)")
+VESSEL_DURATION_REGEX = re.compile(r"(?:for|of)\s+((?:a firm period of\s+)?(?:up to\s+)?(?:\d+|[\w\s]+)\s(?:year|month|week|day)s?)")
+VESSEL_SCOPE_REGEX = re.compile(r"(?:to|for|perform|carry out)\s+((?:[\w\s-]+\s)?(?:{})(?:[\w\s-]+)?)".format("|".join(VESSEL_SCOPE_KEYWORDS)))
+
+# --- Patterns for Project Profile Extraction ---
+# Water depth, distance offshore and capacity in one pattern, so each sentence is scanned once.
+# A currency symbol anywhere in the sentence means its numbers are money, so capacity is skipped.
+PROFILE_SENTENCE_REGEX = re.compile(
+    r"(?P<money>[\$€£])"
+    r"|(?P<depth>in (?P<depth_value>[\d,]+(?:\.\d+)?)\s*(?P<depth_unit>meters?|m|feet|ft)\s+of water)"
+    r"|(?P<distance>(?P<distance_value>[\d,]+(?:\.\d+)?)\s*(?P<distance_unit>km|kilometers?|miles?)\s*(?:offshore|from the coast))"
+    r"|(?P<capacity>[\d,.]+(?:\.\d+)?\s*(?:million|billion|thousand|mn|bn|k)?\s*(?:bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|tonnes/year|t/y|t/d|barrels|tonnes|cubic\s+feet|cubic\s+meters))",
+    re.IGNORECASE)
+# Profile fields in output order. Each is kept as its own name -> value dict.
+PROFILE_FIELDS = ("Capacity", "Timeline", "Depth", "Distance")
+# Designator words every rule-based project name contains (only NER-only names like "Johan Sverdrup" lack one)
+PROFILE_TRIGGER_REGEX = re.compile("field|project|development|block|area|licence|basin|phase|package|discovery|epci", re.IGNORECASE)
+PROFILE_TIMELINE_KEYWORDS = {
+    "Startup": ["first oil", "first gas", "start-up", "online", "operational by", "come onstream", "begin production"],
+    "Shutdown": ["shut down", "cease production", "decommissioning in", "abandonment in", "plug and abandon"]
+}
 
 # --- Keywords for Depth Rating Extraction ---
 DEPTH_RATING_TARGET_PARTS = [
@@ -2433,7 +3381,30 @@ TEMP_TARGET_PARTS = [
 ]
 TEMP_UNITS = ['celsius', 'fahrenheit', 'kelvin', 'c', 'f', 'k', 'degrees', '°c', '°f']
 SORTED_TEMP_TARGET_PARTS = sorted(TEMP_TARGET_PARTS, key=len, reverse=True)
-NUM_TEMP_UNIT_REGEX = re.compile(r"(-?\d+(?:\.\d+)?)\s*(?:degrees)?\s*(" + "|".join(TEMP_UNITS) + r")\b", re.IGNORECASE)
+# Unit alternations without lookarounds run on RE2 (linear time, no backtracking) when it is installed.
+# Case-insensitivity is inline, since RE2 doesn't take re's flag arguments.
+NUM_TEMP_UNIT_REGEX = fast_re.compile(r"(?i)(-?\d+(?:\.\d+)?)\s*(?:degrees)?\s*(" + "|".join(TEMP_UNITS) + r")\b")
+DIAMETER_RANGE_REGEX = fast_re.compile(r"(?i)(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")")
+
+# --- Unit Normalization for Build Part Specifications ---
+# Lowercased unit -> short form used in the output. Units not listed are kept as written.
+LENGTH_UNIT_NORMALIZATION = {"kilometer": "km", "kilometers": "km", "meter": "m", "meters": "m", "metres": "m", "mile": "miles", "miles": "miles", "foot": "ft", "feet": "ft"}
+WEIGHT_UNIT_NORMALIZATION = {"tonne": "t", "tonnes": "t", "ton": "t", "te": "t", "kilogram": "kg", "kilograms": "kg", "pound": "lbs", "pounds": "lbs"}
+DIAMETER_UNIT_NORMALIZATION = {"inch": "in", "inches": "in", '"': "in", "millimeter": "mm", "millimeters": "mm", "centimeter": "cm", "centimeters": "cm", "foot": "ft", "feet": "ft"}
+DIAMETER_RANGE_UNIT_NORMALIZATION = {**DIAMETER_UNIT_NORMALIZATION, "meter": "m", "meters": "m"}
+DEPTH_RATING_UNIT_NORMALIZATION = {"meter": "m", "meters": "m", "feet": "ft"}
+TEMP_UNIT_NORMALIZATION = {"c": "Celsius", "f": "Fahrenheit"}
+# Unit sets for the token-level fallback (number words like "ten kilometers")
+LENGTH_UNIT_SET, WEIGHT_UNIT_SET, DIAMETER_UNIT_SET, DEPTH_RATING_UNIT_SET = map(frozenset, (LENGTH_UNITS, WEIGHT_UNITS, DIAMETER_UNITS, DEPTH_RATING_UNITS))
+
+def last_num_unit(span, unit_set):
+    """Returns the text of the last number-like token in span and the last token in unit_set (lowercased)."""
+    num_text, unit_text = None, None
+    for token in reversed(span):
+        if num_text is None and token.like_num: num_text = token.text
+        if unit_text is None and token.lower_ in unit_set: unit_text = token.lower_
+        if num_text and unit_text: break
+    return num_text, unit_text
 
 
 # --- Keywords for Quantity Extraction ---
@@ -2446,6 +3417,32 @@ NON_COUNTABLE_KEYWORDS = [
 ]
 SORTED_QUANTITY_TARGET_PARTS = sorted([p for p in QUANTITY_TARGET_PARTS if p.lower() not in NON_COUNTABLE_KEYWORDS], key=len, reverse=True)
 
+def canonical_part_names(parts):
+    """
+    Compiles a length-sorted part list into one overlapping-lookahead regex, plus a map from each
+    lowercased part to (rank in the list, display name), so the display names are built once.
+    """
+    ranked_parts = {}
+    for rank, part in enumerate(parts):
+        ranked_parts.setdefault(part.lower(), (rank, part.title() if ' ' in part else part.capitalize()))
+    return re.compile("(?=(" + "|".join(re.escape(part) for part in ranked_parts) + "))"), ranked_parts
+
+def find_canonical_part(part_names, text_lower):
+    """
+    Returns the display name of the first part (in list order, i.e. longest first) occurring in text_lower,
+    from a single scan. Same result as walking the sorted list and stopping at the first substring hit.
+    """
+    part_regex, ranked_parts = part_names
+    found = [ranked_parts[match.group(1)] for match in part_regex.finditer(text_lower)]
+    return min(found)[1] if found else None
+
+SORTED_TARGET_BUILD_PART_NAMES, SORTED_WEIGHT_TARGET_PART_NAMES, SORTED_DIAMETER_TARGET_PART_NAMES, SORTED_DEPTH_RATING_TARGET_PART_NAMES = map(canonical_part_names, (SORTED_TARGET_BUILD_PARTS, SORTED_WEIGHT_TARGET_PARTS, SORTED_DIAMETER_TARGET_PARTS, SORTED_DEPTH_RATING_TARGET_PARTS))
+SORTED_PRESSURE_TARGET_PART_NAMES, SORTED_QUANTITY_TARGET_PART_NAMES, SORTED_FLOW_CAPACITY_TARGET_PART_NAMES, SORTED_TEMP_TARGET_PART_NAMES = map(canonical_part_names, (SORTED_PRESSURE_TARGET_PARTS, SORTED_QUANTITY_TARGET_PARTS, SORTED_FLOW_CAPACITY_TARGET_PARTS, SORTED_TEMP_TARGET_PARTS))
+
+# Every spec pattern needs a target part or an accommodation/capacity/storage word, so a text containing
+# none of them can't produce a spec and is skipped before parsing
+SPEC_PRESCREEN_REGEX = re.compile("|".join(re.escape(keyword) for keyword in sorted({part.lower() for parts in (TARGET_BUILD_PARTS, WEIGHT_TARGET_PARTS, DIAMETER_TARGET_PARTS, DIMENSION_TARGET_PARTS, ACCOMMODATION_TARGET_PARTS, STORAGE_TARGET_PARTS, POWER_TARGET_PARTS, DEPTH_RATING_TARGET_PARTS, PRESSURE_TARGET_PARTS, FLOW_CAPACITY_TARGET_PARTS, TEMP_TARGET_PARTS, SORTED_QUANTITY_TARGET_PARTS) for part in parts} | {"accommodat", "capacity", "stor"}, key=len, reverse=True)))
+
 # --- Entity Keywords for Capacity ---
 ENTITY_KEYWORDS_FOR_CAPACITY = {
     "Well": ["well", "wells", "wellbore"],
@@ -2461,6 +3458,65 @@ ENTITY_KEYWORDS_FOR_CAPACITY = {
     "Project": ["project", "package", "phase", "development project", "expansion"]
 }
 
+# --- Keywords for Offshore/Onshore Classification ---
+OFFSHORE_KEYWORD_SCORES = {
+    'offshore': 3, 'subsea': 3, 'fpso': 4, 'flng': 4, 'fsru': 4, 'floating': 2,
+    'deepwater': 2, 'mooring': 2, 'riser': 2, 'jack-up': 3, 'drillship': 3,
+    'spar': 3, 'tlp': 3, 'platform': 2, 'jacket': 2, 'hull': 1, 'caisson': 1,
+    'umbilical': 2, 'flowline': 2, 'topside': 2, 'topsides': 2, 'wellhead': 1,
+    'manifold': 1, 'christmas tree': 1, 'surf': 3, 'gbs': 2, 'sea bed': 2,
+    'marine': 2, 'vessel': 1, 'installation vessel': 3, 'anchor handling tug': 2,
+    'hook-up': 2, 'commissioning (offshore)': 3, 'offshore removal': 3, 'semisubmersible': 3,
+    'drilling rig': 2
+}
+ONSHORE_KEYWORD_SCORES = {
+    'onshore': 3, 'land-based': 3, 'refinery': 4, 'petrochemical': 4,
+    'gas plant': 3, 'pipeline terminal': 2, 'compressor station': 2,
+    'gas treatment': 2, 'processing plant': 3, 'storage tank': 1,
+    'industrial complex': 2, 'onshore disposal': 3, 'midstream': 1, 'downstream': 1,
+    'lng terminal': 3, 'storage facility': 2, 'gas processing plant': 3
+}
+BUILD_KEYWORDS_LOWER = [keyword.lower() for keyword in BUILD_PARTS.union(BUILD_PROCESS_OPTIONS)]
+# Extra weight for build keywords, by kind: (offshore, onshore)
+BUILD_KIND_WEIGHTS = {"offshore": (1.5, 0), "topsides": (0.5, 0), "offshore removal": (2, 0), "onshore disposal": (0, 2)}
+# Kinds that score 1.5 for whichever side the surrounding phrase points to: (kind, offshore phrases, onshore phrase)
+BUILD_CONTEXT_RULES = [
+    ("pipeline", ["subsea pipeline"], "onshore pipeline"),
+    ("installation", ["subsea installation", "offshore installation"], "onshore installation"),
+    ("decommissioning", ["offshore decommissioning"], "onshore decommissioning")
+]
+
+# --- Patterns for Summarization and AI Opinion Generation ---
+WHITESPACE_REGEX = re.compile(r'\s+')
+# Same substring semantics as checking each keyword with `in`, but one scan per sentence
+TEXTRANK_STATUS_REGEX = re.compile("|".join(['award', 'complete', 'delay', 'cancel', 'fid', 'tender', 'plan', 'construct', 'decommission', 'sign', 'secure']))
+# Scope keywords (as listed in 'Scope Details') grouped into the themes named in the opinion
+SCOPE_GROUPS = {
+    'full-field development (EPCI)': frozenset(['epc', 'epci', 'epcc']),
+    'SURF package': frozenset(['surf', 'pipelines', 'flowlines', 'riser', 'umbilical']),
+    'subsea production systems': frozenset(['subsea systems', 'tree', 'manifold', 'wellhead']),
+    'floating facilities': frozenset(['fpso', 'flng', 'fsru', 'tlp', 'spar']),
+    'fixed structures': frozenset(['jacket', 'hull', 'topside', 'topsides']),
+    'decommissioning activities': frozenset(['decommissioning'])
+}
+
+# --- Keywords for Contract Types ---
+CONTRACT_KEYWORDS = [
+    'EPC', 'EPCI', 'EPCC', 'FEED', 'LSTK', 'MOU', 'joint venture', 'framework agreement', 'EPMC', 'EPC-E', 'EPC-E/E',
+    'service agreement', 'subcontract', 'supply agreement', 'alliance agreement',
+    'lease agreement', 'charter agreement', 'drilling contract', 'construction contract',
+    'maintenance contract', 'operation and maintenance', 'O&M', 'engineering contract',
+    'procurement contract', 'turnkey contract', 'build-own-operate-transfer', 'BOOT',
+    'production sharing agreement', 'PSA', 'rig contract', 'vessel contract', 'consultancy contract'
+]
+CONTRACT_KEYWORD_REGEXES = {kw.lower(): (kw, re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)) for kw in CONTRACT_KEYWORDS}
+
+# --- Keywords for Company Filtering ---
+COMPANY_DESIGNATORS = ['co\\.', 'inc\\.', 'ltd\\.', 'gmbh', 'llc', 'corp\\.', 'plc', 'group', 'solutions', 'energy', 'oil & gas', 'international', 'holdings', 'corporation', 'industries', 'ventures', 'resources', 'services', 'systems']
+# Single alternation so each name is scanned once rather than once per designator
+COMPANY_DESIGNATOR_REGEX = re.compile(r'\b(?:' + '|'.join(COMPANY_DESIGNATORS) + r')\b')
+KNOWN_COMPANIES = ["Saudi Aramco", "Petronas", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor", "Chevron", "ConocoPhillips", "ENI", "Sinopec", "CNPC", "Gazprom", "Baker Hughes", "Schlumberger", "Halliburton", "TechnipFMC", "Subsea 7", "Saipem", "McDermott", "Wood", "Worley"]
+
 
 # --- Helper functions ---
 
@@ -2470,6 +3526,127 @@ def clean_text(text):
         return ""
     return str(text).strip()
 
+def keyword_scanner(keywords):
+    """Prepares (once) the distinct lowercased keywords to look for, in their original order."""
+    return tuple(dict.fromkeys(keywords))
+
+def find_keywords(scanner, text_lower):
+    """
+    Returns every keyword occurring as a substring of text_lower. Plain `in` checks (a fast C substring
+    search each) beat a single lookahead-alternation regex, which retries every keyword at every character.
+    """
+    return {kw for kw in scanner if kw in text_lower}
+
+def build_keyword_kind(kw_lower):
+    """Buckets a build keyword by the first classification rule it triggers (None if it scores nothing)."""
+    if "subsea" in kw_lower or "offshore" in kw_lower or kw_lower in ['fpso', 'flng', 'fsru', 'tlp', 'spar', 'jacket', 'hull']:
+        return "offshore"
+    for kind in ("topsides", "pipeline", "offshore removal", "onshore disposal", "installation", "decommissioning"):
+        if kind in kw_lower:
+            return kind
+    return None
+
+BUILD_KEYWORD_KINDS = [(kw_lower, kind) for kw_lower in BUILD_KEYWORDS_LOWER if (kind := build_keyword_kind(kw_lower))]
+OFFSHORE_ONSHORE_SCANNER = keyword_scanner([*OFFSHORE_KEYWORD_SCORES, *ONSHORE_KEYWORD_SCORES, *BUILD_KEYWORDS_LOWER, *(phrase for _, offshore_phrases, onshore_phrase in BUILD_CONTEXT_RULES for phrase in [*offshore_phrases, onshore_phrase])])
+STRONG_OFFSHORE_KEYWORDS = tuple(kw for kw, score in OFFSHORE_KEYWORD_SCORES.items() if score >= 4)
+ONSHORE_SIGNAL_KEYWORDS = tuple(sorted({*ONSHORE_KEYWORD_SCORES, *(kw_lower for kw_lower, kind in BUILD_KEYWORD_KINDS if BUILD_KIND_WEIGHTS.get(kind, (0, 0))[1]), *(onshore_phrase for _, _, onshore_phrase in BUILD_CONTEXT_RULES)}))
+CONTRACT_KEYWORD_SCANNER = keyword_scanner(list(CONTRACT_KEYWORD_REGEXES))
+# Scope keywords grouped by lowercase form, with the whole-word regex used to confirm single-word hits.
+SCOPE_KEYWORDS_BY_LOWER = {}
+for kw in ALL_BUILD_KEYWORDS:
+    SCOPE_KEYWORDS_BY_LOWER.setdefault(kw.lower(), []).append((kw, len(kw.split()) > 1))
+SCOPE_KEYWORD_REGEXES = {kw_lower: re.compile(r'\b' + re.escape(kw_lower) + r'\b') for kw_lower in SCOPE_KEYWORDS_BY_LOWER}
+SCOPE_KEYWORD_SCANNER = keyword_scanner(SCOPE_KEYWORDS_BY_LOWER)
+
+def cache_doc(key, doc):
+    """Keeps a parsed Doc for the other extractors, dropping the transformer output (the largest part of a trf Doc), which none of them read."""
+    if Doc.has_extension("trf_data"):
+        doc._.trf_data = None
+    _doc_cache[key] = doc
+
+def parse(text, disable=()):
+    """
+    Returns the spaCy Doc for text, reusing the parse from parse_batch() when one exists.
+    Docs parsed with pipeline components disabled are cached separately from full parses.
+    """
+    key = (text, disable) if disable else text
+    doc = _doc_cache.get(key)
+    if doc is None:
+        doc = nlp(text, disable=disable)
+        cache_doc(key, doc)
+    return doc
+
+def parse_batch(texts, disable=(), batch_size=PIPE_BATCH_SIZE, n_process=PIPE_N_PROCESS):
+    """
+    Parses every not-yet-seen text in a single nlp.pipe() pass so each article goes through the pipeline once,
+    skipping the components in disable. Batches larger than batch_size are spread over n_process worker processes.
+    """
+    pending = list(dict.fromkeys(text for text in texts if text and ((text, disable) if disable else text) not in _doc_cache))
+    if len(pending) <= batch_size:
+        n_process = 1 # Not worth starting worker processes (each loads its own copy of the model)
+    for text, doc in zip(pending, nlp.pipe(pending, batch_size=batch_size, disable=disable, n_process=n_process)):
+        cache_doc((text, disable) if disable else text, doc)
+
+def ensure_precomputed(doc):
+    """
+    Builds (once per Doc) the sentence views shared by the extractors and stores them in doc.user_data,
+    so the same cached Doc isn't re-split and re-lowercased by every extractor.
+    The whole text is lowercased in one call and sentences are sliced out of it by character offset.
+    """
+    views = doc.user_data.get("precomputed")
+    if views is None:
+        sents = list(doc.sents)
+        text_lower = doc.text.lower()
+        if len(text_lower) != len(doc.text):
+            text_lower = None # A few characters (e.g. "İ") change length when lowercased, so offsets would drift
+        views = doc.user_data["precomputed"] = {
+            "sents": sents,
+            "text_lower": text_lower,
+            "sents_lower": [lower_span(text_lower, sent) for sent in sents],
+            "sent_index": [sent_i for sent_i, sent in enumerate(sents) for _ in range(len(sent))], # Token index -> sentence index
+            "token_starts": [token.idx for token in doc], # Token index -> character offsets, for slicing match text
+            "token_ends": [token.idx + len(token) for token in doc],
+            "sents_v": [sent for sent in sents if len(sent.text.strip()) > 5 and sent.vector_norm],
+        }
+    return views
+
+def lower_span(text_lower, span):
+    """Returns span's lowercased text, sliced from the Doc's lowercased text when it is available."""
+    return text_lower[span.start_char:span.end_char] if text_lower is not None else span.text.lower()
+
+@lru_cache(maxsize=None)
+def designator_context_regex(company_name):
+    """Compiles (once per name) a pattern for a designator directly before or after company_name."""
+    name = re.escape(company_name)
+    designators = '|'.join(COMPANY_DESIGNATORS)
+    return re.compile(r'\b' + name + r'\s+(?:' + designators + r')\b|\b(?:' + designators + r')\s+' + name + r'\b', re.IGNORECASE)
+
+# Grammatical pattern for names like "Johan Sverdrup field", shared by every extract_project_profiles() call
+PROJECT_NAME_MATCHER = Matcher(nlp.vocab)
+PROJECT_NAME_MATCHER.add("FIELD_PROJECT_NAME", [[
+    {"POS": {"IN": ["PROPN", "NOUN", "ADJ"]}, "OP": "+"},
+    {"LOWER": {"IN": ["field", "project", "development", "oilfield", "block", "area", "licence", "basin", "phase", "package", "discovery"]}}
+]])
+
+def scan_profile_sentence(sent_text):
+    """
+    Returns the (depth, distance, capacity) strings for a sentence, each taken from the first match
+    of its kind (None if there is none), from a single PROFILE_SENTENCE_REGEX pass.
+    """
+    first_matches = {}
+    for match in PROFILE_SENTENCE_REGEX.finditer(sent_text):
+        first_matches.setdefault(match.lastgroup, match)
+    depth = distance = capacity = None
+    if (depth_match := first_matches.get("depth")):
+        unit = 'm' if 'm' in depth_match["depth_unit"].lower() else 'ft'
+        depth = f"{depth_match['depth_value'].replace(',', '')}{unit}"
+    if (dist_match := first_matches.get("distance")):
+        unit = 'km' if 'k' in dist_match["distance_unit"].lower() else 'miles'
+        distance = f"{dist_match['distance_value'].replace(',', '')}{unit} offshore"
+    if "money" not in first_matches and (cap_match := first_matches.get("capacity")):
+        capacity = ' '.join(cap_match["capacity"].split())
+    return depth, distance, capacity
+
 def extract_project_profiles(text):
     """
     Identifies project/field names and builds a detailed profile for each,
@@ -2477,7 +3654,10 @@ def extract_project_profiles(text):
     """
     text = clean_text(text)
     if not text: return ''
-    doc = nlp(text)
+    if SKIP_SPACY_ON_NO_TRIGGER and not PROFILE_TRIGGER_REGEX.search(text): return ''
+    doc = parse(text)
+    views = ensure_precomputed(doc)
+    text_lower = views["text_lower"]
     
     # --- Step 1: Enhanced Field/Project Name Identification ---
     found_names = set()
@@ -2493,23 +3673,17 @@ def extract_project_profiles(text):
         found_names.add(match.strip())
 
     # Matcher for grammatical patterns
-    matcher = Matcher(nlp.vocab)
-    pattern_name_designator = [
-        {"POS": {"IN": ["PROPN", "NOUN", "ADJ"]}, "OP": "+"}, 
-        {"LOWER": {"IN": ["field", "project", "development", "oilfield", "block", "area", "licence", "basin", "phase", "package", "discovery"]}}
-    ]
-    matcher.add("FIELD_PROJECT_NAME", [pattern_name_designator])
-    matches = matcher(doc)
+    matches = PROJECT_NAME_MATCHER(doc)
     for match_id, start, end in matches:
         span = doc[start:end]
         # Avoid matching generic phrases like "the project"
-        if not (span.text.lower().startswith("the ") and len(span.text.split()) <= 2):
+        if not (lower_span(text_lower, span).startswith("the ") and len(span.text.split()) <= 2):
             found_names.add(span.text.strip())
 
     # NER-based identification
     for ent in doc.ents:
         if ent.label_ in ['PRODUCT', 'FAC', 'WORK_OF_ART']: # WORK_OF_ART can sometimes catch project names
-            if any(term in ent.text.lower() for term in ['project', 'field', 'development', 'phase', 'package']):
+            if any(term in lower_span(text_lower, ent) for term in ['project', 'field', 'development', 'phase', 'package']):
                 found_names.add(ent.text.strip())
             # Add proper nouns that are likely project names
             elif len(ent.text.split()) > 1 and all(t.istitle() or t.isupper() for t in ent.text.split()):
@@ -2527,198 +3701,157 @@ def extract_project_profiles(text):
         if len(name) < 4 and not re.search(r'\d', name) and name.lower() not in ['block', 'field', 'project', 'phase']:
             continue
 
+    # Drop every name contained in another one (case-insensitively). Only a longer name, or a different
+    # casing of the same name, can contain it, so walk longest first and check each name against
+    # the names already seen, lowercasing each name once
     candidate_names = set()
-    names_list = sorted(list(found_names), key=len, reverse=True)
-    for i, name1 in enumerate(names_list):
-        is_substring = False
-        for j, name2 in enumerate(names_list):
-            if i != j and name1.lower() in name2.lower():
-                is_substring = True
-                break
-        if not is_substring:
-            candidate_names.add(name1)
+    lower_counts = Counter(name.lower() for name in found_names)
+    seen_names_lower = "\x00"
+    for name in sorted(found_names, key=len, reverse=True):
+        name_lower = name.lower()
+        if lower_counts[name_lower] == 1 and name_lower not in seen_names_lower:
+            candidate_names.add(name)
+        seen_names_lower += name_lower + "\x00"
     
     if not candidate_names:
         return ''
 
     # --- Step 2: Build Profiles for Each Identified Name ---
-    profiles = {name: {} for name in candidate_names}
-    
-    for sent in doc.sents:
-        sent_text_lower = sent.text.lower()
-        
-        for name in candidate_names:
-            # Check if the name (or a significant part of it) is in the sentence
-            # This handles cases like "the Johan Sverdrup development" when name is "Johan Sverdrup"
-            if any(part.lower() in sent_text_lower for part in name.split() if len(part) > 3):
-                
-                # Extract Water Depth
-                depth_match = re.search(r"in ([\d,]+(?:\.\d+)?)\s*(meters?|m|feet|ft)\s+of water", sent_text_lower)
-                if depth_match and 'Depth' not in profiles[name]:
-                    unit = 'm' if 'm' in depth_match.group(2) else 'ft'
-                    profiles[name]['Depth'] = f"{depth_match.group(1).replace(',', '')}{unit}"
-                
-                # Extract Distance
-                dist_match = re.search(r"([\d,]+(?:\.\d+)?)\s*(km|kilometers?|miles?)\s*(offshore|from the coast)", sent_text_lower)
-                if dist_match and 'Distance' not in profiles[name]:
-                    unit = 'km' if 'k' in dist_match.group(2) else 'miles'
-                    profiles[name]['Distance'] = f"{dist_match.group(1).replace(',', '')}{unit} offshore"
-                    
-                # Extract Timeline/Status
-                if 'Timeline' not in profiles[name]:
-                    timeline_keywords = {
-                        "Startup": ["first oil", "first gas", "start-up", "online", "operational by", "come onstream", "begin production"],
-                        "Shutdown": ["shut down", "cease production", "decommissioning in", "abandonment in", "plug and abandon"]
-                    }
-                    timeline_found = None
-                    for status, keywords in timeline_keywords.items():
-                        for kw in keywords:
-                            if kw in sent_text_lower:
-                                for ent in sent.ents:
-                                    if ent.label_ == 'DATE':
-                                        timeline_found = f"{status} {ent.text}"
-                                        break
-                                if timeline_found: break
-                        if timeline_found: break
-                    if timeline_found:
-                        profiles[name]['Timeline'] = timeline_found
-
-                # Extract Capacity
-                if 'Capacity' not in profiles[name]:
-                    if not re.search(r'[\$€£]', sent.text): # Avoid matching money
-                        CAPACITY_REGEX = r"([\d,.]+(?:\.\d+)?\s*(?:million|billion|thousand|mn|bn|k)?\s*(?:bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|tonnes/year|t/y|t/d|barrels|tonnes|cubic\s+feet|cubic\s+meters))"
-                        cap_match = re.search(CAPACITY_REGEX, sent.text, re.IGNORECASE)
-                        if cap_match:
-                            profiles[name]['Capacity'] = ' '.join(cap_match.group(1).split())
+    profiles = {field: {} for field in PROFILE_FIELDS}
+
+    # Map every significant name part to the names containing it, so each part is checked once per
+    # (already lowercased) sentence. This handles cases like "the Johan Sverdrup development" when name is "Johan Sverdrup"
+    part_names = {}
+    for name in candidate_names:
+        for part in name.split():
+            if len(part) > 3:
+                part_names.setdefault(part.lower(), set()).add(name)
+
+    for sent, sent_text_lower in (zip(views["sents"], views["sents_lower"]) if part_names else ()):
+        sent_names = {name for part, names in part_names.items() if part in sent_text_lower for name in names}
+        if not sent_names:
+            continue
+        # Water depth, distance, capacity and timeline don't depend on the name, so the sentence
+        # (and its entities) is scanned once
+        depth, distance, capacity = scan_profile_sentence(sent.text)
+        timeline_found = None
+        first_date = next((ent.text for ent in sent.ents if ent.label_ == 'DATE'), None)
+        if first_date:
+            for status, keywords in PROFILE_TIMELINE_KEYWORDS.items():
+                if any(kw in sent_text_lower for kw in keywords):
+                    timeline_found = f"{status} {first_date}"
+                    break
+
+        # Each name keeps the first water depth, distance, timeline and capacity (sentences
+        # mentioning money have no capacity) found for it
+        for field, value in (("Depth", depth), ("Distance", distance), ("Timeline", timeline_found), ("Capacity", capacity)):
+            if value:
+                field_values = profiles[field]
+                for name in sent_names:
+                    field_values.setdefault(name, value)
 
     # --- Step 3: Format the Output String ---
     output_parts = []
-    for name in sorted(list(candidate_names)):
-        details = profiles[name]
-        if not details:
-            output_parts.append(name)
-        else:
-            ordered_details = []
-            if 'Capacity' in details: ordered_details.append(f"Capacity: {details['Capacity']}")
-            if 'Timeline' in details: ordered_details.append(f"Timeline: {details['Timeline']}")
-            if 'Depth' in details: ordered_details.append(f"Depth: {details['Depth']}")
-            if 'Distance' in details: ordered_details.append(f"Distance: {details['Distance']}")
-            detail_str = ", ".join(ordered_details)
-            output_parts.append(f"{name} ({detail_str})")
-            
+    for name in sorted(candidate_names):
+        ordered_details = [f"{field}: {profiles[field][name]}" for field in PROFILE_FIELDS if name in profiles[field]]
+        output_parts.append(f"{name} ({', '.join(ordered_details)})" if ordered_details else name)
+
     return "; ".join(output_parts)
 
 
+# "the drillship Deepsea Atlantic" style mentions, shared by every extract_vessel_details() call
+VESSEL_NAME_MATCHER = Matcher(nlp.vocab)
+VESSEL_NAME_MATCHER.add("VESSEL_NAMED", [[{"LOWER": {"IN": ["vessel", "ship", "rig", "drillship", "flotel"]}}, {"POS": "PROPN", "OP": "+"}]])
+
 def extract_vessel_details(text):
     """
     Identifies vessels mentioned in the text and extracts key details like
     type, owner, charterer, day rate, work scope, and contract duration.
     """
     text = clean_text(text)
-    if not text:
+    if not text or (SKIP_SPACY_ON_NO_TRIGGER and not VESSEL_TRIGGER_REGEX.search(text)):
         return ''
-    doc = nlp(text)
-    vessel_profiles = {}
+    doc = parse(text)
+    views = ensure_precomputed(doc)
+    text_lower = views["text_lower"]
+    vessel_fields = {field: {} for field in VESSEL_FIELDS}
+    vessel_types, vessel_owners, vessel_charterers, vessel_day_rates, vessel_durations, vessel_scopes = vessel_fields.values()
+    sent_views = {}
 
     # --- Step 1: Identify potential vessel names ---
     potential_vessel_spans = []
     for ent in doc.ents:
         if ent.label_ in ["PRODUCT", "FAC", "ORG"]:
-            ent_text_lower = ent.text.lower()
+            ent_text_lower = lower_span(text_lower, ent)
             if any(char.isdigit() for char in ent.text) or '-' in ent.text or any(v_type in ent_text_lower for v_type in VESSEL_TYPES):
                 potential_vessel_spans.append(ent)
 
-    matcher = Matcher(nlp.vocab)
-    pattern = [{"LOWER": {"IN": ["vessel", "ship", "rig", "drillship", "flotel"]}}, {"POS": "PROPN", "OP": "+"}]
-    matcher.add("VESSEL_NAMED", [pattern])
-    matches = matcher(doc)
+    matches = VESSEL_NAME_MATCHER(doc)
     for _, start, end in matches:
         potential_vessel_spans.append(doc[start:end])
 
     # --- Step 2: Build profile for each potential vessel ---
     for vessel_span in potential_vessel_spans:
         vessel_name = vessel_span.text
-        for v_type in SORTED_VESSEL_TYPES:
-            if vessel_name.lower().endswith(f" {v_type}"):
-                vessel_name = vessel_name[:-(len(v_type)+1)].strip()
+        vessel_name_lower = vessel_name.lower()
+        for v_type_suffix in SORTED_VESSEL_TYPE_SUFFIXES:
+            if vessel_name_lower.endswith(v_type_suffix):
+                vessel_name = vessel_name[:-len(v_type_suffix)].strip()
                 break
         
         if vessel_name.lower() in VESSEL_TYPES or len(vessel_name) < 4:
             continue
 
-        sent = vessel_span.sent
-        sent_text_lower = sent.text.lower()
-
-        if vessel_name not in vessel_profiles:
-            vessel_profiles[vessel_name] = {}
-        profile = vessel_profiles[vessel_name]
+        # Several vessels can share a sentence, so its organisations are looked up once
+        sent_i = views["sent_index"][vessel_span.start]
+        sent_view = sent_views.get(sent_i)
+        if sent_view is None:
+            sent_text_lower = views["sents_lower"][sent_i]
+            sent_orgs = [(ent.text, f"{ent.text}'s".lower() in sent_text_lower) for ent in views["sents"][sent_i].ents if ent.label_ == 'ORG']
+            sent_view = sent_views[sent_i] = (sent_text_lower, sent_orgs, VESSEL_CHARTER_VERB_REGEX.search(sent_text_lower) is not None)
+        sent_text_lower, sent_orgs, has_charter_verb = sent_view
 
         # Extract Type
-        if 'Type' not in profile:
-            for v_type in SORTED_VESSEL_TYPES:
+        if vessel_name not in vessel_types:
+            for v_type, v_type_title in SORTED_VESSEL_TYPE_TITLES:
                 if v_type in sent_text_lower:
-                    profile['Type'] = v_type.title()
+                    vessel_types[vessel_name] = v_type_title
                     break
 
         # Extract Owner and Charterer
-        for ent in sent.ents:
-            if ent.label_ == 'ORG':
-                if f"{ent.text}'s".lower() in sent_text_lower and 'Owner' not in profile:
-                    profile['Owner'] = ent.text
-                if any(verb in sent_text_lower for verb in VESSEL_CHARTER_VERBS) and 'Charterer' not in profile:
-                    if 'Owner' not in profile or profile['Owner'] != ent.text:
-                        profile['Charterer'] = ent.text
+        for org_text, is_possessive in sent_orgs:
+            if is_possessive and vessel_name not in vessel_owners:
+                vessel_owners[vessel_name] = org_text
+            if has_charter_verb and vessel_name not in vessel_charterers:
+                if vessel_owners.get(vessel_name) != org_text:
+                    vessel_charterers[vessel_name] = org_text
 
         # Extract Day Rate
-        day_rate_match = re.search(r"((?:[\$€£]|usd)\s?[\d,]+(?:\.\d+)?(?:k| thousand)?)\s*(?:per day|a day|dayrate)", sent_text_lower)
-        if day_rate_match and 'Day Rate' not in profile:
-            profile['Day Rate'] = day_rate_match.group(1).replace(" thousand", "k")
+        if vessel_name not in vessel_day_rates and (day_rate_match := VESSEL_DAY_RATE_REGEX.search(sent_text_lower)):
+            vessel_day_rates[vessel_name] = day_rate_match.group(1).replace(" thousand", "k")
 
         # Extract Duration
-        duration_match = re.search(r"(?:for|of)\s+((?:a firm period of\s+)?(?:up to\s+)?(?:\d+|[\w\s]+)\s(?:year|month|week|day)s?)", sent_text_lower)
-        if duration_match and 'Duration' not in profile:
-            profile['Duration'] = duration_match.group(1).strip()
+        if vessel_name not in vessel_durations and (duration_match := VESSEL_DURATION_REGEX.search(sent_text_lower)):
+            vessel_durations[vessel_name] = duration_match.group(1).strip()
 
         # Extract Work Scope
-        scope_match = re.search(r"(?:to|for|perform|carry out)\s+((?:[\w\s-]+\s)?(?:{})(?:[\w\s-]+)?)".format("|".join(VESSEL_SCOPE_KEYWORDS)), sent_text_lower)
-        if scope_match and 'Scope' not in profile:
-            scope_text = re.sub(r'\s+', ' ', scope_match.group(1)).strip(" .,").strip()
-            profile['Scope'] = scope_text
+        if vessel_name not in vessel_scopes and (scope_match := VESSEL_SCOPE_REGEX.search(sent_text_lower)):
+            vessel_scopes[vessel_name] = WHITESPACE_REGEX.sub(' ', scope_match.group(1)).strip(" .,").strip()
 
     # --- Step 3: Format Output ---
+    # Only vessels with at least one detail are listed
     output_parts = []
-    for vessel_name, profile in sorted(vessel_profiles.items()):
-        if not profile:
-            continue # Don't add vessels for which we found no details
-
-        details = []
-        if 'Type' in profile: details.append(f"Type: {profile['Type']}")
-        if 'Owner' in profile: details.append(f"Owner: {profile['Owner']}")
-        if 'Charterer' in profile: details.append(f"Charterer: {profile['Charterer']}")
-        if 'Day Rate' in profile: details.append(f"Day Rate: {profile['Day Rate']}")
-        if 'Duration' in profile: details.append(f"Duration: {profile['Duration']}")
-        if 'Scope' in profile: details.append(f"Scope: {profile['Scope']}")
-
-        detail_str = ", ".join(details)
-        if detail_str:
-            output_parts.append(f"{vessel_name} ({detail_str})")
-        else:
-            output_parts.append(vessel_name)
+    for vessel_name in sorted(set().union(*vessel_fields.values())):
+        details = [f"{field}: {vessel_fields[field][vessel_name]}" for field in VESSEL_FIELDS if vessel_name in vessel_fields[field]]
+        output_parts.append(f"{vessel_name} ({', '.join(details)})")
 
     return "; ".join(output_parts)
 
 
-def extract_build_part_specifications(text):
-    """
-    Extracts specifications for build parts, including length and weight.
-    Detects build part names and associated parameters (e.g., "10 km pipeline", "5,000-tonne jacket").
-    """
-    text = clean_text(text)
-    if not text:
-        return ''
-    doc = nlp(text)
+# --- Build Part Specification Patterns ---
+def build_spec_matcher():
+    """Returns a Matcher with every build-part spec pattern, labelled by spec type (LENGTH_SPEC, WEIGHT_SPEC, ...)."""
     matcher = Matcher(nlp.vocab)
-    parsed_specs_set = set()
 
     # --- LENGTH PATTERNS ---
     # Pattern 1: NUMBER UNIT BUILD_PART (e.g., "10 km pipeline")
@@ -2795,7 +3928,6 @@ def extract_build_part_specifications(text):
         {"LOWER": {"IN": DIAMETER_UNITS}},
         {"LOWER": "in"}, {"LOWER": "diameter"}
     ]
-    matcher.add("DIAMETER_SPEC", [diameter_pattern1, diameter_pattern2, diameter_pattern3])
     # Pattern 4 for Diameter: [NUM] to [NUM] [UNIT] [PART]
     diameter_pattern4 = [
         {"LIKE_NUM": True},
@@ -2955,196 +4087,182 @@ def extract_build_part_specifications(text):
     ]
     matcher.add("POWER_SPEC", [power_pattern1])
 
-    # --- MOORING SYSTEM PATTERNS ---
-    # e.g., "a 12-point spread mooring system", "internal turret mooring"
-    mooring_pattern1 = [
-        {"LIKE_NUM": True},
-        {"IS_PUNCT": True, "LOWER": "-", "OP": "?"},
-        {"LOWER": "point"},
-        {"LOWER": {"IN": MOORING_TYPES}, "OP": "?"},
-        {"LOWER": "mooring"},
-        {"LOWER": "system", "OP": "?"}
-    ]
-
-    matches = matcher(doc)
-
-    for match_id, start, end in matches:
-        string_id = nlp.vocab.strings[match_id]
-        span = doc[start:end]
-        span_text = span.text
-        span_text_lower = span_text.lower()
-        
-        identified_part_canonical = None
-        identified_spec_str = None
-
-        if string_id == "LENGTH_SPEC":
-            for part_kw in SORTED_TARGET_BUILD_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            num_match = NUM_UNIT_REGEX_SPACED.search(span_text) or NUM_UNIT_REGEX_NOSPACE.search(span_text) or NUM_DASH_UNIT_REGEX.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                if unit.lower() in ["kilometer", "kilometers"]: unit = "km"
-                elif unit.lower() in ["meter", "meters", "metres"]: unit = "m"
-                elif unit.lower() in ["mile", "miles"]: unit = "miles"
-                elif unit.lower() in ["foot", "feet"]: unit = "ft"
-                identified_spec_str = f"{value} {unit}"
-            else: # Fallback for number words like "ten kilometers"
-                num_tok, unit_tok = None, None
-                for token in span:
-                    if token.like_num: num_tok = token.text
-                    if token.lower_ in LENGTH_UNITS: unit_tok = token.lower_
-                if num_tok and unit_tok:
-                    identified_spec_str = f"{num_tok} {unit_tok}"
-
-        elif string_id == "WEIGHT_SPEC":
-            for part_kw in SORTED_WEIGHT_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            num_match = NUM_WEIGHT_UNIT_REGEX_SPACED.search(span_text) or NUM_WEIGHT_UNIT_REGEX_NOSPACE.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                value = value.replace(',', '') # remove commas from numbers
-                if unit.lower() in ["tonne", "tonnes", "ton", "te"]: unit = "t"
-                elif unit.lower() in ["kilogram", "kilograms"]: unit = "kg"
-                elif unit.lower() in ["pound", "pounds"]: unit = "lbs"
-                identified_spec_str = f"{value} {unit}"
-            else: # Fallback for number words
-                num_tok, unit_tok = None, None
-                for token in span:
-                    if token.like_num: num_tok = token.text
-                    if token.lower_ in WEIGHT_UNITS: unit_tok = token.lower_
-                if num_tok and unit_tok:
-                    identified_spec_str = f"{num_tok} {unit_tok}"
-
-        elif string_id == "DIAMETER_SPEC":
-            for part_kw in SORTED_DIAMETER_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            
-            range_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:to|-)\s*(\d+(?:\.\d+)?)\s*(" + "|".join(DIAMETER_UNITS) + r")", span_text, re.IGNORECASE)
-            if range_match:
-                val1, val2, unit_str = range_match.groups()
-                val1 = val1.replace(',', '')
-                val2 = val2.replace(',', '')
-                if unit_str.lower() in ['inch', 'inches', '"']: unit = 'in'
-                elif unit_str.lower() in ['millimeter', 'millimeters']: unit = 'mm'
-                elif unit_str.lower() in ['centimeter', 'centimeters']: unit = 'cm'
-                elif unit_str.lower() in ['meter', 'meters']: unit = 'm'
-                elif unit_str.lower() in ['foot', 'feet']: unit = 'ft'
-                else: unit = unit_str.lower()
-                identified_spec_str = f"{val1}-{val2} {unit} diameter"
-            else:
-                num_match = NUM_DIAMETER_UNIT_REGEX_SPACED.search(span_text) or NUM_DASH_DIAMETER_UNIT_REGEX.search(span_text) or NUM_DIAMETER_UNIT_REGEX_NOSPACE.search(span_text)
-                if num_match:
-                    value, unit = num_match.groups()
-                    value = value.replace(',', '') # remove commas from numbers
-                    if unit.lower() in ['inch', 'inches', '"']: unit = 'in'
-                    elif unit.lower() in ['millimeter', 'millimeters']: unit = 'mm'
-                    elif unit.lower() in ['centimeter', 'centimeters']: unit = 'cm'
-                    elif unit.lower() in ['foot', 'feet']: unit = 'ft'
-                    identified_spec_str = f"{value} {unit} diameter"
-                else: # Fallback for number words
-                    num_tok, unit_tok = None, None
-                    for token in span:
-                        if token.like_num: num_tok = token.text
-                        if token.lower_ in DIAMETER_UNITS: unit_tok = token.lower_
-                    if num_tok and unit_tok:
-                        identified_spec_str = f"{num_tok} {unit_tok} diameter"
-
-        elif string_id == "DEPTH_RATING_SPEC":
-            for part_kw in SORTED_DEPTH_RATING_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            num_match = NUM_DEPTH_RATING_UNIT_REGEX.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                value = value.replace(',', '')
-                if unit.lower() in ['meter', 'meters']: unit = 'm'
-                elif unit.lower() in ['feet']: unit = 'ft'
-                identified_spec_str = f"{value} {unit} depth"
-            else: # Fallback for number words
-                num_tok, unit_tok = None, None
-                for token in span:
-                    if token.like_num: num_tok = token.text
-                    if token.lower_ in DEPTH_RATING_UNITS: unit_tok = token.lower_
-                if num_tok and unit_tok:
-                    identified_spec_str = f"{num_tok} {unit_tok} depth"
-
-        elif string_id == "PRESSURE_SPEC":
-            for part_kw in SORTED_PRESSURE_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            num_match = NUM_PRESSURE_UNIT_REGEX.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                value = value.replace(',', '').lower()
-                if 'k' in value:
-                    value = str(int(float(value.replace('k', '')) * 1000))
-                identified_spec_str = f"{value} {unit.lower()}"
-
-        elif string_id == "QUANTITY_SPEC":
-            num_token, part_span = None, None
-            for token in span:
-                if token.like_num:
-                    try: # Avoid matching years
-                        num_val = float(token.text)
-                        if 1950 < num_val < 2100: continue
-                        num_token = token
-                    except ValueError: # For number words like "three"
-                        num_token = token
-            
-            # Find the part name within the matched span
-            for part_kw in SORTED_QUANTITY_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            
-            if num_token and identified_part_canonical:
-                # Heuristic: if the part is singular and number is large, it might be a model number.
-                # This is a simple check; more complex logic could be added.
-                if not identified_part_canonical.endswith('s') and num_token.is_digit and float(num_token.text) > 100:
-                    continue
-                identified_spec_str = f"{num_token.text} units"
+    return matcher
+
+# Compiled once at import and shared by every extract_build_part_specifications() call
+BUILD_SPEC_MATCHER = build_spec_matcher()
+
+def parse_length_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a LENGTH_SPEC match (e.g. "10 km pipeline")."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_TARGET_BUILD_PART_NAMES, span_text_lower)
+    num_match = NUM_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        unit = LENGTH_UNIT_NORMALIZATION.get(unit.lower(), unit)
+        identified_spec_str = f"{value} {unit}"
+    else: # Fallback for number words like "ten kilometers"
+        num_tok, unit_tok = last_num_unit(doc[start:end], LENGTH_UNIT_SET)
+        if num_tok and unit_tok:
+            identified_spec_str = f"{num_tok} {unit_tok}"
+    return identified_part_canonical, identified_spec_str
+
+def parse_weight_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a WEIGHT_SPEC match (e.g. "5,000-tonne jacket")."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_WEIGHT_TARGET_PART_NAMES, span_text_lower)
+    num_match = NUM_WEIGHT_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        value = value.replace(',', '') # remove commas from numbers
+        unit = WEIGHT_UNIT_NORMALIZATION.get(unit.lower(), unit)
+        identified_spec_str = f"{value} {unit}"
+    else: # Fallback for number words
+        num_tok, unit_tok = last_num_unit(doc[start:end], WEIGHT_UNIT_SET)
+        if num_tok and unit_tok:
+            identified_spec_str = f"{num_tok} {unit_tok}"
+    return identified_part_canonical, identified_spec_str
+
+def parse_diameter_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a DIAMETER_SPEC match, including ranges like "10 to 12-inch"."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_DIAMETER_TARGET_PART_NAMES, span_text_lower)
+
+    range_match = DIAMETER_RANGE_REGEX.search(span_text)
+    if range_match:
+        val1, val2, unit_str = range_match.groups()
+        val1 = val1.replace(',', '')
+        val2 = val2.replace(',', '')
+        unit = DIAMETER_RANGE_UNIT_NORMALIZATION.get(unit_str.lower(), unit_str.lower())
+        identified_spec_str = f"{val1}-{val2} {unit} diameter"
+    else:
+        num_match = NUM_DIAMETER_UNIT_REGEX.search(span_text)
+        if num_match:
+            value, unit = num_match.groups()
+            value = value.replace(',', '') # remove commas from numbers
+            unit = DIAMETER_UNIT_NORMALIZATION.get(unit.lower(), unit)
+            identified_spec_str = f"{value} {unit} diameter"
+        else: # Fallback for number words
+            num_tok, unit_tok = last_num_unit(doc[start:end], DIAMETER_UNIT_SET)
+            if num_tok and unit_tok:
+                identified_spec_str = f"{num_tok} {unit_tok} diameter"
+    return identified_part_canonical, identified_spec_str
+
+def parse_depth_rating_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a DEPTH_RATING_SPEC match."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_DEPTH_RATING_TARGET_PART_NAMES, span_text_lower)
+    num_match = NUM_DEPTH_RATING_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        value = value.replace(',', '')
+        unit = DEPTH_RATING_UNIT_NORMALIZATION.get(unit.lower(), unit)
+        identified_spec_str = f"{value} {unit} depth"
+    else: # Fallback for number words
+        num_tok, unit_tok = last_num_unit(doc[start:end], DEPTH_RATING_UNIT_SET)
+        if num_tok and unit_tok:
+            identified_spec_str = f"{num_tok} {unit_tok} depth"
+    return identified_part_canonical, identified_spec_str
+
+def parse_pressure_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a PRESSURE_SPEC match, expanding "15k" to 15000."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_PRESSURE_TARGET_PART_NAMES, span_text_lower)
+    num_match = NUM_PRESSURE_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        value = value.replace(',', '').lower()
+        if 'k' in value:
+            value = str(int(float(value.replace('k', '')) * 1000))
+        identified_spec_str = f"{value} {unit.lower()}"
+    return identified_part_canonical, identified_spec_str
+
+def parse_quantity_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a QUANTITY_SPEC match."""
+    identified_spec_str = None
+    num_token = None
+    for token in doc[start:end]:
+        if token.like_num:
+            try: # Avoid matching years
+                num_val = float(token.text)
+                if 1950 < num_val < 2100: continue
+                num_token = token
+            except ValueError: # For number words like "three"
+                num_token = token
+
+    # Find the part name within the matched span
+    identified_part_canonical = find_canonical_part(SORTED_QUANTITY_TARGET_PART_NAMES, span_text_lower)
+
+    if num_token and identified_part_canonical:
+        # Heuristic: if the part is singular and number is large, it might be a model number.
+        # This is a simple check; more complex logic could be added.
+        if not identified_part_canonical.endswith('s') and num_token.is_digit and float(num_token.text) > 100:
+            return None
+        identified_spec_str = f"{num_token.text} units"
+    return identified_part_canonical, identified_spec_str
+
+def parse_flow_capacity_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a FLOW_CAP_SPEC match."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_FLOW_CAPACITY_TARGET_PART_NAMES, span_text_lower)
+    num_match = NUM_FLOW_CAPACITY_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        value = value.replace(',', '')
+        identified_spec_str = f"{value} {unit.lower()} capacity"
+    return identified_part_canonical, identified_spec_str
+
+def parse_temperature_spec(doc, start, end, span_text, span_text_lower):
+    """Returns (canonical part, spec string) for a TEMP_SPEC match, looking in the sentence when the span names no part."""
+    identified_spec_str = None
+    identified_part_canonical = find_canonical_part(SORTED_TEMP_TARGET_PART_NAMES, span_text_lower)
+    # If no part in span (e.g. "100 C operating temperature"), look in sentence
+    if identified_part_canonical is None:
+        views = ensure_precomputed(doc)
+        identified_part_canonical = find_canonical_part(SORTED_TEMP_TARGET_PART_NAMES, views["sents_lower"][views["sent_index"][start]])
+
+    num_match = NUM_TEMP_UNIT_REGEX.search(span_text)
+    if num_match:
+        value, unit = num_match.groups()
+        unit = unit.replace('°', '').lower()
+        unit = TEMP_UNIT_NORMALIZATION.get(unit, unit)
+        identified_spec_str = f"{value} {unit} temperature"
+    return identified_part_canonical, identified_spec_str
+
+# Match id (hash of the label in the vocab's StringStore) -> parser for that kind of spec
+SPEC_PARSERS = {nlp.vocab.strings[label]: parser for label, parser in {
+    "LENGTH_SPEC": parse_length_spec, "WEIGHT_SPEC": parse_weight_spec, "DIAMETER_SPEC": parse_diameter_spec,
+    "DEPTH_RATING_SPEC": parse_depth_rating_spec, "PRESSURE_SPEC": parse_pressure_spec, "QUANTITY_SPEC": parse_quantity_spec,
+    "FLOW_CAP_SPEC": parse_flow_capacity_spec, "TEMP_SPEC": parse_temperature_spec
+}.items()}
 
-        elif string_id == "FLOW_CAP_SPEC":
-            for part_kw in SORTED_FLOW_CAPACITY_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    break
-            num_match = NUM_FLOW_CAPACITY_UNIT_REGEX.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                value = value.replace(',', '')
-                identified_spec_str = f"{value} {unit.lower()} capacity"
+def extract_build_part_specifications(text):
+    """
+    Extracts specifications for build parts, including length and weight.
+    Detects build part names and associated parameters (e.g., "10 km pipeline", "5,000-tonne jacket").
+    """
+    text = clean_text(text)
+    if not text or not SPEC_PRESCREEN_REGEX.search(text.lower()):
+        return ''
+    doc = parse(text)
+    views = ensure_precomputed(doc)
+    doc_text, text_lower = doc.text, views["text_lower"]
+    token_starts, token_ends = views["token_starts"], views["token_ends"]
+    parsed_specs_set = set()
 
-        elif string_id == "TEMP_SPEC":
-            part_found_in_span = False
-            for part_kw in SORTED_TEMP_TARGET_PARTS:
-                if part_kw.lower() in span_text_lower:
-                    identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                    part_found_in_span = True
-                    break
-            # If no part in span (e.g. "100 C operating temperature"), look in sentence
-            if not part_found_in_span:
-                sent_text_lower = span.sent.text.lower()
-                for part_kw in SORTED_TEMP_TARGET_PARTS:
-                    if part_kw.lower() in sent_text_lower:
-                        identified_part_canonical = part_kw.title() if ' ' in part_kw else part_kw.capitalize()
-                        break
+    matches = BUILD_SPEC_MATCHER(doc)
 
-            num_match = NUM_TEMP_UNIT_REGEX.search(span_text)
-            if num_match:
-                value, unit = num_match.groups()
-                unit = unit.replace('°', '').lower()
-                if unit == 'c': unit = 'Celsius'
-                if unit == 'f': unit = 'Fahrenheit'
-                identified_spec_str = f"{value} {unit} temperature"
+    for match_id, start, end in matches:
+        # Slice the match out of the text by character offset; parsers only build a Span for the token fallbacks
+        start_char, end_char = token_starts[start], token_ends[end - 1]
+        span_text = doc_text[start_char:end_char]
+        span_text_lower = text_lower[start_char:end_char] if text_lower is not None else span_text.lower()
+        # Dispatch on the integer match id instead of comparing label strings
+        spec_parser = SPEC_PARSERS.get(match_id)
+        spec = spec_parser(doc, start, end, span_text, span_text_lower) if spec_parser else (None, None)
+        if spec is None:
+            continue
+        identified_part_canonical, identified_spec_str = spec
 
         if identified_part_canonical and identified_spec_str:
             parsed_specs_set.add(f"{identified_part_canonical}: {identified_spec_str}")
@@ -3154,31 +4272,30 @@ def extract_build_part_specifications(text):
     return ', '.join(sorted(list(parsed_specs_set))) if parsed_specs_set else ''
 
 
-def filter_companies(company_list, text):
+def filter_companies(company_list, text, doc=None):
     if not company_list:
         return []
-    doc = nlp(text) 
+    if doc is None:
+        doc = parse(text)
     filtered = set()
-    designators = ['co\\.', 'inc\\.', 'ltd\\.', 'gmbh', 'llc', 'corp\\.', 'plc', 'group', 'solutions', 'energy', 'oil & gas', 'international', 'holdings', 'corporation', 'industries', 'ventures', 'resources', 'services', 'systems']
-    known_companies = ["Saudi Aramco", "Petronas", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor", "Chevron", "ConocoPhillips", "ENI", "Sinopec", "CNPC", "Gazprom", "Baker Hughes", "Schlumberger", "Halliburton", "TechnipFMC", "Subsea 7", "Saipem", "McDermott", "Wood", "Worley"]
 
     for company_name_str in company_list: 
         company_name = str(company_name_str).strip() 
         found = False
-        for kc in known_companies:
+        for kc in KNOWN_COMPANIES:
             if kc.lower() in company_name.lower() or company_name.lower() in kc.lower():
                 filtered.add(kc)
                 found = True
                 break
         if found: continue
 
-        if any(re.search(r'\b' + d + r'\b', company_name.lower()) for d in designators):
+        if COMPANY_DESIGNATOR_REGEX.search(company_name.lower()):
             filtered.add(company_name)
             continue
         
         for ent in doc.ents:
             if ent.label_ == 'ORG' and company_name in ent.text and len(ent.text.split()) > len(company_name.split()):
-                if any(re.search(r'\b' + d + r'\b', ent.text.lower()) for d in designators) or ent.text in known_companies:
+                if COMPANY_DESIGNATOR_REGEX.search(ent.text.lower()) or ent.text in KNOWN_COMPANIES:
                     filtered.add(ent.text)
                     found = True
                     break
@@ -3187,8 +4304,7 @@ def filter_companies(company_list, text):
         if len(company_name.split()) == 1:
             if company_name.lower() in ["technology", "industrial", "energy", "company", "group", "systems", "solutions"]:
                 continue
-            if re.search(r'\b' + re.escape(company_name) + r'\s+(?:' + '|'.join(designators) + r')\b', text, re.IGNORECASE) or \
-               re.search(r'\b(?:' + '|'.join(designators) + r')\s+' + re.escape(company_name) + r'\b', text, re.IGNORECASE) or \
+            if designator_context_regex(company_name).search(text) or \
                company_name in ["Aramco", "Shell", "BP", "ExxonMobil", "TotalEnergies", "Equinor"]: 
                 filtered.add(company_name)
                 continue
@@ -3199,11 +4315,11 @@ def filter_companies(company_list, text):
 def extract_entities_by_label_refined(text, labels):
     text = clean_text(text)
     if not text: return ''
-    doc = nlp(text)
+    doc = parse(text)
     entities = [ent.text.strip() for ent in doc.ents if ent.label_ in labels]
     
     if 'ORG' in labels:
-        entities = filter_companies(entities, text) 
+        entities = filter_companies(entities, text, doc) 
         
     return ', '.join(sorted(set(entities)))
 
@@ -3212,17 +4328,17 @@ def extract_scope_keywords(text):
     if not text: return ''
     text_lower = text.lower()
     found_keywords = set()
-    for kw in ALL_BUILD_KEYWORDS:
-        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', text_lower):
-            found_keywords.add(kw)
-        elif len(kw.split()) > 1 and kw.lower() in text_lower:
-            found_keywords.add(kw)
+    # Only keywords present as substrings can match, so the whole-word regex runs just for those.
+    for kw_lower in find_keywords(SCOPE_KEYWORD_SCANNER, text_lower):
+        for kw, is_phrase in SCOPE_KEYWORDS_BY_LOWER[kw_lower]:
+            if is_phrase or SCOPE_KEYWORD_REGEXES[kw_lower].search(text_lower):
+                found_keywords.add(kw)
     return ', '.join(sorted(found_keywords))
 
 def extract_delays_dates(text):
     text = clean_text(text)
     if not text: return ''
-    doc = nlp(text)
+    doc = parse(text)
     delay_keywords = ['delay', 'postpone', 'push back', 'reschedule', 'deadline', 'extension', 'setback', 'deferment']
     mentions_delay = any(kw in text.lower() for kw in delay_keywords)
     if mentions_delay:
@@ -3238,7 +4354,7 @@ def extract_delays_dates(text):
 def extract_budget(text):
     text = clean_text(text)
     if not text: return ''
-    doc = nlp(text)
+    doc = parse(text)
     money_entities = [ent.text for ent in doc.ents if ent.label_ == 'MONEY']
     money_patterns = re.findall(
         r'\b(?:USD|EUR|GBP|A?\$|€|£)\s?\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)?\b|\b\d+(?:\.\d+)?\s*(?:billion|million|bn|mn)\s*(?:USD|EUR|GBP|A?\$|€|£)?\b',
@@ -3252,11 +4368,8 @@ def extract_quotes(text):
     if not text: return ''
     return ' | '.join(re.findall(r'"(.*?)"', text))
 
-def extract_project_status(text):
-    text = clean_text(text).lower()
-    if not text: return ''
-    doc = nlp(text)
-    found_statuses = set()
+def build_status_matcher():
+    """Returns a Matcher labelling project-status phrases (AWARDED_STATUS, DELAYED_STATUS, ...) in lowercased text."""
     matcher = Matcher(nlp.vocab)
 
     decommissioning_patterns = [
@@ -3358,24 +4471,25 @@ def extract_project_status(text):
     ]
     matcher.add("FID_STATUS", fid_patterns)
 
-    matches = matcher(doc)
-    for match_id, start, end in matches:
-        string_id = nlp.vocab.strings[match_id]
-        status_map = {
-            "AWARDED_STATUS": 'awarded', "TENDERED_STATUS": 'tendered',
-            "PLANNED_STATUS": 'planned', "UNDER_CONSTRUCTION_STATUS": 'under construction',
-            "COMPLETED_STATUS": 'completed', "DELAYED_STATUS": 'delayed',
-            "CANCELLED_STATUS": 'cancelled', "FID_STATUS": 'FID',
-            "DECOMMISSIONING_STATUS": 'decommissioning' 
-        }
-        if string_id in status_map:
-            found_statuses.add(status_map[string_id])
+    return matcher
 
-    priority_order = ['cancelled', 'decommissioning', 'completed', 'delayed', 'FID', 'awarded', 'under construction', 'tendered', 'planned']
-    for status in priority_order:
-        if status in found_statuses:
-            return status
-    return ''
+# Built once at import and shared by every extract_project_status() call
+STATUS_MATCHER = build_status_matcher()
+STATUS_NAMES = {
+    "AWARDED_STATUS": 'awarded', "TENDERED_STATUS": 'tendered',
+    "PLANNED_STATUS": 'planned', "UNDER_CONSTRUCTION_STATUS": 'under construction',
+    "COMPLETED_STATUS": 'completed', "DELAYED_STATUS": 'delayed',
+    "CANCELLED_STATUS": 'cancelled', "FID_STATUS": 'FID',
+    "DECOMMISSIONING_STATUS": 'decommissioning'
+}
+STATUS_PRIORITY = ['cancelled', 'decommissioning', 'completed', 'delayed', 'FID', 'awarded', 'under construction', 'tendered', 'planned']
+
+def extract_project_status(text):
+    text = clean_text(text).lower()
+    if not text: return ''
+    doc = parse(text, disable=STATUS_DISABLED_PIPES)
+    found_statuses = {STATUS_NAMES[nlp.vocab.strings[match_id]] for match_id, _, _ in STATUS_MATCHER(doc)}
+    return next((status for status in STATUS_PRIORITY if status in found_statuses), '')
 
 def find_capacity_subject(capacity_span, doc):
     """
@@ -3428,22 +4542,14 @@ def find_capacity_subject(capacity_span, doc):
             
     return None
 
-def extract_production_capacity_refined(text):
-    """
-    Extracts all mentions of production, storage, or throughput capacity and intelligently
-    links them to the corresponding entity (field, platform, pipeline, etc.).
-    """
-    text = clean_text(text)
-    if not text: return ''
-    doc = nlp(text)
-    extracted_capacities = set()
-
+def build_capacity_matcher():
+    """Returns a Matcher for production, storage and throughput capacities ("100,000 bpd", "2.5 million tonnes per annum")."""
     # Expanded and more specific regex for units
     CAPACITY_UNITS_REGEX = r"bpd|boe/d|boepd|mmscfd|scfd|tpd|mcfd|bbl/d|bcfd|mboed|tcf/d|mcm/d|gj/d|tonnes/year|t/y|t/d|barrels of oil equivalent per day|cubic feet per day|m3/d|tonne/day|barrels per day|cubic meters per day|tonnes per day"
     CAPACITY_NOUNS_REGEX = r"barrels|cubic|feet|meters|tonnes|bbl|cf|m3|boe"
     TIME_UNITS_REGEX = r"day|d|hour|hr|h|year|yr|y|annum"
 
-    capacity_matcher = Matcher(nlp.vocab)
+    matcher = Matcher(nlp.vocab)
     
     # Pattern 1: Standard units like 100,000 bpd
     pattern1 = [
@@ -3467,8 +4573,23 @@ def extract_production_capacity_refined(text):
         {"LOWER": {"REGEX": TIME_UNITS_REGEX}, "OP": "?"},
     ]
     
-    capacity_matcher.add("PRODUCTION_CAPACITY", [pattern1, pattern2, pattern3])
-    matches = capacity_matcher(doc)    
+    matcher.add("PRODUCTION_CAPACITY", [pattern1, pattern2, pattern3])
+
+    return matcher
+
+# Built once at import and shared by every extract_production_capacity_refined() call
+CAPACITY_MATCHER = build_capacity_matcher()
+
+def extract_production_capacity_refined(text):
+    """
+    Extracts all mentions of production, storage, or throughput capacity and intelligently
+    links them to the corresponding entity (field, platform, pipeline, etc.).
+    """
+    text = clean_text(text)
+    if not text: return ''
+    doc = parse(text)
+    extracted_capacities = set()
+    matches = CAPACITY_MATCHER(doc)
 
     # Filter out overlapping matches, preferring the longest one
     spans = [doc[start:end] for _, start, end in matches]
@@ -3496,59 +4617,61 @@ def extract_production_capacity_refined(text):
             
     return ', '.join(sorted(list(extracted_capacities)))
 
-def extract_contract_types(text):
-    text = clean_text(text)
-    if not text: return ''
-    contract_keywords_list = [ 
-        'EPC', 'EPCI', 'EPCC', 'FEED', 'LSTK', 'MOU', 'joint venture', 'framework agreement', 'EPMC', 'EPC-E', 'EPC-E/E',
-        'service agreement', 'subcontract', 'supply agreement', 'alliance agreement',
-        'lease agreement', 'charter agreement', 'drilling contract', 'construction contract',
-        'maintenance contract', 'operation and maintenance', 'O&M', 'engineering contract',
-        'procurement contract', 'turnkey contract', 'build-own-operate-transfer', 'BOOT',
-        'production sharing agreement', 'PSA', 'rig contract', 'vessel contract', 'consultancy contract'
-    ]
-    doc = nlp(text)
-    found_contract_types = set()
+def build_contract_matcher():
+    """Returns a Matcher for contract-type phrases ("EPCI contract", "contract for the FEED", "awarded a lump-sum deal")."""
     matcher = Matcher(nlp.vocab)
 
-    pattern1 = [
-        {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}},
+    contract_pattern1 = [
+        {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}},
         {"LEMMA": {"IN": ["contract", "agreement", "deal", "accord", "pact", "charter", "lease", "terms"]}}
     ]
-    matcher.add("CONTRACT_TYPE_PHRASE_1", [pattern1])
+    matcher.add("CONTRACT_TYPE_PHRASE_1", [contract_pattern1])
 
-    pattern2 = [
+    contract_pattern2 = [
         {"LEMMA": {"IN": ["contract", "agreement"]}},
         {"LOWER": {"IN": ["for", "to"]}, "OP": "?"},
         {"LOWER": {"IN": ["the", "provide"]}, "OP": "?"},
         {"LOWER": "of", "OP": "?"},
-        {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}}
+        {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}}
     ]
-    matcher.add("CONTRACT_TYPE_PHRASE_2", [pattern2])
-    
-    pattern3 = [
+    matcher.add("CONTRACT_TYPE_PHRASE_2", [contract_pattern2])
+
+    contract_pattern3 = [
         {"LEMMA": {"IN": ["award", "sign", "secure", "win", "enter", "finalize", "negotiate", "issue", "grant", "land"]}},
         {"LOWER": {"IN": ["a", "an", "the"]}, "OP": "?"},
-        {"LOWER": {"IN": [k.lower() for k in contract_keywords_list]}},
+        {"LOWER": {"IN": [k.lower() for k in CONTRACT_KEYWORDS]}},
         {"LEMMA": {"IN": ["contract", "agreement", "deal"]}, "OP": "?"} 
     ]
-    matcher.add("VERB_CONTRACT_TYPE", [pattern3])
+    matcher.add("VERB_CONTRACT_TYPE", [contract_pattern3])
+
+    return matcher
+
+# Built once at import and shared by every extract_contract_types() call
+CONTRACT_MATCHER = build_contract_matcher()
 
-    matches = matcher(doc)
+def extract_contract_types(text):
+    text = clean_text(text)
+    if not text: return ''
+    doc = parse(text)
+    found_contract_types = set()
+    matches = CONTRACT_MATCHER(doc)
     for match_id, start, end in matches:
         span = doc[start:end]
         span_text_lower = span.text.lower()
+        # One scan of the span picks the keywords present; only those get the precompiled word-boundary check
+        span_keywords = find_keywords(CONTRACT_KEYWORD_SCANNER, span_text_lower)
         best_found_kw = ""
-        for canonical_kw in contract_keywords_list:
-            if re.search(r'\b' + re.escape(canonical_kw.lower()) + r'\b', span_text_lower):
-                if len(canonical_kw) > len(best_found_kw):
-                    best_found_kw = canonical_kw
+        for kw_lower, (canonical_kw, kw_regex) in CONTRACT_KEYWORD_REGEXES.items():
+            if kw_lower in span_keywords and len(canonical_kw) > len(best_found_kw) and kw_regex.search(span_text_lower):
+                best_found_kw = canonical_kw
         if best_found_kw:
             found_contract_types.add(best_found_kw)
 
     if not found_contract_types:
-        for ct in contract_keywords_list:
-            if re.search(r'\b' + re.escape(ct) + r'\b', text, re.IGNORECASE):
+        # Only keywords that occur somewhere in the text need the word-boundary check
+        for kw_lower in find_keywords(CONTRACT_KEYWORD_SCANNER, text.lower()):
+            ct, ct_regex = CONTRACT_KEYWORD_REGEXES[kw_lower]
+            if ct_regex.search(text):
                 found_contract_types.add(ct)
 
     return ', '.join(sorted(list(found_contract_types)))
@@ -3563,25 +4686,39 @@ def summarize_text_textrank(text, num_sentences=3, diversity_lambda=0.6):
     if not text:
         return ''
 
-    doc = nlp(text)
-    # Filter out sentences that are too short or don't have a vector representation.
-    sentences = [sent for sent in doc.sents if len(sent.text.strip()) > 5 and sent.vector_norm]
+    doc = parse(text)
+    views = ensure_precomputed(doc)
+    # Sentences that are too short or don't have a vector representation are already filtered out.
+    sentences = views["sents_v"]
 
     # --- Fallback 1: If text is too short or no valid sentences are found, return the beginning of the text.
     if not sentences or len(sentences) <= num_sentences:
-        original_sents = list(doc.sents)
+        original_sents = views["sents"]
         return ' '.join([s.text.replace('\n', ' ').strip() for s in original_sents[:num_sentences]])
 
-    sentence_vectors = np.array([sent.vector for sent in sentences])
-    similarity_matrix = cosine_similarity(sentence_vectors)
+    # Cosine similarity as one product of L2-normalised float32 vectors (every kept sentence has a non-zero vector_norm).
+    # Kept in float32 rather than int8: NumPy has no int8 GEMM, so quantised vectors would go through its much slower integer matmul.
+    sentence_vectors = np.array([sent.vector for sent in sentences], dtype=np.float32)
+    sentence_vectors /= np.linalg.norm(sentence_vectors, axis=1, keepdims=True)
+    similarity_matrix = sentence_vectors @ sentence_vectors.T
 
     # --- Heuristic Scoring for initial weights ---
     initial_scores = np.ones(len(sentences))
-    status_keywords = ['award', 'complete', 'delay', 'cancel', 'fid', 'tender', 'plan', 'construct', 'decommission', 'sign', 'secure']
+    # Walk doc.ents once and assign each entity to the kept sentence containing it,
+    # instead of re-scanning the entity list for every sentence via sent.ents
+    important_labels = {'ORG', 'PRODUCT', 'FAC', 'GPE', 'MONEY'}
+    sentence_starts = [sent.start for sent in sentences]
+    entity_sentences = set()
+    for ent in doc.ents:
+        if ent.label_ in important_labels:
+            i = bisect_right(sentence_starts, ent.start) - 1
+            if i >= 0 and ent.end <= sentences[i].end:
+                entity_sentences.add(i)
     for i, sent in enumerate(sentences):
-        if any(ent.label_ in ['ORG', 'PRODUCT', 'FAC', 'GPE', 'MONEY'] for ent in sent.ents):
+        if i in entity_sentences:
             initial_scores[i] += 0.3 # Boost for important entities
-        if any(keyword in sent.text.lower() for keyword in status_keywords):
+        sent_text_lower = sent.text.lower()
+        if TEXTRANK_STATUS_REGEX.search(sent_text_lower):
             initial_scores[i] += 0.4 # Higher boost for status keywords
         if i == 0: # Boost the first sentence
             initial_scores[i] += 0.5
@@ -3590,14 +4727,16 @@ def summarize_text_textrank(text, num_sentences=3, diversity_lambda=0.6):
     scores = np.copy(initial_scores)
     damping_factor = 0.85
     try:
+        # Row-normalise once (dividing by the full row sum as before) and drop self-links,
+        # so each iteration is a single matrix-vector product instead of a Python double loop.
+        row_sums = similarity_matrix.sum(axis=1)
+        row_sums[row_sums == 0] = 1
+        transition_matrix = similarity_matrix / row_sums[:, None]
+        np.fill_diagonal(transition_matrix, 0)
+        transition_matrix = transition_matrix.T
         for _ in range(100):
-            prev_scores = np.copy(scores)
-            for i in range(len(sentences)):
-                rank_sum = sum(
-                    (similarity_matrix[j][i] * prev_scores[j]) / (np.sum(similarity_matrix[j]) or 1)
-                    for j in range(len(sentences)) if i != j
-                )
-                scores[i] = (1 - damping_factor) * initial_scores[i] + damping_factor * rank_sum
+            prev_scores = scores
+            scores = (1 - damping_factor) * initial_scores + damping_factor * (transition_matrix @ prev_scores)
             if np.sum(np.abs(scores - prev_scores)) < 1e-5:
                 break
     except (ValueError, IndexError):
@@ -3607,23 +4746,21 @@ def summarize_text_textrank(text, num_sentences=3, diversity_lambda=0.6):
     # --- MMR for diverse sentence selection ---
     selected_indices = []
     try:
-        candidate_indices = list(range(len(sentences)))
+        candidate_mask = np.ones(len(sentences), dtype=bool)
         best_start_idx = np.argmax(scores)
         selected_indices.append(best_start_idx)
-        candidate_indices.remove(best_start_idx)
-
-        while len(selected_indices) < num_sentences and candidate_indices:
-            mmr_scores = []
-            for i in candidate_indices:
-                relevance_score = scores[i]
-                redundancy_score = max(similarity_matrix[i][j] for j in selected_indices)
-                mmr = diversity_lambda * relevance_score - (1 - diversity_lambda) * redundancy_score
-                mmr_scores.append((mmr, i))
-            
-            if not mmr_scores: break
-            best_next_idx = max(mmr_scores)[1]
+        candidate_mask[best_start_idx] = False
+        # Running max similarity of every sentence to the selected set, updated once per pick
+        max_similarity = similarity_matrix[:, best_start_idx].copy()
+
+        while len(selected_indices) < num_sentences and candidate_mask.any():
+            mmr_scores = diversity_lambda * scores - (1 - diversity_lambda) * max_similarity
+            mmr_scores[~candidate_mask] = -np.inf
+            # argmax over the reversed array so ties still go to the later sentence, as max() over (mmr, i) did
+            best_next_idx = len(mmr_scores) - 1 - np.argmax(mmr_scores[::-1])
             selected_indices.append(best_next_idx)
-            candidate_indices.remove(best_next_idx)
+            candidate_mask[best_next_idx] = False
+            max_similarity = np.maximum(max_similarity, similarity_matrix[:, best_next_idx])
     except (ValueError, IndexError):
         selected_indices = [] # Reset on error to trigger fallback
 
@@ -3638,50 +4775,30 @@ def summarize_text_textrank(text, num_sentences=3, diversity_lambda=0.6):
     
     # --- Fallback 3: Final sanity check to ensure output is never empty if text exists.
     if not summary_sentences:
-        original_sents = list(doc.sents)
+        original_sents = views["sents"]
         return ' '.join([s.text.replace('\n', ' ').strip() for s in original_sents[:num_sentences]])
 
     return ' '.join(summary_sentences)
 
 def classify_offshore_onshore(text):
     text = clean_text(text).lower()
-    offshore_keywords = {
-        'offshore': 3, 'subsea': 3, 'fpso': 4, 'flng': 4, 'fsru': 4, 'floating': 2,
-        'deepwater': 2, 'mooring': 2, 'riser': 2, 'jack-up': 3, 'drillship': 3,
-        'spar': 3, 'tlp': 3, 'platform': 2, 'jacket': 2, 'hull': 1, 'caisson': 1,
-        'umbilical': 2, 'flowline': 2, 'topside': 2, 'topsides': 2, 'wellhead': 1,
-        'manifold': 1, 'christmas tree': 1, 'surf': 3, 'gbs': 2, 'sea bed': 2,
-        'marine': 2, 'vessel': 1, 'installation vessel': 3, 'anchor handling tug': 2,
-        'hook-up': 2, 'commissioning (offshore)': 3, 'offshore removal': 3, 'semisubmersible': 3,
-        'drilling rig': 2
-    }
-    onshore_keywords = {
-        'onshore': 3, 'land-based': 3, 'refinery': 4, 'petrochemical': 4,
-        'gas plant': 3, 'pipeline terminal': 2, 'compressor station': 2,
-        'gas treatment': 2, 'processing plant': 3, 'storage tank': 1,
-        'industrial complex': 2, 'onshore disposal': 3, 'midstream': 1, 'downstream': 1,
-        'lng terminal': 3, 'storage facility': 2, 'gas processing plant': 3
-    }
-    offshore_score = sum(score for kw, score in offshore_keywords.items() if kw in text)
-    onshore_score = sum(score for kw, score in onshore_keywords.items() if kw in text)
-
-    for keyword in BUILD_PARTS.union(BUILD_PROCESS_OPTIONS):
-        kw_lower = keyword.lower()
-        if kw_lower in text:
-            if "subsea" in kw_lower or "offshore" in kw_lower or kw_lower in ['fpso', 'flng', 'fsru', 'tlp', 'spar', 'jacket', 'hull']:
-                offshore_score += 1.5
-            elif "topsides" in kw_lower: offshore_score += 0.5 
-            elif "pipeline" in kw_lower:
-                if 'subsea pipeline' in text: offshore_score += 1.5
-                elif 'onshore pipeline' in text: onshore_score += 1.5
-            elif "offshore removal" in kw_lower: offshore_score += 2
-            elif "onshore disposal" in kw_lower: onshore_score += 2
-            elif "installation" in kw_lower:
-                if 'subsea installation' in text or 'offshore installation' in text: offshore_score += 1.5
-                elif 'onshore installation' in text: onshore_score += 1.5
-            elif "decommissioning" in kw_lower:
-                if 'offshore decommissioning' in text: offshore_score += 1.5
-                elif 'onshore decommissioning' in text: onshore_score += 1.5 
+    # A strong offshore keyword with nothing that could add to the onshore score always classifies as Offshore
+    if any(kw in text for kw in STRONG_OFFSHORE_KEYWORDS) and not any(kw in text for kw in ONSHORE_SIGNAL_KEYWORDS):
+        return 'Offshore'
+    # One scan of the text finds every offshore, onshore and build keyword it contains
+    found_keywords = find_keywords(OFFSHORE_ONSHORE_SCANNER, text)
+    offshore_score = sum(OFFSHORE_KEYWORD_SCORES[kw] for kw in found_keywords if kw in OFFSHORE_KEYWORD_SCORES)
+    onshore_score = sum(ONSHORE_KEYWORD_SCORES[kw] for kw in found_keywords if kw in ONSHORE_KEYWORD_SCORES)
+
+    # Build keywords only need per-kind counts; the rules themselves are precomputed tables
+    kind_counts = Counter(kind for kw_lower, kind in BUILD_KEYWORD_KINDS if kw_lower in found_keywords)
+    for kind, (offshore_weight, onshore_weight) in BUILD_KIND_WEIGHTS.items():
+        offshore_score += offshore_weight * kind_counts[kind]
+        onshore_score += onshore_weight * kind_counts[kind]
+    for kind, offshore_phrases, onshore_phrase in BUILD_CONTEXT_RULES:
+        if kind_counts[kind]:
+            if any(phrase in found_keywords for phrase in offshore_phrases): offshore_score += 1.5 * kind_counts[kind]
+            elif onshore_phrase in found_keywords: onshore_score += 1.5 * kind_counts[kind]
 
     if len(text.split()) < 20 and offshore_score > 0 and onshore_score > 0:
         if offshore_score == onshore_score: return 'Unclear'
@@ -3786,15 +4903,8 @@ def generate_ai_opinion(row, _): # Keep signature for compatibility
     # Scope
     if scope_details:
         scope_list = [s.strip().lower() for s in scope_details.split(',')]
-        scope_groups = {
-            'full-field development (EPCI)': ['epc', 'epci', 'epcc'],
-            'SURF package': ['surf', 'pipelines', 'flowlines', 'riser', 'umbilical'],
-            'subsea production systems': ['subsea systems', 'tree', 'manifold', 'wellhead'],
-            'floating facilities': ['fpso', 'flng', 'fsru', 'tlp', 'spar'],
-            'fixed structures': ['jacket', 'hull', 'topside', 'topsides'],
-            'decommissioning activities': ['decommissioning']
-        }
-        found_groups = [group_name for group_name, keywords in scope_groups.items() if any(kw in scope_list for kw in keywords)]
+        scope_set = set(scope_list)
+        found_groups = [group_name for group_name, keywords in SCOPE_GROUPS.items() if not keywords.isdisjoint(scope_set)]
         
         if found_groups:
             scope_summary = " and ".join(found_groups)
@@ -3824,11 +4934,11 @@ def generate_ai_opinion(row, _): # Keep signature for compatibility
     final_opinion = " ".join(opinion_parts)
 
     # 6. Final Polish and Truncation
-    final_opinion = re.sub(r'\s+', ' ', final_opinion).strip() # Normalize whitespace
+    final_opinion = WHITESPACE_REGEX.sub(' ', final_opinion).strip() # Normalize whitespace
     
     # Truncate if too long, but try to keep full sentences
     if len(final_opinion) > 250:
-        doc = nlp(final_opinion)
+        doc = sentence_splitter(final_opinion)
         sents = list(doc.sents)
         truncated_opinion = ""
         for sent in sents:
@@ -3846,12 +4956,8 @@ def generate_ai_opinion(row, _): # Keep signature for compatibility
 
     return final_opinion
 
-def extract_packages_phases_refined(text):
-    text = clean_text(text)
-    if not text:
-        return ''
-    doc = nlp(text)
-    found_items = set()
+def build_package_matcher():
+    """Returns a Matcher for package and phase names ("Phase 2", "Package B", "subsea package", "Phase II")."""
     matcher = Matcher(nlp.vocab)
 
     pattern_standard = [
@@ -3871,7 +4977,7 @@ def extract_packages_phases_refined(text):
 
     pattern_package_letter = [{"LOWER": "package"}, {"IS_UPPER": True, "LENGTH": 1}]
     matcher.add("PACKAGE_LETTER", [pattern_package_letter])
-    
+
     pattern_descriptive_package = [
         {"LOWER": {"IN": ["work", "contract", "subsea", "topsides", "drilling", "pipeline"]}}, 
         {"LOWER": "package"},
@@ -3883,7 +4989,18 @@ def extract_packages_phases_refined(text):
     pattern_phase_roman = [{"LOWER": "phase"}, {"TEXT": {"REGEX": r"^[IVXLCDM]+$"}, "OP": "+"}]
     matcher.add("PHASE_ROMAN", [pattern_phase_roman])
 
-    matches = matcher(doc)
+    return matcher
+
+# Built once at import and shared by every extract_packages_phases_refined() call
+PACKAGE_MATCHER = build_package_matcher()
+
+def extract_packages_phases_refined(text):
+    text = clean_text(text)
+    if not text:
+        return ''
+    doc = parse(text)
+    found_items = set()
+    matches = PACKAGE_MATCHER(doc)
     for match_id, start, end in matches:
         span = doc[start:end]
         if 3 < len(span.text) <= 30 and len(span.text.split()) <= 4 :
@@ -3903,6 +5020,16 @@ def extract_packages_phases_refined(text):
     final_items = {item for item in found_items if item.lower() not in ["phase", "package", "epci"] or len(item.split()) > 1}
     return ', '.join(sorted(list(final_items)))
 
+def apply_extractor(texts, func):
+    """
+    Runs an extractor over a Series of cleaned texts and returns its results as a Series on the same index.
+    func runs once per distinct text, so `df[col] = apply_extractor(df['Cleaned Text'], func)` is preferred over
+    a per-row apply. The texts are expected to have been parsed up front with parse_batch, as main does.
+    """
+    unique_texts = texts.drop_duplicates()
+    results = dict(zip(unique_texts, unique_texts.progress_apply(func)))
+    return texts.map(results)
+
 # --- Main Processing ---
 def main():
     # Initialize tqdm for pandas
@@ -3949,6 +5076,12 @@ def main():
     # Create the cleaned text column first, which will be used by all other functions
     df['Cleaned Text'] = df[news_col_name].apply(clean_text)
 
+    # Parse every article once up front; the extractors below pick their Docs up from the cache
+    print("Parsing articles...")
+    cleaned_texts = df['Cleaned Text'].unique().tolist()
+    parse_batch(cleaned_texts)
+    parse_batch([text.lower() for text in cleaned_texts], disable=STATUS_DISABLED_PIPES) # extract_project_status works on lowercased text
+
     # Define the extraction pipeline for clarity and easier management
     extraction_pipeline = {
         'Field/Project Names': extract_project_profiles,
@@ -3968,18 +5101,21 @@ def main():
         'Summary': lambda x: summarize_text_textrank(x, num_sentences=3)
     }
 
-    # Apply each function to the 'Cleaned Text' column with a progress bar
+    # Apply each function once per distinct article (scrapes often repeat stories) and map the results back onto every row
     for col_name, func in extraction_pipeline.items():
-        df[col_name] = df['Cleaned Text'].progress_apply(func)
+        df[col_name] = apply_extractor(df['Cleaned Text'], func)
+    _doc_cache.clear() # Every extractor has run; free the parsed Docs before building opinions and writing the output
 
     # Generate AI Opinion based on the newly created columns
-    df['AI Opinion'] = df.progress_apply(lambda row: generate_ai_opinion(row, row['Cleaned Text']), axis=1)
+    # Plain dicts of the extracted columns are much cheaper to build than a row Series per article
+    opinion_records = df[list(extraction_pipeline)].to_dict('records')
+    df['AI Opinion'] = [generate_ai_opinion(record, text) for record, text in zip(tqdm(opinion_records, desc="Generating AI opinions"), df['Cleaned Text'])]
 
     # Drop the intermediate 'Cleaned Text' column before saving to the final output
     df.drop(columns=['Cleaned Text'], inplace=True)
     
     try:
-        df.to_excel(OUTPUT_PATH, index=False)
+        df.to_excel(OUTPUT_PATH, index=False, engine="xlsxwriter" if xlsxwriter else None)
         print(f"✅ File saved to: {OUTPUT_PATH}")
     except FileNotFoundError:
         print(f"Error: The specified output path '{OUTPUT_PATH}' does not exist.")